@@ -4,25 +4,51 @@ The primary application script for Alien Invaders
 This is the module with the application code.  Make sure that this module is
 in a folder with the following files:
 
-    app.py      (the primary controller class)
-    level.py    (the subcontroller for a single game level)
-    models.py   (the model classes)
-    consts.py   (the application constants)
+    app.py        (the primary controller class)
+    session.py    (the game states, with no graphics)
+    wave.py       (the subcontroller for a single game level)
+    hud.py        (the score, level, lives and sound labels, and the messages)
+    simulation.py (the rules of a single game level, with no graphics)
+    formation.py  (the alien formation)
+    bolts.py      (the laser bolts)
+    replay.py     (the replay recorder and player)
+    snapshot.py   (the helpers to save and restore the game state)
+    difficulty.py (the difficulty settings)
+    atlas.py      (the texture atlas builder)
+    raster.py     (the PNG reader and writer, and the software rasterizer)
+    models.py     (the model classes)
+    consts.py     (the application constants)
 
 In addition, you should have the following subfolders
 
-    Fonts         (fonts to use for GLabel)
+    Fonts         (fonts to use for GLabel, GText and GBitmapText)
     Sounds        (sound effects for the game)
     Images        (image files to use in the game)
 
 Moving any of these folders or files will prevent the game from working properly
 
+To save a replay of the game when the window closes, or to watch a saved replay, run
+
+    python invaders --record game.rpl
+    python invaders --play game.rpl
+
+To play against a swarm of thousands of aliens, scaled down to fit the window, run
+
+    python invaders 40 100 --swarm
+
 Author: Walker M. White (wmw2)
 Date:   November 1, 2017 (Python 3 Version)
 """
 from consts import *
 from app import *
+import sys
 
 # Application code
 if __name__ == '__main__':
-    Invaders(width=GAME_WIDTH,height=GAME_HEIGHT).run()
+    game=Invaders(width=GAME_WIDTH,height=GAME_HEIGHT,tickrate=TICK_RATE,
+                 retained=True)
+    if len(sys.argv) == 3 and sys.argv[1] == '--record':
+        game.setReplay(recordFile=sys.argv[2])
+    elif len(sys.argv) == 3 and sys.argv[1] == '--play':
+        game.setReplay(playback=loadReplay(sys.argv[2]))
+    game.run()
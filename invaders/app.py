@@ -13,11 +13,14 @@ Date: December 3, 2017
 import cornell
 from consts import *
 from game2d import *
+from session import *
+from replay import *
 from wave import *
+from hud import *
 
 
-# PRIMARY RULE: Invaders can only access attributes in wave.py via getters/setters
-# Invaders is NOT allowed to access anything in models.py
+# PRIMARY RULE: Invaders can only access attributes in wave.py and session.py via 
+# getters/setters. Invaders is NOT allowed to access anything in models.py
 
 class Invaders(GameApp):
     """
@@ -42,56 +45,73 @@ class Invaders(GameApp):
     its own update and draw method.
     
     The primary purpose of this class is to manage the game state: which is when the 
-    game started, paused, completed, etc. It keeps track of that in an attribute
-    called _state.
+    game started, paused, completed, etc.  The state machine itself lives in the class 
+    GameSession (see session.py), which does not need Kivy, so that the same game can 
+    run with no window.  This class reads the keyboard into the session once every 
+    tick, and then shows the session: the wave, the messages and the sounds.
+    
+    The game runs at a fixed TICK_RATE ticks per second, no matter the frame rate.  The
+    method update is called once per tick, and draw once per frame.  When a frame falls
+    between two ticks, the moving objects are drawn in between their positions at those
+    ticks (see the attribute alpha of GameApp).  The view is retained (see the attribute
+    retained of GameApp): an object drawn in the last frame is not added to the window
+    again, so a pause screen that does not change costs nothing to draw.
+    
+    Every game is started from a Replay (see replay.py), which gives its seed and 
+    difficulty settings.  Call setReplay before run to stream the keys to a replay 
+    file as the game is played, or to play back a replay instead of reading the 
+    keyboard.  The keys read from the keyboard are not kept in memory.
     
     INSTANCE ATTRIBUTES:
         view:   the game view, used in drawing (see examples from class)
                 [instance of GView; it is inherited from GameApp]
         input:  the user input, used to control the ship and change state
                 [instance of GInput; it is inherited from GameApp]
-        _state: the current state of the game represented as a value from consts.py
-                [one of STATE_INACTIVE, STATE_NEWWAVE, STATE_ACTIVE, STATE_PAUSED, STATE_CONTINUE, STATE_COMPLETE]
-        _wave:  the subcontroller for a single wave, which manages the ships and aliens
+        _session: the headless game session holding the state, score and level
+                [GameSession]
+        _replay: the replay played back, or the seed and settings of this game 
+                with no keys [Replay]
+        _player: the player feeding the keys of _replay to _session
+                [ReplayPlayer, or None if the keys come from the keyboard]
+        _writer: the writer streaming the game to _recordFile
+                [ReplayWriter, or None if the game is not saved]
+        _wave:  the subcontroller that shows the current wave of _session
                 [Wave, or None if there is no wave currently active]
-        _text:  the currently active message 
-                [GLabel, or None if there is no message to display]
+        _hud:   the score, level, lives and sound labels, and the message of the
+                current state [Hud]
 
     
     STATE SPECIFIC INVARIANTS: 
-        Attribute _wave is only None if _state is STATE_INACTIVE.
-        Attribute _text is only None if _state is STATE_ACTIVE.
+        Attribute _wave is only None if the state of _session is STATE_INACTIVE.
     
     For a complete description of how the states work, see the specification for the
     method update.
     
-    You may have more attributes if you wish (you might want an attribute to store
-    any score across multiple waves). If you add new attributes, they need to be 
-    documented here.
-    
     LIST MORE ATTRIBUTES (AND THEIR INVARIANTS) HERE IF NECESSARY
-    _textLives: message on active screen displaying how many lives player has
-                [GLabel, or None if there is no message to display]
-    _originalScore: Initial score at the start of the current wave
-        (zero if first wave, higher if player has accomplished more than one wave)
-                [int>=0]
-    _score: Total score obtained by player (increases as more aliens get hit)
-                [int>=0]
-    _textScore: message on active screen displaying score player has
-                [GLabel, or None if there is no message to display]
-    _level: the level the player is on (how much waves the player has completed)
-                [int>=0]
-    _textLevel: message on active screen displaying level player is on
-                [GLabel]
-    _sound: True if player has enabled sound effects/music, False otherwise
-                [bool]
-    _soundIs: string representation of sound ('off' if _sound is False, 'on' if True)
-                [str]
-    _soundtime: amount of seconds elapsed since user last changed sound settings
-                [number (int or float) >=0]
-    _textSound: message on active screen displaying whether sound is on or not
-                [GLabel]
+    _playback:  the replay to play back, set by setReplay [Replay or None]
+    _recordFile: the file to save the replay to, set by setReplay [str or None]
     """
+    # Replay settings, changed by setReplay before the game runs
+    _playback=None
+    _recordFile=None
+    
+    
+    # GETTERS AND SETTERS
+    
+    def setReplay(self, playback=None, recordFile=None):
+        """
+        Sets up the replay of the game.  Call this before run.
+        
+        Parameter playback: the replay to play back instead of reading the keyboard, 
+        at real-time speed (None to play with the keyboard)
+        Precondition: playback is a Replay or None
+        
+        Parameter recordFile: the file to stream the replay to while the game is 
+        played (None to not save it)
+        Precondition: recordFile is a string or None
+        """
+        self._playback=playback
+        self._recordFile=recordFile
     
     
     # THREE MAIN GAMEAPP METHODS
@@ -105,21 +125,36 @@ class Invaders(GameApp):
         You should use it to initialize any game specific attributes.
         
         This method should make sure that all of the attributes satisfy the given 
-        invariants. When done, it sets the _state to STATE_INACTIVE and create a message 
-        (in attribute _text) saying that the user should press to play a game.
+        invariants. When done, the session is in STATE_INACTIVE and there is a message 
+        (in attribute _hud) saying that the user should press to play a game.
+        
+        The images are drawn from the texture atlas shipped in the Images folder.  It
+        is only read here; run atlas.py to pack it again after changing an image.
+        
+        The session is seeded with GAME_SEED (see consts.py).  Setting it to a number
+        makes every game play out the same for the same keys.  When playing back a
+        replay, the seed and difficulty settings of the replay are used instead.
         """
-        self._state=STATE_INACTIVE
-        self._originalScore=0
-        self._score=0
-        self._level=0
-        self._sound=False
-        self._soundIs='OFF'
-        self._soundtime=0
+        self.load_atlas(ATLAS_MANIFEST)
+        if self._playback is None:
+            self._replay=Replay(GAME_SEED)
+            self._player=None
+        else:
+            self._replay=self._playback
+            self._player=ReplayPlayer(self._playback)
+        self._writer=None
+        if self._recordFile is not None and self._player is None:
+            self._writer=ReplayWriter(self._recordFile,self._replay.getSeed(),
+                                      difficulty=self._replay.getDifficulty())
+        self._session=self._replay.newSession()
+        self._wave=None
+        self._hud=Hud()
+        self._updateText()
         
         
     def update(self,dt):
         """
-        Animates a single frame in the game.
+        Animates a single tick in the game.
         
         It is the method that does most of the work. It is NOT in charge of playing the
         game.  That is the purpose of the class Wave. The primary purpose of this
@@ -157,34 +192,32 @@ class Invaders(GameApp):
         
         STATE_COMPLETE: The wave is over, and is either won or lost.
         
-        You are allowed to add more states if you wish. Should you do so, you should 
-        describe them here.
+        STATE_PLAYER_PAUSED: The player paused the game by pressing P.  Pressing S
+        continues the game (through STATE_CONTINUE).
         
-        Parameter dt: The time in seconds since last update
+        The states themselves are run by the GameSession.  This method passes it the
+        keys held down (or the keys of the replay being played back), then updates the subcontroller and the messages to match.
+        
+        Parameter dt: The time in seconds since last update (always TICK_SECONDS)
         Precondition: dt is a number (int or float)
         """
-        self._updateSound(dt)
+        if self._wave is not None:
+            self._wave.saveLastState()
         
-        if self._state==STATE_INACTIVE:
-            self._updateInactive()
-            
-        if self._state==STATE_NEWWAVE:
-            self._updateNewWave()
-         
-        if self._state==STATE_ACTIVE:
-            self._updateActive(dt)
-            
-        if self._state==STATE_PLAYER_PAUSED:
-            self._updatePlayerPaused()
-            
-        if self._state==STATE_PAUSED:
-            self._updatePaused()
-        
-        if self._state==STATE_CONTINUE:
-            self._updateContinue()
-        
-        if self._state==STATE_COMPLETE:
-            self._updateComplete()
+        if self._player is None:
+            keys=self._readKeys()
+            if self._writer is not None:
+                self._writer.record(keys,self._session)
+        else:
+            keys=self._player.nextKeys()
+        self._session.tick(keys)
+        
+        wave=self._session.getWave()
+        if wave is not None and (self._wave is None or not self._wave.isShowing(wave)):
+            self._wave=Wave(wave)
+        if self._wave is not None:
+            self._wave.playEvents(self._session.isSoundOn())
+        self._updateText()
                
         
     def draw(self):
@@ -199,179 +232,78 @@ class Invaders(GameApp):
         or you need to add a draw method to class Wave.  We suggest the latter.  See 
         the example subcontroller.py from class.
         """
-        if self._state==STATE_NEWWAVE:
+        state=self._session.getState()
+        if state==STATE_NEWWAVE:
             self._wave.drawAlienWave(self.view)
             self._wave.drawShip(self.view)
             self._wave.drawLine(self.view)
         
-        elif self._state==STATE_ACTIVE:
+        elif state==STATE_ACTIVE:
             self._wave.drawAlienWave(self.view)
             self._wave.drawLine(self.view)
-            self._wave.drawBolts(self.view)
-            self._wave.drawShip(self.view)
-            self._textScore.draw(self.view)
-            self._textLives.draw(self.view)
-            self._textLevel.draw(self.view)
-            self._textSound.draw(self.view)
+            self._wave.drawBolts(self.view,self.alpha)
+            self._wave.drawShip(self.view,self.alpha)
+            self._hud.drawStats(self.view)
             
         else:
-            self._text.draw(self.view)
+            self._hud.drawMessage(self.view)
             
             
-    # HELPER METHODS FOR THE STATES GO HERE
-    
-    def _updateSound(self, dt):
+    def on_stop(self):
         """
-        Helper method to adjust user's sound preferences
+        Finishes the replay file if a file was given to setReplay.
         
-        Changes value of bool _sound each time user
-        presses key 'X'. Maximum number of times sound
-        settings can be changed is once 10 times dt
-        (to prevent mistakes from continually holding down 'X')
-        
-        Parameter dt: The time in seconds since last update
-        Precondition: dt is a number (int or float)
+        This is a Kivy event, called when the window closes.
         """
-        if self._soundtime>TIME_SOUND_SWITCH:
-            if self.input.is_key_down('x'):
-                self._soundtime=0
-                if self._sound:
-                    self._sound=False
-                    self._soundIs='OFF'
-                else:
-                    self._sound=True
-                    self._soundIs='ON'
-        else:
-            self._soundtime+=dt
+        if self._writer is not None:
+            self._writer.close()
     
     
-    def _updateInactive(self):
+    # HELPER METHODS FOR THE STATES GO HERE
+    
+    def _readKeys(self):
         """
-        Helper method for the inactive state's
-        protocol for update
+        Returns: the keys currently held down, as a bitwise or of KEY constants
         """
-        self._text=GLabel(text=STR_VAL_START,font_size=40,
-                          font_name='Arcade',x=400,y=400)
-        if self.input.is_key_down('s'):
-                self._state=STATE_NEWWAVE
+        keys=0
+        for bit in range(len(KEY_NAMES)):
+            if self.input.is_key_down(KEY_NAMES[bit]):
+                keys|=1<<bit
+        return keys
     
-         
-    def _updateNewWave(self):
-        """
-        Helper method for the new wave state's
-        protocol for update
-        """    
-        self._wave=Wave()
-        self._level+=1
-        self._originalScore=self._score
-        self._state=STATE_ACTIVE
     
-        
-    def _updateActive(self, dt):
+    def _updateText(self):
         """
-        Helper method for the active state's
-        protocol for update
+        Helper method that sets the messages for the current state
+        of the session
+        
+        The labels of the Hud are kept, and only show new text when it changes.
         """
+        state=self._session.getState()
+        if state==STATE_INACTIVE:
+            self._hud.setMessage(STR_VAL_START)
         
-        self._wave.moveShip(self.input)
-        self._wave.moveAliens(self._level, dt, self._sound)
-        self._wave.moveBolts(self.input, self._sound)
-        self._wave.checkAlienCollisions(self._sound)      
+        elif state==STATE_ACTIVE:
+            self._hud.setStats(self._session.getScore(),self._session.getLevel(),
+                               self._wave.getLives(),self._session.isSoundOn())
         
-        self._textScore=GLabel(text='Score: '
-                +repr(self._score),font_size=30,
-                font_name='Arcade',x=LABEL_DX_APART,
-                y=GAME_HEIGHT-ALIEN_CEILING/2)
-
-        self._textLevel=GLabel(text='Level: '
-                +repr(self._level),font_size=30,
-                font_name='Arcade',x=GAME_WIDTH/2-LABEL_DX_APART,
-                y=GAME_HEIGHT-ALIEN_CEILING/2)
-        
-        self._textLives=GLabel(text='Lives: '
-                +repr(self._wave.getLives()),font_size=30,
-                font_name='Arcade',x=GAME_WIDTH/2+LABEL_DX_APART,
-                y=GAME_HEIGHT- ALIEN_CEILING/2)        
-        
-        self._textSound=GLabel(text='Sound: '+self._soundIs,
-                font_size=30,font_name='Arcade',x=GAME_WIDTH-LABEL_DX_APART,
-                y=GAME_HEIGHT-ALIEN_CEILING/2)
-        self._score=self._originalScore+self._wave.getScore()            
-        self._transitionActive()
-    
-    
-    def _transitionActive(self):
-        """
-        Helper method that lists all the posible transitions
-        from the active state in the form of if statements      
-        and the different states to switch to         
-        """
-        if self.input.is_key_down('p'):
-                self._state=STATE_PLAYER_PAUSED
-                
-        elif self._wave.noMoreAliens():
-            self._state=STATE_COMPLETE
-                    
-        elif self._wave.isShipCollision(self._sound) and self._wave.getLives()>0: 
-            self._state=STATE_PAUSED
-        
-        elif self._wave.getLives()==0:
-            self._state=STATE_COMPLETE
-                    
-        elif self._wave.crossedDefenseLine(self._sound):
-            self._state=STATE_COMPLETE
-               
-            
-    def _updatePaused(self):
-        """
-        Helper method for the paused (resulting from lost life) state's
-        protocol for update
-        """
-        self._text=GLabel(text=STR_VAL_PAUSED,
-                    font_size=40,font_name='Arcade',x=400,y=400)
-            
-        self._wave.clearBolts()
-        if self.input.is_key_down('s'):
-                self._state=STATE_CONTINUE
-    
-    
-    def _updatePlayerPaused(self):
-        """
-        Helper method for the player-induced paused state's
-        protocol for update
-        """
-        self._text=GLabel(text=STR_VAL_PLAYER_PAUSED, font_size=40,
-                    font_name='Arcade',x=400,y=400)
+        elif state==STATE_PAUSED:
+            self._hud.setMessage(STR_VAL_PAUSED)
         
-        if self.input.is_key_down('s'):
-                self._state=STATE_CONTINUE
-           
-            
-    def _updateContinue(self):
-        """
-        Helper method for the continue state's
-        protocol for update
-        """
-        self._wave.setNewShip()
-        self._state=STATE_ACTIVE
+        elif state==STATE_PLAYER_PAUSED:
+            self._hud.setMessage(STR_VAL_PLAYER_PAUSED)
+        
+        elif state==STATE_COMPLETE:
+            self._updateCompleteText()
     
     
-    def _updateComplete(self):
+    def _updateCompleteText(self):
         """
-        Helper method for the completed state's
-        protocol for update
+        Helper method that sets the message for the completed state
         """
-        
-        if self._wave.noMoreAliens():
-            self._text=GLabel(text='Level '+repr(self._level)+' completed'
-                    +'\n\nPress S to advance to next level',font_size=40,
-                          font_name='Arcade',x=400,y=400)
-            if self.input.is_key_down('s'):
-                self._state=STATE_NEWWAVE
-                    
-        elif self._wave.getLives()==0 or self._wave.crossedDefenseLine(self._sound):
-            self._text=GLabel(text='You lost the game '
-                              +'\n\nTotal score: '+repr(self._score),
-                              font_size=50,font_name='Arcade',x=400,y=400)
-                    
-    
\ No newline at end of file
+        if self._session.isWaveWon():
+            self._hud.setMessage('Level '+repr(self._session.getLevel())+' completed'
+                    +'\n\nPress S to advance to next level')
+        else:
+            self._hud.setMessage('You lost the game '
+                    +'\n\nTotal score: '+repr(self._session.getScore()),50)
@@ -0,0 +1,152 @@
+"""
+Texture atlas module for Alien Invaders
+
+This module packs the images in the Images folder into one image, the atlas, along
+with a JSON manifest of where each image is.  The game only reads the atlas, so it
+must be packed again after an image changes.  Running this module as a script
+rebuilds the atlas if any image changed (or always, with --force):
+
+    python atlas.py [--force]
+
+Author: agent (agent@local)
+Date: October 18, 2026
+"""
+from consts import *
+from raster import *
+import numpy as np
+import json
+import zlib
+import os
+
+# The folder with the game images
+_IMAGE_FOLDER=os.path.join(os.path.dirname(os.path.abspath(__file__)),'Images')
+
+
+def packImages(images, padding=ATLAS_PADDING):
+    """
+    Returns: the tuple (atlas, regions) after packing images into one image
+
+    The atlas is a uint8 array (height, width, 4) of RGBA, transparent where there
+    is no image, and regions is a dict with the [x, y, width, height] of each image
+    in the atlas, from its top left corner.
+
+    Parameter images: the images to pack, by name
+    Precondition: images is a nonempty dict of uint8 arrays (height, width, 4)
+
+    Parameter padding: the number of transparent pixels around each image
+    Precondition: padding is an int >= 0
+    """
+    names=sorted(images,key=lambda name: (-images[name].shape[0],name))
+    area=sum((image.shape[0]+2*padding)*(image.shape[1]+2*padding)
+             for image in images.values())
+    widest=max(image.shape[1] for image in images.values())+2*padding
+    width=_powerOfTwo(max(widest,int(np.ceil(np.sqrt(area)))))
+
+    regions={}
+    x=0
+    y=0
+    shelf=0
+    for name in names:
+        h,w=images[name].shape[:2]
+        if x+w+2*padding>width:
+            x=0
+            y+=shelf
+            shelf=0
+        regions[name]=[x+padding,y+padding,w,h]
+        x+=w+2*padding
+        shelf=max(shelf,h+2*padding)
+
+    atlas=np.zeros((_powerOfTwo(y+shelf),width,4),dtype=np.uint8)
+    for name in names:
+        left,top,w,h=regions[name]
+        atlas[top:top+h,left:left+w]=images[name]
+    return (atlas,regions)
+
+
+def buildAtlas(folder=_IMAGE_FOLDER):
+    """
+    Returns: the manifest of the atlas, after packing the images in folder and
+    saving the atlas and its manifest there
+
+    The manifest is a dict with the file name of the atlas ('image'), its [width,
+    height] ('size'), the [x, y, width, height] of each image in it from the top left
+    corner ('regions'), and the [size, CRC-32] of each image file ('sources').
+
+    Parameter folder: the folder with the images
+    Precondition: folder is a string naming a writable folder of 8-bit PNG files
+    """
+    names=_listImages(folder)
+    images={name:readPNG(os.path.join(folder,name)) for name in names}
+    atlas,regions=packImages(images)
+    writePNG(os.path.join(folder,ATLAS_IMAGE),atlas)
+    manifest={'image':ATLAS_IMAGE,'size':[atlas.shape[1],atlas.shape[0]],
+              'regions':regions,'sources':_fingerprint(folder,names)}
+    with open(os.path.join(folder,ATLAS_MANIFEST),'w') as file:
+        json.dump(manifest,file,indent=1,sort_keys=True)
+    return manifest
+
+
+def updateAtlas(folder=_IMAGE_FOLDER):
+    """
+    Returns: the manifest of the atlas of the images in folder, after building it
+    again only if the saved one is missing or out of date
+
+    Parameter folder: the folder with the images
+    Precondition: folder is a string naming a writable folder of 8-bit PNG files
+    """
+    try:
+        with open(os.path.join(folder,ATLAS_MANIFEST)) as file:
+            manifest=json.load(file)
+        if (os.path.exists(os.path.join(folder,manifest['image'])) and
+            manifest['sources']==_fingerprint(folder,_listImages(folder))):
+            return manifest
+    except (OSError,ValueError,KeyError):
+        pass
+    return buildAtlas(folder)
+
+
+def _listImages(folder):
+    """
+    Returns: the sorted list of PNG files in folder, other than the atlas
+
+    Parameter folder: the folder with the images
+    Precondition: folder is a string naming a folder
+    """
+    return sorted(name for name in os.listdir(folder)
+                  if name.lower().endswith('.png') and name!=ATLAS_IMAGE)
+
+
+def _fingerprint(folder, names):
+    """
+    Returns: a dict with the [size, CRC-32] of each file, by name
+
+    Parameter folder: the folder with the files
+    Precondition: folder is a string naming a folder
+
+    Parameter names: the files to fingerprint
+    Precondition: names is a list of names of files in folder
+    """
+    sources={}
+    for name in names:
+        with open(os.path.join(folder,name),'rb') as file:
+            data=file.read()
+        sources[name]=[len(data),zlib.crc32(data)]
+    return sources
+
+
+def _powerOfTwo(n):
+    """
+    Returns: the smallest power of two >= n
+
+    Parameter n: the number to round up
+    Precondition: n is an int > 0
+    """
+    return 1<<(n-1).bit_length()
+
+
+# Script code
+if __name__ == '__main__':
+    import sys
+    manifest=buildAtlas() if '--force' in sys.argv[1:] else updateAtlas()
+    print('%s: %dx%d, %d images' % (manifest['image'],manifest['size'][0],
+                                    manifest['size'][1],len(manifest['regions'])))
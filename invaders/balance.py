@@ -0,0 +1,240 @@
+"""
+Difficulty balancing module for Alien Invaders
+
+This module estimates how hard the game is for a grid of difficulty settings, by
+letting a scripted bot play many seeded games at every point of the grid.  The games
+give a level curve and a survival curve for each point, written as CSV.  Games that
+are cut off at the tick limit are counted as censored, not as lost.  Running this
+module as a script sweeps a small default grid:
+
+    python balance.py [games per point] > balance.csv
+
+Author: agent (agent@local)
+Date: October 18, 2026
+"""
+from consts import *
+from difficulty import *
+from bots import *
+import itertools
+import multiprocessing
+import numpy as np
+
+# The settings of a Difficulty, in the order of its initializer
+_SETTINGS=('rows','cols','speed','boltRate','levelSpeed','alienSpeed','scale')
+
+
+def makeGrid(**values):
+    """
+    Returns: the list of Difficulty for every combination of the given values
+
+    A setting that is not given keeps its default (from consts.py).  For example,
+    makeGrid(speed=[0.5,1.0], boltRate=[3,5,8]) has 6 points.
+
+    Parameter values: the values to try, by setting name
+    Precondition: every key is a parameter of the Difficulty initializer, and
+    every value is a nonempty list of valid values for it
+    """
+    for name in values:
+        assert name in _SETTINGS, '%s is not a difficulty setting' % repr(name)
+    names=[name for name in _SETTINGS if name in values]
+    grid=[]
+    for point in itertools.product(*[values[name] for name in names]):
+        grid.append(Difficulty(**dict(zip(names,point))))
+    return grid
+
+
+def survivalCurve(ticks, over, step):
+    """
+    Returns: the Kaplan-Meier estimate of the fraction of games that last over
+    (M+1)*step active ticks, as a float array with entry M for each step up to
+    just past the longest game
+
+    A game that was cut off before it was over only counts as lasting as long
+    as it was played.  The entries past the longest game are nan if that game
+    was cut off, as nothing is known about them.
+
+    Parameter ticks: the active ticks played in each game
+    Precondition: ticks is a nonempty int array
+
+    Parameter over: whether each game was played until it was lost
+    Precondition: over is a bool array (same shape as ticks)
+
+    Parameter step: the number of ticks between entries
+    Precondition: step is an int > 0
+    """
+    times=np.unique(ticks[over])
+    atRisk=(ticks[None,:]>=times[:,None]).sum(axis=1)
+    deaths=(ticks[over][None,:]==times[:,None]).sum(axis=1)
+    survival=np.cumprod(1-deaths/atRisk)
+    bounds=np.arange(1,ticks.max()//step+2)*step
+    last=np.searchsorted(times,bounds,side='right')-1
+    curve=np.where(last>=0,survival[np.maximum(last,0)] if len(times) else 1.0,1.0)
+    if not over[ticks==ticks.max()].all():
+        curve[bounds>ticks.max()]=np.nan
+    return curve
+
+
+class _ActiveTicks(object):
+    """
+    A player that counts the active ticks of the game played by another player.
+
+    playGame only asks the bot for keys while the session is active, so the
+    number of questions is the number of active ticks.
+
+    INSTANCE ATTRIBUTES:
+        _bot:   the player that picks the keys [a bot of BOTS]
+        _count: the number of active ticks so far [int >= 0]
+    """
+
+    def getCount(self):
+        """
+        Returns the number of active ticks so far
+        """
+        return self._count
+
+
+    def __init__(self, bot):
+        """
+        Initializer: creates a counter for a player
+
+        Parameter bot: the player that picks the keys
+        Precondition: bot is an object with a method chooseKeys(wave)
+        """
+        self._bot=bot
+        self._count=0
+
+
+    def chooseKeys(self, wave):
+        """
+        Returns: the keys the player holds down this tick, after counting the tick
+
+        Parameter wave: the wave being played
+        Precondition: wave is a WaveSim
+        """
+        self._count+=1
+        return self._bot.chooseKeys(wave)
+
+
+def _playPoint(job):
+    """
+    Returns: the tuple (levels, ticks, over) of the games of a job, each a
+    list with one entry per game
+
+    ticks counts only the ticks where the session was active, and over is
+    whether the game was lost (as opposed to cut off at maxTicks).  This is
+    the body of a balancing worker.
+
+    Parameter job: the tuple (difficulty, bot name, seeds, maxTicks)
+    Precondition: job is a job made by runBalance
+    """
+    difficulty,name,seeds,maxTicks=job
+    levels=[]
+    ticks=[]
+    over=[]
+    for seed in seeds:
+        bot=_ActiveTicks(BOTS[name](seed))
+        session=playGame(bot,seed,maxTicks,difficulty)
+        levels.append(session.getLevel())
+        ticks.append(bot.getCount())
+        over.append(session.getState()==STATE_COMPLETE and not session.isWaveWon())
+    return (levels,ticks,over)
+
+
+def runBalance(grid, games=100, bot='dodge', workers=None, seed=0, maxTicks=10**6):
+    """
+    Returns: a list with the results of each point of the grid, in order
+
+    The results of a point are a dict with the arrays 'level', 'ticks' and 'over'
+    (the level reached, the ticks played while the session was active and whether
+    the game was lost, for each game), 'levelCurve' (entry L is the fraction of
+    games that reached level L+1 or higher), 'survivalCurve' (entry M is the
+    fraction of games that last over M+1 minutes of play, from survivalCurve) and
+    'censored' (the fraction of games cut off at maxTicks).
+
+    Every point plays the same seeds, so the points differ only by their settings.
+
+    Parameter grid: the settings to try
+    Precondition: grid is a list of Difficulty
+
+    Parameter games: the number of games for each point
+    Precondition: games is an int > 0
+
+    Parameter bot: the name of the bot that plays
+    Precondition: bot is a key of BOTS
+
+    Parameter workers: the number of worker processes (one per core if None)
+    Precondition: workers is an int > 0 or None
+
+    Parameter seed: the seed of the first game (the games use seed..seed+games-1)
+    Precondition: seed is an int
+
+    Parameter maxTicks: the most ticks to play in each game
+    Precondition: maxTicks is an int > 0
+    """
+    workers=multiprocessing.cpu_count() if workers is None else workers
+    seeds=list(range(seed,seed+games))
+    size=max(1,games//(4*workers))
+    jobs=[]
+    owners=[]
+    for point in range(len(grid)):
+        for pos in range(0,games,size):
+            jobs.append((grid[point],bot,seeds[pos:pos+size],maxTicks))
+            owners.append(point)
+
+    levels=[[] for point in grid]
+    ticks=[[] for point in grid]
+    over=[[] for point in grid]
+    with multiprocessing.Pool(workers) as pool:
+        for point,result in zip(owners,pool.map(_playPoint,jobs)):
+            levels[point].extend(result[0])
+            ticks[point].extend(result[1])
+            over[point].extend(result[2])
+
+    results=[]
+    for point in range(len(grid)):
+        level=np.array(levels[point])
+        tick=np.array(ticks[point])
+        lost=np.array(over[point],dtype=bool)
+        steps=np.arange(1,level.max()+1)
+        results.append({'level':level,'ticks':tick,'over':lost,
+                        'levelCurve':(level[:,None]>=steps).mean(axis=0),
+                        'survivalCurve':survivalCurve(tick,lost,60*TICK_RATE),
+                        'censored':1-lost.mean()})
+    return results
+
+
+def writeCSV(file, grid, results):
+    """
+    Writes the curves of a balancing run as CSV
+
+    Each row has the settings of a point, the name of the curve ('level' or
+    'survival'), and the values of the curve.  A last row for each point, named
+    'censored', has the fraction of games cut off at the tick limit.
+
+    Parameter file: the file to write to
+    Precondition: file is a text file open for writing
+
+    Parameter grid: the settings that were tried
+    Precondition: grid is a list of Difficulty
+
+    Parameter results: the results of runBalance for grid
+    Precondition: results is a list of the same length as grid
+    """
+    file.write(','.join(_SETTINGS)+',curve,values\n')
+    for difficulty,result in zip(grid,results):
+        settings=','.join(str(value) for value in
+                          (difficulty.getRows(),difficulty.getCols(),difficulty.getSpeed(),
+                           difficulty.getBoltRate(),difficulty.getLevelSpeed(),
+                           difficulty.getAlienSpeed(),difficulty.getScale()))
+        for curve in ('level','survival'):
+            values=','.join('%.4f' % value for value in result[curve+'Curve'])
+            file.write('%s,%s,%s\n' % (settings,curve,values))
+        file.write('%s,censored,%.4f\n' % (settings,result['censored']))
+
+
+# Script code
+if __name__ == '__main__':
+    import sys
+    games=int(sys.argv[1]) if len(sys.argv)>1 else 50
+    grid=makeGrid(speed=[0.5,1.0],boltRate=[3,5],levelSpeed=[0.75,0.9])
+    writeCSV(sys.stdout,grid,runBalance(grid,games,maxTicks=60*60*TICK_RATE))
@@ -0,0 +1,298 @@
+"""
+Bolt pool module for Alien Invaders
+
+This module contains the laser bolts of a single wave, stored in a pool of
+preallocated NumPy arrays.  The live bolts are packed at the front of the arrays, and
+a bolt is removed by moving the last live bolt into its slot.
+
+Author: agent (agent@local)
+Date: October 18, 2026
+"""
+from consts import *
+from snapshot import *
+import numpy as np
+import struct
+
+# PRIMARY RULE: This module may only access consts.py and snapshot.py.  It must NEVER 
+# import game2d.
+
+# The snapshot header of a BoltPool: size, playerCount, alienCount
+_POOL_STATE=struct.Struct('<iii')
+
+
+class BoltPool(object):
+    """
+    A class representing the pool of laser bolts in a wave.
+
+    Slots 0.._size-1 hold the live bolts, in no particular order.  The order changes
+    when a bolt is removed, so a slot index only identifies a bolt until the next
+    removal.
+
+    INSTANCE ATTRIBUTES:
+        _x:        the x coordinates of the bolts [float array (capacity,)]
+        _y:        the y coordinates of the bolts [float array (capacity,)]
+        _velocity: the velocities of the bolts in the y direction
+                   [float array (capacity,)]
+        _player:   whether each bolt was fired by the player [bool array (capacity,)]
+        _size:     the number of live bolts [int in 0..capacity]
+        _playerCount: the number of live bolts fired by the player [int >= 0]
+        _alienCount:  the number of live bolts fired by aliens [int >= 0]
+        _outside:  scratch space for culling [bool array (capacity,)]
+    """
+
+    # GETTERS AND SETTERS
+
+    def getSize(self):
+        """
+        Returns the number of live bolts
+        """
+        return self._size
+
+
+    def getCapacity(self):
+        """
+        Returns the number of slots in the pool
+        """
+        return len(self._x)
+
+
+    def getXs(self):
+        """
+        Returns a view of the x coordinates of the live bolts
+
+        The array is owned by the pool and must not be modified.
+        """
+        return self._x[:self._size]
+
+
+    def getYs(self):
+        """
+        Returns a view of the y coordinates of the live bolts
+
+        The array is owned by the pool and must not be modified.
+        """
+        return self._y[:self._size]
+
+
+    def getVelocities(self):
+        """
+        Returns a view of the velocities of the live bolts
+
+        The array is owned by the pool and must not be modified.
+        """
+        return self._velocity[:self._size]
+
+
+    def getPlayerMask(self):
+        """
+        Returns a view of the owner flags of the live bolts (True for the player)
+
+        The array is owned by the pool and must not be modified.
+        """
+        return self._player[:self._size]
+
+
+    def getPlayerCount(self):
+        """
+        Returns the number of live bolts fired by the player
+        """
+        return self._playerCount
+
+
+    def getAlienCount(self):
+        """
+        Returns the number of live bolts fired by aliens
+        """
+        return self._alienCount
+
+
+    # INITIALIZER
+
+    def __init__(self, capacity=16):
+        """
+        Initializer: creates an empty pool
+
+        Parameter capacity: the number of slots to preallocate
+        Precondition: capacity is an int > 0
+        """
+        self._x=np.zeros(capacity)
+        self._y=np.zeros(capacity)
+        self._velocity=np.zeros(capacity)
+        self._player=np.zeros(capacity,dtype=bool)
+        self._outside=np.zeros(capacity,dtype=bool)
+        self._size=0
+        self._playerCount=0
+        self._alienCount=0
+
+
+    # PUBLIC METHODS
+
+    def fire(self, x, y, isPlayerBolt):
+        """
+        Adds a new bolt to the pool
+
+        Player bolts move up at BOLT_SPEED and alien bolts move down at BOLT_SPEED.
+        The pool doubles in size if it is full.
+
+        Parameter x: the starting x coordinate of the bolt
+        Precondition: x is an number within the range of GAME_WIDTH
+
+        Parameter y: the starting y coordinate of the bolt
+        Precondition: y is an number within the range of GAME_HEIGHT
+
+        Parameter isPlayerBolt: True if the bolt came from the ship,
+        False if it came from an alien
+        Precondition: isPlayerBolt is a bool
+        """
+        if self._size==len(self._x):
+            self._grow()
+
+        slot=self._size
+        self._x[slot]=x
+        self._y[slot]=y
+        self._player[slot]=isPlayerBolt
+        if isPlayerBolt:
+            self._velocity[slot]=BOLT_SPEED
+            self._playerCount+=1
+        else:
+            self._velocity[slot]=-BOLT_SPEED
+            self._alienCount+=1
+        self._size+=1
+
+
+    def remove(self, slot):
+        """
+        Removes the bolt in the given slot
+
+        The last live bolt is moved into the slot, so removing bolts while
+        walking the slots from the last one down to 0 is safe.
+
+        Parameter slot: the slot of the bolt to remove
+        Precondition: slot is an int in 0..getSize()-1
+        """
+        if self._player[slot]:
+            self._playerCount-=1
+        else:
+            self._alienCount-=1
+
+        last=self._size-1
+        if slot!=last:
+            self._x[slot]=self._x[last]
+            self._y[slot]=self._y[last]
+            self._velocity[slot]=self._velocity[last]
+            self._player[slot]=self._player[last]
+        self._size=last
+
+
+    def clear(self):
+        """
+        Removes every bolt from the pool (keeping its slots)
+        """
+        self._size=0
+        self._playerCount=0
+        self._alienCount=0
+
+
+    def move(self):
+        """
+        Moves every bolt by its velocity, and removes the bolts that
+        have left the window
+        """
+        n=self._size
+        if n==0:
+            return
+
+        y=self._y[:n]
+        y+=self._velocity[:n]
+        outside=self._outside[:n]
+        np.greater_equal(y,GAME_HEIGHT,out=outside)
+        outside|=y<=0
+        if outside.any():
+            for slot in np.flatnonzero(outside)[::-1]:
+                self.remove(int(slot))
+
+
+    def findHit(self, x, y, halfWidth, halfHeight, isPlayerBolt):
+        """
+        Returns: the slot of a bolt from the given owner overlapping the
+        given box, or -1 if there is none
+
+        Parameter x: the x coordinate of the box center
+        Precondition: x is a number
+
+        Parameter y: the y coordinate of the box center
+        Precondition: y is a number
+
+        Parameter halfWidth: half the width of the box
+        Precondition: halfWidth is a number >= 0
+
+        Parameter halfHeight: half the height of the box
+        Precondition: halfHeight is a number >= 0
+
+        Parameter isPlayerBolt: True to only check bolts fired by the player,
+        False to only check bolts fired by aliens
+        Precondition: isPlayerBolt is a bool
+        """
+        count=self._playerCount if isPlayerBolt else self._alienCount
+        if count==0:
+            return -1
+
+        n=self._size
+        hits=((self._player[:n]==isPlayerBolt) &
+              (np.abs(self._x[:n]-x)<halfWidth+BOLT_WIDTH/2) &
+              (np.abs(self._y[:n]-y)<halfHeight+BOLT_HEIGHT/2))
+        slot=int(np.argmax(hits))
+        return slot if hits[slot] else -1
+
+
+    # METHODS TO SAVE AND RESTORE THE POOL
+
+    def writeState(self, buf):
+        """
+        Appends the live bolts to the snapshot buf
+
+        Parameter buf: the snapshot being written
+        Precondition: buf is a bytearray
+        """
+        n=self._size
+        buf+=_POOL_STATE.pack(n,self._playerCount,self._alienCount)
+        for array in (self._x,self._y,self._velocity,self._player):
+            writeArray(buf,array[:n])
+
+
+    def readState(self, data, offset):
+        """
+        Returns: the offset just past the pool state, after replacing the
+        bolts in the pool with the ones in data starting at offset
+
+        The pool grows if it has fewer slots than saved bolts.
+
+        Parameter data: the snapshot
+        Precondition: data is a bytes-like object
+
+        Parameter offset: the position of the pool state in data
+        Precondition: offset is an int >= 0, the start of a state written by
+        writeState
+        """
+        n,self._playerCount,self._alienCount=_POOL_STATE.unpack_from(data,offset)
+        offset+=_POOL_STATE.size
+        while len(self._x)<n:
+            self._grow()
+        self._size=n
+        for array in (self._x,self._y,self._velocity,self._player):
+            offset=readArray(array[:n],data,offset)
+        return offset
+
+
+    # HELPER METHODS
+
+    def _grow(self):
+        """
+        Doubles the number of slots in the pool, keeping the live bolts
+        """
+        capacity=2*len(self._x)
+        for name in ('_x','_y','_velocity','_player','_outside'):
+            old=getattr(self,name)
+            new=np.zeros(capacity,dtype=old.dtype)
+            new[:len(old)]=old
+            setattr(self,name,new)
@@ -0,0 +1,247 @@
+"""
+Scripted players module for Alien Invaders
+
+This module contains simple computer players, which pick the keys to hold down every
+tick, and a tournament that plays many seeded games with each of them across every
+core.  Running this module as a script plays a tournament:
+
+    python bots.py [games per bot]
+
+Author: agent (agent@local)
+Date: October 18, 2026
+"""
+from consts import *
+from session import *
+import multiprocessing
+import numpy as np
+import random
+import time
+
+
+class RandomBot(object):
+    """
+    A player that holds down a random set of left, right and fire every tick.
+
+    INSTANCE ATTRIBUTES:
+        _rng: the source of the random choices [random.Random]
+    """
+
+    def __init__(self, seed=None):
+        """
+        Initializer: creates a random player
+
+        Parameter seed: the seed of the random choices
+        Precondition: seed is an int or None
+        """
+        self._rng=random.Random(seed)
+
+
+    def chooseKeys(self, wave):
+        """
+        Returns: the keys to hold down in this tick
+
+        Parameter wave: the wave being played
+        Precondition: wave is a WaveSim with a ship
+        """
+        return self._rng.getrandbits(3)
+
+
+class TrackBot(object):
+    """
+    A player that moves under the nearest column with live aliens and fires.
+
+    It has no attributes.
+    """
+
+    def __init__(self, seed=None):
+        """
+        Initializer: creates a tracking player
+
+        Parameter seed: ignored, as this player makes no random choices
+        Precondition: seed is an int or None
+        """
+        pass
+
+
+    def chooseKeys(self, wave):
+        """
+        Returns: the keys to hold down in this tick
+
+        Parameter wave: the wave being played
+        Precondition: wave is a WaveSim with a ship
+        """
+        return KEY_SPACEBAR|self._track(wave)
+
+
+    def _track(self, wave):
+        """
+        Returns: KEY_LEFT or KEY_RIGHT to move toward the nearest live column,
+        or 0 if the ship is already under it
+
+        Parameter wave: the wave being played
+        Precondition: wave is a WaveSim with a ship
+        """
+        formation=wave.getFormation()
+        if formation.isEmpty():
+            return 0
+        shipX=wave.getShip().getXPos()
+        colAlive=formation.getAlive().any(axis=0)
+        colX=formation.getXs()[0]
+        distance=np.where(colAlive,np.abs(colX-shipX),np.inf)
+        target=colX[np.argmin(distance)]
+        if target<shipX-SHIP_MOVEMENT/2:
+            return KEY_LEFT
+        if target>shipX+SHIP_MOVEMENT/2:
+            return KEY_RIGHT
+        return 0
+
+
+class DodgeBot(TrackBot):
+    """
+    A player that steps out of the way of alien bolts about to hit it, and
+    otherwise plays like a TrackBot.
+
+    INSTANCE ATTRIBUTES:
+        _lookahead: how many ticks ahead a bolt counts as incoming [int > 0]
+    """
+
+    def __init__(self, seed=None, lookahead=20):
+        """
+        Initializer: creates a dodging player
+
+        Parameter seed: ignored, as this player makes no random choices
+        Precondition: seed is an int or None
+
+        Parameter lookahead: how many ticks ahead a bolt counts as incoming
+        Precondition: lookahead is an int > 0
+        """
+        self._lookahead=lookahead
+
+
+    def chooseKeys(self, wave):
+        """
+        Returns: the keys to hold down in this tick
+
+        Parameter wave: the wave being played
+        Precondition: wave is a WaveSim with a ship
+        """
+        pool=wave.getBolts()
+        if pool.getAlienCount()>0:
+            shipX=wave.getShip().getXPos()
+            reach=SHIP_WIDTH/2+BOLT_WIDTH/2+SHIP_MOVEMENT
+            xs=pool.getXs()
+            ys=pool.getYs()
+            incoming=((~pool.getPlayerMask()) & (np.abs(xs-shipX)<reach) &
+                      (ys<SHIP_BOTTOM+SHIP_HEIGHT+BOLT_SPEED*self._lookahead))
+            if incoming.any():
+                boltX=xs[incoming].mean()
+                # move away from the bolt, unless the wall is in the way
+                if (boltX>shipX and shipX>SHIP_WIDTH) or shipX>GAME_WIDTH-SHIP_WIDTH:
+                    return KEY_SPACEBAR|KEY_LEFT
+                return KEY_SPACEBAR|KEY_RIGHT
+        return TrackBot.chooseKeys(self,wave)
+
+
+#: the bots by name, as used by runTournament (each is made with BOTS[name](seed))
+BOTS = {'random':RandomBot, 'track':TrackBot, 'dodge':DodgeBot}
+
+
+def playGame(bot, seed, maxTicks=10**6, difficulty=None):
+    """
+    Returns: the GameSession after playing a whole game with a bot
+
+    The game ends when all lives are lost, or after maxTicks ticks.
+
+    Parameter bot: the player
+    Precondition: bot is an object with a method chooseKeys(wave)
+
+    Parameter seed: the seed of the session
+    Precondition: seed is an int
+
+    Parameter maxTicks: the most ticks to play
+    Precondition: maxTicks is an int > 0
+
+    Parameter difficulty: the settings of the game (the ones in consts.py if None)
+    Precondition: difficulty is a Difficulty or None
+    """
+    session=GameSession(random.Random(seed),difficulty)
+    for tick in range(maxTicks):
+        state=session.getState()
+        if state==STATE_ACTIVE:
+            session.tick(bot.chooseKeys(session.getWave()))
+        elif state==STATE_COMPLETE and not session.isWaveWon():
+            break
+        else:
+            session.tick(KEY_S)
+    return session
+
+
+def _playGames(job):
+    """
+    Returns: the list of (score, level) of the games in a job
+
+    This is the body of a tournament worker.
+
+    Parameter job: the tuple (bot name, seeds, maxTicks)
+    Precondition: job is a job made by runTournament
+    """
+    name,seeds,maxTicks=job
+    results=[]
+    for seed in seeds:
+        session=playGame(BOTS[name](seed),seed,maxTicks)
+        results.append((session.getScore(),session.getLevel()))
+    return results
+
+
+def runTournament(names=None, games=1000, workers=None, seed=0, maxTicks=10**6):
+    """
+    Returns: a dict from bot name to its results, after every bot plays the
+    same seeded games across a process pool
+
+    The results of a bot are a dict with the arrays 'score' and 'level' (one
+    entry per game), and 'gamesPerSecond'.
+
+    Parameter names: the names of the bots to play (every bot in BOTS if None)
+    Precondition: names is a list of keys of BOTS, or None
+
+    Parameter games: the number of games for each bot
+    Precondition: games is an int > 0
+
+    Parameter workers: the number of worker processes (one per core if None)
+    Precondition: workers is an int > 0 or None
+
+    Parameter seed: the seed of the first game (the games use seed..seed+games-1)
+    Precondition: seed is an int
+
+    Parameter maxTicks: the most ticks to play in each game
+    Precondition: maxTicks is an int > 0
+    """
+    names=list(BOTS) if names is None else names
+    workers=multiprocessing.cpu_count() if workers is None else workers
+    seeds=list(range(seed,seed+games))
+    size=max(1,games//(4*workers))
+
+    results={}
+    with multiprocessing.Pool(workers) as pool:
+        for name in names:
+            jobs=[(name,seeds[pos:pos+size],maxTicks) for pos in range(0,games,size)]
+            start=time.perf_counter()
+            played=[game for chunk in pool.map(_playGames,jobs) for game in chunk]
+            elapsed=time.perf_counter()-start
+            results[name]={'score':np.array([game[0] for game in played]),
+                           'level':np.array([game[1] for game in played]),
+                           'gamesPerSecond':games/elapsed}
+    return results
+
+
+# Script code
+if __name__ == '__main__':
+    import sys
+    games=int(sys.argv[1]) if len(sys.argv)>1 else 200
+    results=runTournament(games=games)
+    print('%-8s %10s %10s %10s %10s' % ('bot','mean score','mean level','max level','games/s'))
+    for name in results:
+        result=results[name]
+        print('%-8s %10.1f %10.2f %10d %10.1f' %
+              (name,result['score'].mean(),result['level'].mean(),
+               result['level'].max(),result['gamesPerSecond']))
@@ -8,7 +8,6 @@ we separate the constants into their own module. This allows all modules to acce
 Author: Jane Zhang (jz393)
 Date: December 3, 2017
 """
-import cornell
 import sys
 
 ### WINDOW CONSTANTS (all coordinates are in pixels) ###
@@ -19,6 +18,16 @@ GAME_WIDTH  = 800
 GAME_HEIGHT = 700
 
 
+### TIMING CONSTANTS ###
+
+#: the number of simulation ticks per second (the movement constants below are per tick)
+TICK_RATE = 60
+#: the number of seconds in one simulation tick
+TICK_SECONDS = 1.0/TICK_RATE
+#: the seed for the game randomness (None to seed from the system, a new game every run)
+GAME_SEED = None
+
+
 ### SHIP CONSTANTS ###
 
 # the width of the ship
@@ -27,7 +36,7 @@ SHIP_WIDTH    = 44
 SHIP_HEIGHT   = 44
 # the distance of the (bottom of the) ship from the bottom of the screen
 SHIP_BOTTOM   = 32
-# The number of pixels to move the ship per update
+# The number of pixels to move the ship per tick
 SHIP_MOVEMENT = 5
 # The number of lives a ship has
 SHIP_LIVES    = 5
@@ -60,6 +69,10 @@ ALIENS_IN_ROW  = 12
 ALIEN_IMAGES   = ('alien1.png','alien2.png','alien3.png')
 # the number of seconds (0 < float <= 1) between alien steps
 ALIEN_SPEED = 1
+# the width of the space a swarm formation is scaled down to fit in
+SWARM_WIDTH   = 600
+# the height of the space a swarm formation is scaled down to fit in
+SWARM_HEIGHT  = 250
 
 
 ### BOLT CONSTANTS ###
@@ -68,10 +81,22 @@ ALIEN_SPEED = 1
 BOLT_WIDTH  = 4
 # the height of a laser bolt
 BOLT_HEIGHT = 8
-# the number of pixels to move the bolt per update
+# the number of pixels to move the bolt per tick
 BOLT_SPEED  = 15
 # the number of ALIEN STEPS (not frames) between bolts
 BOLT_RATE   = 5
+# the color of a laser bolt (blue), as an RGBA tuple so no color name is parsed
+BOLT_COLOR  = (0.0,0.0,1.0,1.0)
+
+
+### ATLAS CONSTANTS ###
+
+# the image in the Images folder that all the other images are packed into
+ATLAS_IMAGE    = 'atlas.png'
+# the file in the Images folder listing the region of each image in ATLAS_IMAGE
+ATLAS_MANIFEST = 'atlas.json'
+# the number of transparent pixels around each image in the atlas
+ATLAS_PADDING  = 2
 
 
 ### GAME CONSTANTS ###
@@ -92,6 +117,40 @@ STATE_COMPLETE = 5
 STATE_PLAYER_PAUSED = 6
 
 
+### KEY CONSTANTS (bit flags for the keys the game reads each tick) ###
+
+# the left arrow key (move left)
+KEY_LEFT     = 1
+# the right arrow key (move right)
+KEY_RIGHT    = 2
+# the space bar (fire)
+KEY_SPACEBAR = 4
+# the P key (pause)
+KEY_P        = 8
+# the S key (start/continue)
+KEY_S        = 16
+# the X key (sound on/off)
+KEY_X        = 32
+# the GInput names of the keys above, in bit order
+KEY_NAMES    = ('left','right','spacebar','p','s','x')
+
+
+### EVENT CONSTANTS (bit flags raised by the headless simulation in simulation.py) ###
+
+# the player fired a bolt
+EVENT_PLAYER_FIRE  = 1
+# an alien fired a bolt
+EVENT_ALIEN_FIRE   = 2
+# a player bolt killed an alien
+EVENT_ALIEN_HIT    = 4
+# an alien bolt destroyed the ship
+EVENT_SHIP_HIT     = 8
+# the aliens reached the defense line
+EVENT_LINE_CROSSED = 16
+# the alien formation took a step
+EVENT_ALIEN_STEP   = 32
+
+
 
 ### USE COMMAND LINE ARGUMENTS TO CHANGE NUMBER OF ALIENS IN A ROW"""
 """
@@ -102,17 +161,27 @@ everything after the word python. So if you start the game typing
     
 Python puts ['breakout.py', '3', '4', '0.5'] into sys.argv. Below, we take advantage of 
 this fact to change the constants ALIEN_ROWS, ALIENS_IN_ROW, and ALIEN_SPEED.
+
+Adding --swarm anywhere in the arguments turns on swarm mode, which lifts the limits on
+the number of rows and aliens in a row, for example
+
+    python invaders 40 100 0.5 --swarm
+    
+A swarm is scaled down (by ALIEN_SCALE) to fit in SWARM_WIDTH by SWARM_HEIGHT.
 """
+#whether to allow formations of any size (for stress tests and the swarm variant)
+SWARM_MODE = '--swarm' in sys.argv
+
 try:
     rows = int(sys.argv[1])
-    if rows >= 1 and rows <= 10:
+    if rows >= 1 and (rows <= 10 or SWARM_MODE):
         ALIEN_ROWS = rows
 except:
     pass # Use original value
 
 try:
     perrow = int(sys.argv[2])
-    if perrow >= 1 and perrow <= 15:
+    if perrow >= 1 and (perrow <= 15 or SWARM_MODE):
         ALIENS_IN_ROW = perrow
 except:
     pass # Use original value
@@ -126,6 +195,13 @@ except:
 
 ### ADD MORE CONSTANTS (PROPERLY COMMENTED) AS NECESSARY ###
 
+#the factor the size, spacing and steps of the aliens are multiplied by
+#Invariant: 1.0 unless in swarm mode, where the formation must fit in the swarm space
+ALIEN_SCALE=1.0
+if SWARM_MODE:
+    ALIEN_SCALE=min(1.0,SWARM_WIDTH/((ALIENS_IN_ROW+1)*ALIEN_H_SEP),
+                    SWARM_HEIGHT/(ALIEN_ROWS*ALIEN_V_SEP))
+
 #starting x coordinate of ship
 SHIP_CENTER=GAME_WIDTH/2
 
@@ -162,3 +238,9 @@ TIME_SOUND_SWITCH=0.2
 #horizontal distance between text labels on active state screen
 LABEL_DX_APART=100
 
+#font of the text labels and messages
+LABEL_FONT='Arcade'
+
+#font size of the text labels on active state screen
+LABEL_FONT_SIZE=30
+
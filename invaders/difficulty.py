@@ -0,0 +1,149 @@
+"""
+Difficulty settings module for Alien Invaders
+
+This module contains the class Difficulty, the settings that make the game harder or
+easier.  Their defaults are the constants in consts.py, but a Difficulty can be made
+with any values.  The function swarmScale works out how much to scale down a
+formation too big for the window.
+
+Author: agent (agent@local)
+Date: October 18, 2026
+"""
+from consts import *
+
+# PRIMARY RULE: This module may only access consts.py.  It must NEVER import game2d.
+
+
+def swarmScale(rows, cols):
+    """
+    Returns: the alien scale that fits a formation of the given size in the
+    swarm space (SWARM_WIDTH by SWARM_HEIGHT), or 1.0 if it fits unscaled
+
+    This is the scale ALIEN_SCALE is set to in swarm mode.
+
+    Parameter rows: the number of rows of aliens
+    Precondition: rows is an int > 0
+
+    Parameter cols: the number of aliens in a row
+    Precondition: cols is an int > 0
+    """
+    return min(1.0,SWARM_WIDTH/((cols+1)*ALIEN_H_SEP),SWARM_HEIGHT/(rows*ALIEN_V_SEP))
+
+
+class Difficulty(object):
+    """
+    A class representing the difficulty settings of a game.
+
+    INSTANCE ATTRIBUTES:
+        _rows:       the number of rows of aliens [int > 0]
+        _cols:       the number of aliens in a row [int > 0]
+        _speed:      the number of seconds between alien steps on level 1
+                     [float > 0]
+        _boltRate:   the most alien steps between alien bolts [int > 0]
+        _levelSpeed: the factor the time between steps is multiplied by
+                     on each level [float > 0]
+        _alienSpeed: the factor the time between steps is multiplied by
+                     for each alien killed [float > 0]
+        _scale:      the factor the size, spacing and steps of the aliens are
+                     multiplied by [float in (0,1]]
+    """
+
+    # GETTERS AND SETTERS
+
+    def getRows(self):
+        """
+        Returns the number of rows of aliens
+        """
+        return self._rows
+
+
+    def getCols(self):
+        """
+        Returns the number of aliens in a row
+        """
+        return self._cols
+
+
+    def getSpeed(self):
+        """
+        Returns the number of seconds between alien steps on level 1
+        """
+        return self._speed
+
+
+    def getBoltRate(self):
+        """
+        Returns the most alien steps between alien bolts
+        """
+        return self._boltRate
+
+
+    def getLevelSpeed(self):
+        """
+        Returns the factor the time between steps is multiplied by on each level
+        """
+        return self._levelSpeed
+
+
+    def getAlienSpeed(self):
+        """
+        Returns the factor the time between steps is multiplied by for each alien killed
+        """
+        return self._alienSpeed
+
+
+    def getScale(self):
+        """
+        Returns the factor the size, spacing and steps of the aliens are multiplied by
+        """
+        return self._scale
+
+
+    # INITIALIZER
+
+    def __init__(self, rows=ALIEN_ROWS, cols=ALIENS_IN_ROW, speed=ALIEN_SPEED,
+                 boltRate=BOLT_RATE, levelSpeed=INCR_SPEED_LEVEL,
+                 alienSpeed=INCR_SPEED_ALIEN, scale=ALIEN_SCALE):
+        """
+        Initializer: creates a set of difficulty settings
+
+        Every setting defaults to its constant in consts.py.
+
+        Parameter rows: the number of rows of aliens (ALIEN_ROWS)
+        Precondition: rows is an int > 0
+
+        Parameter cols: the number of aliens in a row (ALIENS_IN_ROW)
+        Precondition: cols is an int > 0
+
+        Parameter speed: the seconds between alien steps on level 1 (ALIEN_SPEED)
+        Precondition: speed is a number > 0
+
+        Parameter boltRate: the most alien steps between alien bolts (BOLT_RATE)
+        Precondition: boltRate is an int > 0
+
+        Parameter levelSpeed: the speed factor for each level (INCR_SPEED_LEVEL)
+        Precondition: levelSpeed is a number > 0
+
+        Parameter alienSpeed: the speed factor for each alien killed (INCR_SPEED_ALIEN)
+        Precondition: alienSpeed is a number > 0
+
+        Parameter scale: the factor for the size of the aliens (ALIEN_SCALE)
+        Precondition: scale is a number in (0,1]
+        """
+        self._rows=rows
+        self._cols=cols
+        self._speed=speed
+        self._boltRate=boltRate
+        self._levelSpeed=levelSpeed
+        self._alienSpeed=alienSpeed
+        self._scale=scale
+
+
+    def __repr__(self):
+        """
+        Returns: an unambiguous string representation of these settings
+        """
+        return ('Difficulty(rows=%d, cols=%d, speed=%r, boltRate=%d, levelSpeed=%r, '
+                'alienSpeed=%r, scale=%r)' % (self._rows,self._cols,self._speed,
+                                              self._boltRate,self._levelSpeed,
+                                              self._alienSpeed,self._scale))
@@ -0,0 +1,171 @@
+"""
+Training environment module for Alien Invaders
+
+This module wraps a single wave in the reset/step interface of OpenAI Gym.  An action
+is a bitwise or of KEY_LEFT, KEY_RIGHT and KEY_SPACEBAR, and an observation is a
+float32 vector (see the class InvadersEnv for its layout).  The reward of a step is
+the score of the aliens killed in it.
+
+Author: agent (agent@local)
+Date: October 18, 2026
+"""
+from consts import *
+from difficulty import *
+from simulation import *
+import numpy as np
+import random
+
+#: the number of different actions (every combination of left, right and fire)
+ACTION_COUNT = (KEY_LEFT|KEY_RIGHT|KEY_SPACEBAR)+1
+
+
+class InvadersEnv(object):
+    """
+    A class representing one wave of Alien Invaders as a training environment.
+
+    An observation is laid out as
+
+        [ship x, formation offset x, formation offset y,
+         alive mask (rows*cols, 1 for alive),
+         bolt x (maxBolts), bolt y (maxBolts), bolt direction (maxBolts, 1 for the
+         player, -1 for aliens, 0 for an unused slot)]
+
+    INSTANCE ATTRIBUTES:
+        _level:    the level of every wave [int > 0]
+        _difficulty: the difficulty settings of every wave [Difficulty]
+        _frameSkip: the number of ticks each step repeats its action for [int > 0]
+        _maxBolts: the number of bolts in an observation [int > 0]
+        _wave:     the wave being played [WaveSim, or None before reset]
+        _actions:  the ticks of a step, refilled with the action of each step
+                   [list of _frameSkip ints]
+        _obs:      the observation buffer, refilled by every step
+                   [float32 array (observation size,)]
+        _done:     whether the wave is over [bool]
+    """
+
+    # GETTERS AND SETTERS
+
+    def getObservationSize(self):
+        """
+        Returns the length of an observation vector
+        """
+        return len(self._obs)
+
+
+    def getActionCount(self):
+        """
+        Returns the number of different actions
+        """
+        return ACTION_COUNT
+
+
+    def getWave(self):
+        """
+        Returns the wave being played (None before the first reset)
+        """
+        return self._wave
+
+
+    def getDifficulty(self):
+        """
+        Returns the difficulty settings of every wave
+        """
+        return self._difficulty
+
+
+    # INITIALIZER
+
+    def __init__(self, level=1, frameSkip=1, maxBolts=16, difficulty=None):
+        """
+        Initializer: creates an environment.  Call reset before step.
+
+        Parameter level: the level of every wave (the aliens are faster on later levels)
+        Precondition: level is an int > 0
+
+        Parameter frameSkip: the number of ticks each step repeats its action for
+        Precondition: frameSkip is an int > 0
+
+        Parameter maxBolts: the number of bolts in an observation (any others
+        on screen are left out)
+        Precondition: maxBolts is an int > 0
+
+        Parameter difficulty: the settings of every wave (the ones in consts.py if None)
+        Precondition: difficulty is a Difficulty or None
+        """
+        self._level=level
+        self._difficulty=Difficulty() if difficulty is None else difficulty
+        self._frameSkip=frameSkip
+        self._maxBolts=maxBolts
+        self._wave=None
+        self._actions=[0]*frameSkip
+        aliens=self._difficulty.getRows()*self._difficulty.getCols()
+        self._obs=np.zeros(3+aliens+3*maxBolts,dtype=np.float32)
+        self._done=True
+
+
+    # PUBLIC METHODS
+
+    def reset(self, seed=None):
+        """
+        Returns: the first observation of a new wave
+
+        Parameter seed: the seed of the wave (an unpredictable one if None)
+        Precondition: seed is an int or None
+        """
+        self._wave=WaveSim(random.Random(seed),self._difficulty)
+        self._done=False
+        return self._observe()
+
+
+    def step(self, action):
+        """
+        Returns: the tuple (observation, reward, done, info) after playing
+        the action for frameSkip ticks
+
+        The step ends early if the wave ends.  The dict info has the number
+        of 'kills' and 'deaths' in the step, the 'lives' left and the total
+        'score' of the wave.
+
+        Parameter action: the keys to hold down
+        Precondition: action is an int in 0..ACTION_COUNT-1, and the wave
+        is not over (reset was called since the last done)
+        """
+        assert not self._done, 'step called on a finished wave; call reset'
+        actions=self._actions
+        for pos in range(len(actions)):
+            actions[pos]=action
+
+        wave=self._wave
+        ticks,kills,deaths,reward,done=wave.runTicks(actions,self._level)
+        self._done=done
+        info={'kills':kills,'deaths':deaths,'lives':wave.getLives(),
+              'score':wave.getScore()}
+        return (self._observe(),float(reward),done,info)
+
+
+    # HELPER METHODS
+
+    def _observe(self):
+        """
+        Returns: a new observation vector for the current state of the wave
+        """
+        wave=self._wave
+        obs=self._obs
+        ship=wave.getShip()
+        formation=wave.getFormation()
+        alive=formation.getAlive()
+        obs[0]=SHIP_CENTER if ship is None else ship.getXPos()
+        obs[1:3]=formation.getOffset()
+
+        start=3
+        obs[start:start+alive.size]=alive.ravel()
+        start+=alive.size
+
+        pool=wave.getBolts()
+        n=min(pool.getSize(),self._maxBolts)
+        size=self._maxBolts
+        obs[start:start+3*size]=0
+        obs[start:start+n]=pool.getXs()[:n]
+        obs[start+size:start+size+n]=pool.getYs()[:n]
+        obs[start+2*size:start+2*size+n]=np.sign(pool.getVelocities()[:n])
+        return obs.copy()
@@ -0,0 +1,621 @@
+"""
+Formation module for Alien Invaders
+
+This module contains the alien formation of a single wave, stored as NumPy arrays
+with shape (rows, cols) on a regular lattice.  Marching only changes the offset of
+the lattice, and the counts, bounds and live columns of the formation are updated
+only when an alien dies.  The class MarchController decides the direction of the
+march.
+
+Author: agent (agent@local)
+Date: October 18, 2026
+"""
+from consts import *
+from snapshot import *
+import numpy as np
+import struct
+import math
+
+# PRIMARY RULE: This module may only access consts.py and snapshot.py.  It must NEVER 
+# import game2d.
+
+# The snapshot header of a Formation: rows, cols, offsetX, offsetY, count, leftCol,
+# rightCol, bottomRow, liveColCount
+_FORMATION_STATE=struct.Struct('<iiddiiiii')
+# The snapshot of a MarchController: heading, direction, pendingDown
+_MARCH_STATE=struct.Struct('<bb?')
+
+
+class Formation(object):
+    """
+    A class representing the alien formation of a wave.
+
+    Row 0 is the top row of the formation and column 0 is the leftmost column.  Dead
+    aliens keep their slot in the lattice, but have a False entry in the alive mask.
+    The alien at (row, col) is centered at (_colX[col]+_offsetX, _rowY[row]+_offsetY).
+
+    INSTANCE ATTRIBUTES:
+        _rows:    the number of rows in the formation [int > 0]
+        _cols:    the number of aliens in a row [int > 0]
+        _scale:   the factor the size, spacing and steps of the aliens are
+                  multiplied by [float in (0,1]]
+        _hSep:    the horizontal separation between aliens, ALIEN_H_SEP*_scale [float]
+        _vSep:    the vertical separation between aliens, ALIEN_V_SEP*_scale [float]
+        _alienWidth:  the width of an alien, ALIEN_WIDTH*_scale [float]
+        _alienHeight: the height of an alien, ALIEN_HEIGHT*_scale [float]
+        _originX: the starting x coordinate of column 0 [number]
+        _originY: the starting y coordinate of row 0 [number]
+        _colX:    the starting x coordinate of every column [float array (cols,)]
+        _rowY:    the starting y coordinate of every row [float array (rows,)]
+        _offsetX: how far the formation has marched right since it was made [number]
+        _offsetY: how far the formation has marched up since it was made [number <= 0]
+        _alive:   whether each alien is still alive [bool array (rows,cols)]
+        _score:   the score for killing each alien [int array (rows,cols)]
+        _image:   the index in ALIEN_IMAGES of the image for each alien
+                  [int array (rows,cols)]
+        _count:   the number of aliens still alive [int >= 0]
+        _colCount: the number of live aliens in each column [int array (cols,)]
+        _rowCount: the number of live aliens in each row [int array (rows,)]
+        _leftCol: the leftmost column with a live alien [int in 0..cols-1]
+        _rightCol: the rightmost column with a live alien [int in 0..cols-1]
+        _bottomRow: the lowest row with a live alien [int in 0..rows-1]
+        _colBottom: the lowest row with a live alien in each column, or -1 if the
+                  column is empty [int array (cols,)]
+        _liveCols: the columns with at least one live alien, in no particular
+                  order, packed at the front [int array (cols,)]
+        _liveColCount: the number of columns in _liveCols [int in 0..cols]
+        _colSlot: the position of each column in _liveCols, or -1 if the column
+                  is empty [int array (cols,)]
+        _version: how many times the alive mask has changed, by a kill or a restore
+                  [int >= 0]
+    
+    _leftCol, _rightCol and _bottomRow are meaningless once _count is 0.
+    """
+
+    # GETTERS AND SETTERS
+
+    def getRows(self):
+        """
+        Returns the number of rows in the formation
+        """
+        return self._rows
+
+
+    def getCols(self):
+        """
+        Returns the number of aliens in a row of the formation
+        """
+        return self._cols
+
+
+    def getScale(self):
+        """
+        Returns the factor the size, spacing and steps of the aliens are multiplied by
+        """
+        return self._scale
+
+
+    def getHSep(self):
+        """
+        Returns the horizontal separation between the aliens in this formation
+        """
+        return self._hSep
+
+
+    def getVSep(self):
+        """
+        Returns the vertical separation between the aliens in this formation
+        """
+        return self._vSep
+
+
+    def getAlienWidth(self):
+        """
+        Returns the width of an alien in this formation
+        """
+        return self._alienWidth
+
+
+    def getAlienHeight(self):
+        """
+        Returns the height of an alien in this formation
+        """
+        return self._alienHeight
+
+
+    def getOffset(self):
+        """
+        Returns the (x, y) offset of the formation from its starting position
+        """
+        return (self._offsetX,self._offsetY)
+
+
+    def getXs(self):
+        """
+        Returns a read-only (rows,cols) array of alien x coordinates
+        """
+        return np.broadcast_to(self._colX+self._offsetX,(self._rows,self._cols))
+
+
+    def getYs(self):
+        """
+        Returns a read-only (rows,cols) array of alien y coordinates
+        """
+        return np.broadcast_to((self._rowY+self._offsetY)[:,None],(self._rows,self._cols))
+
+
+    def getColX(self, col):
+        """
+        Returns the current x coordinate of the aliens in column col
+
+        Parameter col: the column index
+        Precondition: col is an int in 0..cols-1
+        """
+        return float(self._colX[col])+self._offsetX
+
+
+    def getRowY(self, row):
+        """
+        Returns the current y coordinate of the aliens in row row
+
+        Parameter row: the row index
+        Precondition: row is an int in 0..rows-1
+        """
+        return float(self._rowY[row])+self._offsetY
+
+
+    def getAlive(self):
+        """
+        Returns the alive mask of the formation
+
+        The array is owned by the formation and must not be modified.
+        """
+        return self._alive
+
+
+    def getScores(self):
+        """
+        Returns the array of alien scores
+        """
+        return self._score
+
+
+    def getImages(self):
+        """
+        Returns the array of alien image ids (indices in ALIEN_IMAGES)
+        """
+        return self._image
+
+
+    def getCount(self):
+        """
+        Returns the number of aliens still alive
+        """
+        return self._count
+
+
+    def getVersion(self):
+        """
+        Returns the number of times the alive mask has changed
+
+        This grows whenever an alien is killed or the formation is restored, so
+        a view may compare it to the last version it showed.
+        """
+        return self._version
+
+
+    # INITIALIZER
+
+    def __init__(self, rows=ALIEN_ROWS, cols=ALIENS_IN_ROW, scale=ALIEN_SCALE):
+        """
+        Initializer: creates a full formation at the top of the window
+
+        The image of the aliens changes every two rows, cycling through
+        ALIEN_IMAGES from the top row down.
+
+        Parameter rows: the number of rows of aliens
+        Precondition: rows is an int > 0
+
+        Parameter cols: the number of aliens in a row
+        Precondition: cols is an int > 0
+
+        Parameter scale: the factor the size, spacing and steps of the aliens
+        are multiplied by
+        Precondition: scale is a number in (0,1]
+        """
+        self._rows=rows
+        self._cols=cols
+        self._scale=scale
+        self._hSep=ALIEN_H_SEP*scale
+        self._vSep=ALIEN_V_SEP*scale
+        self._alienWidth=ALIEN_WIDTH*scale
+        self._alienHeight=ALIEN_HEIGHT*scale
+
+        rowIndex=np.arange(rows)
+        self._originX=self._hSep
+        self._originY=GAME_HEIGHT-ALIEN_CEILING
+        self._colX=self._originX+self._hSep*np.arange(cols,dtype=float)
+        self._rowY=self._originY-self._vSep*rowIndex.astype(float)
+        self._offsetX=0
+        self._offsetY=0
+
+        self._alive=np.ones((rows,cols),dtype=bool)
+        self._image=np.empty((rows,cols),dtype=np.int8)
+        self._image[:]=((rowIndex//2)%len(ALIEN_IMAGES))[:,None]
+        self._score=np.asarray(ALIEN_SCORES,dtype=np.int32)[self._image]
+
+        self._count=rows*cols
+        self._colCount=np.full(cols,rows,dtype=np.int32)
+        self._rowCount=np.full(rows,cols,dtype=np.int32)
+        self._leftCol=0
+        self._rightCol=cols-1
+        self._bottomRow=rows-1
+        self._colBottom=np.full(cols,rows-1,dtype=np.int32)
+        self._liveCols=np.arange(cols,dtype=np.int32)
+        self._liveColCount=cols
+        self._colSlot=np.arange(cols,dtype=np.int32)
+        self._version=0
+
+
+    # METHODS TO MOVE THE FORMATION
+
+    def moveX(self, dx):
+        """
+        Moves every alien dx pixels to the right (to the left if dx is negative)
+
+        Parameter dx: how much the x values are to shift
+        Precondition: dx is a number
+        """
+        self._offsetX+=dx
+
+
+    def moveY(self, dy):
+        """
+        Moves every alien dy pixels up (down if dy is negative)
+
+        Parameter dy: how much the y values are to shift
+        Precondition: dy is a number
+        """
+        self._offsetY+=dy
+
+
+    # METHODS TO QUERY AND UPDATE THE FORMATION
+
+    def isEmpty(self):
+        """
+        Returns True if every alien in the formation has been killed
+        """
+        return self._count==0
+
+
+    def isEmptyCol(self, col):
+        """
+        Returns True if there are no live aliens in column col
+
+        Parameter col: the column to check
+        Precondition: col is an int in 0..cols-1
+        """
+        return self._colCount[col]==0
+
+
+    def findBiggestX(self):
+        """
+        Returns: x coordinate of the rightmost live alien (0 if there is none)
+        """
+        return self.getColX(self._rightCol) if self._count else 0
+
+
+    def findSmallestX(self):
+        """
+        Returns: x coordinate of the leftmost live alien (0 if there is none)
+        """
+        return self.getColX(self._leftCol) if self._count else 0
+
+
+    def findSmallestY(self):
+        """
+        Returns: y coordinate of the lowest live alien (0 if there is none)
+        """
+        return self.getRowY(self._bottomRow) if self._count else 0
+
+
+    def isTouchingLeft(self):
+        """
+        Returns True if the leftmost live alien has reached the left side
+        """
+        return self.findSmallestX()<=self._hSep
+
+
+    def isTouchingRight(self):
+        """
+        Returns True if the rightmost live alien has reached the right side
+        """
+        return self.findBiggestX()+self._alienWidth>=GAME_WIDTH
+
+
+    def findColBottomRow(self, col):
+        """
+        Returns: the row index of the lowest live alien in column col
+
+        Parameter col: the column to search
+        Precondition: col is an int in 0..cols-1 with at least one live alien
+        """
+        return int(self._colBottom[col])
+
+
+    def getLiveColCount(self):
+        """
+        Returns the number of columns with at least one live alien
+        """
+        return self._liveColCount
+
+
+    def getLiveCol(self, index):
+        """
+        Returns the column at position index of the live column index
+
+        The order of the live columns is arbitrary, and changes whenever a
+        column is emptied.  Picking a uniformly random index in 
+        0..getLiveColCount()-1 picks a uniformly random live column.
+
+        Parameter index: the position in the live column index
+        Precondition: index is an int in 0..getLiveColCount()-1
+        """
+        return int(self._liveCols[index])
+
+
+    def findHit(self, x, y, halfWidth, halfHeight):
+        """
+        Returns: the (row, col) of the first live alien (in row-major order)
+        overlapping the given box, or None if there is none
+
+        As the aliens sit on a lattice, the box is mapped straight to the
+        lattice cells it can reach (one or two per axis for a bolt), and only
+        those cells are tested.  The cost does not depend on the formation size.
+
+        Parameter x: the x coordinate of the box center
+        Precondition: x is a number
+
+        Parameter y: the y coordinate of the box center
+        Precondition: y is a number
+
+        Parameter halfWidth: half the width of the box
+        Precondition: halfWidth is a number >= 0
+
+        Parameter halfHeight: half the height of the box
+        Precondition: halfHeight is a number >= 0
+        """
+        reachX=self._alienWidth/2+halfWidth
+        reachY=self._alienHeight/2+halfHeight
+        
+        # columns grow to the right, rows grow downwards
+        localX=x-self._originX-self._offsetX
+        localY=self._originY+self._offsetY-y
+        firstCol=max(math.ceil((localX-reachX)/self._hSep),0)
+        lastCol=min(math.floor((localX+reachX)/self._hSep),self._cols-1)
+        firstRow=max(math.ceil((localY-reachY)/self._vSep),0)
+        lastRow=min(math.floor((localY+reachY)/self._vSep),self._rows-1)
+        
+        for row in range(firstRow,lastRow+1):
+            if abs(localY-row*self._vSep)<reachY:
+                for col in range(firstCol,lastCol+1):
+                    if abs(localX-col*self._hSep)<reachX and self._alive[row,col]:
+                        return (row,col)
+        return None
+
+
+    def kill(self, row, col):
+        """
+        Returns: the score of the alien at (row, col), after killing it
+
+        This updates the live counts of the row and column, the lowest live
+        alien of the column and the live column index, and moves the bounds 
+        of the formation past any row or column left empty.
+
+        Parameter row: the row of the alien
+        Precondition: row is an int in 0..rows-1
+
+        Parameter col: the column of the alien
+        Precondition: col is an int in 0..cols-1 and that alien is alive
+        """
+        self._alive[row,col]=False
+        self._count-=1
+        self._version+=1
+        self._colCount[col]-=1
+        self._rowCount[row]-=1
+        
+        if self._colCount[col]==0:
+            self._colBottom[col]=-1
+            self._removeLiveCol(col)
+        elif self._colBottom[col]==row:
+            bottom=row-1
+            while not self._alive[bottom,col]:
+                bottom-=1
+            self._colBottom[col]=bottom
+        
+        if self._count>0:
+            colCount=self._colCount
+            while colCount[self._leftCol]==0:
+                self._leftCol+=1
+            while colCount[self._rightCol]==0:
+                self._rightCol-=1
+            while self._rowCount[self._bottomRow]==0:
+                self._bottomRow-=1
+        
+        return int(self._score[row,col])
+
+
+    # METHODS TO SAVE AND RESTORE THE FORMATION
+
+    def writeState(self, buf):
+        """
+        Appends the state of the formation to the snapshot buf
+
+        The lattice, scores and images only depend on the shape of the formation,
+        so only the offset, the alive mask and the live counts and indices are saved.
+
+        Parameter buf: the snapshot being written
+        Precondition: buf is a bytearray
+        """
+        buf+=_FORMATION_STATE.pack(self._rows,self._cols,self._offsetX,self._offsetY,
+                                   self._count,self._leftCol,self._rightCol,
+                                   self._bottomRow,self._liveColCount)
+        for array in (self._alive,self._colCount,self._rowCount,self._colBottom,
+                      self._liveCols,self._colSlot):
+            writeArray(buf,array)
+
+
+    def readState(self, data, offset):
+        """
+        Returns: the offset just past the formation state, after restoring the
+        formation from data starting at offset
+
+        Parameter data: the snapshot
+        Precondition: data is a bytes-like object
+
+        Parameter offset: the position of the formation state in data
+        Precondition: offset is an int >= 0, the start of a state written by
+        writeState for a formation of the same shape
+        """
+        fields=_FORMATION_STATE.unpack_from(data,offset)
+        assert fields[:2]==(self._rows,self._cols), 'snapshot is for a different formation'
+        (self._offsetX,self._offsetY,self._count,self._leftCol,self._rightCol,
+         self._bottomRow,self._liveColCount)=fields[2:]
+        offset+=_FORMATION_STATE.size
+        for array in (self._alive,self._colCount,self._rowCount,self._colBottom,
+                      self._liveCols,self._colSlot):
+            offset=readArray(array,data,offset)
+        self._version+=1
+        return offset
+
+
+    # HELPER METHODS
+
+    def _removeLiveCol(self, col):
+        """
+        Removes an empty column from the live column index
+
+        The last live column is moved into its position (swap-remove).
+
+        Parameter col: the column to remove
+        Precondition: col is an int in 0..cols-1 that is in the index
+        """
+        slot=self._colSlot[col]
+        last=self._liveColCount-1
+        moved=self._liveCols[last]
+        self._liveCols[slot]=moved
+        self._colSlot[moved]=slot
+        self._colSlot[col]=-1
+        self._liveColCount=last
+
+
+class MarchController(object):
+    """
+    A class that decides how a Formation marches.
+
+    The formation marches sideways by ALIEN_H_WALK each step.  When it reaches the 
+    right side it turns around.  When it reaches the left side it first steps down by 
+    ALIEN_V_WALK, and then turns around.  Both steps are multiplied by the scale of
+    the formation.
+
+    The next step is planned ahead of time, after every step and whenever an alien
+    dies (as that can change the bounds of the formation).  Taking a step is then just
+    a matter of applying the plan.
+
+    INSTANCE ATTRIBUTES:
+        _formation:   the formation to march [Formation]
+        _heading:     the direction of the last sideways step, 1 for right and
+                      -1 for left [int in {1,-1}]
+        _direction:   the direction of the next sideways step [int in {1,-1}]
+        _pendingDown: whether the next step starts with a step down [bool]
+    """
+
+    # GETTERS AND SETTERS
+
+    def getDirection(self):
+        """
+        Returns the direction of the next sideways step (1 right, -1 left)
+        """
+        return self._direction
+
+
+    def isPendingDown(self):
+        """
+        Returns True if the next step starts with a step down
+        """
+        return self._pendingDown
+
+
+    # INITIALIZER
+
+    def __init__(self, formation):
+        """
+        Initializer: creates a controller for a formation that has not moved yet
+
+        A new formation marches right first.
+
+        Parameter formation: the formation to march
+        Precondition: formation is a Formation
+        """
+        self._formation=formation
+        self._heading=1
+        self.replan()
+
+
+    # PUBLIC METHODS
+
+    def replan(self):
+        """
+        Plans the next step from the current heading and bounds of the formation
+
+        Call this after any alien in the formation is killed.
+        """
+        left=self._formation.isTouchingLeft()
+        right=self._formation.isTouchingRight()
+        self._pendingDown=left and self._heading<0
+        if left or (self._heading>0 and not right):
+            self._direction=1
+        else:
+            self._direction=-1
+
+
+    def step(self):
+        """
+        Returns: the number of moves made (2 with a step down, 1 otherwise)
+
+        Moves the formation according to the plan, then plans the next step.
+        """
+        moves=1
+        if self._pendingDown:
+            self._formation.moveY(-ALIEN_V_WALK*self._formation.getScale())
+            moves=2
+        self._formation.moveX(self._direction*ALIEN_H_WALK*self._formation.getScale())
+        self._heading=self._direction
+        self.replan()
+        return moves
+
+
+    def writeState(self, buf):
+        """
+        Appends the state of the controller to the snapshot buf
+
+        Parameter buf: the snapshot being written
+        Precondition: buf is a bytearray
+        """
+        buf+=_MARCH_STATE.pack(self._heading,self._direction,self._pendingDown)
+
+
+    def readState(self, data, offset):
+        """
+        Returns: the offset just past the controller state, after restoring the
+        controller from data starting at offset
+
+        Parameter data: the snapshot
+        Precondition: data is a bytes-like object
+
+        Parameter offset: the position of the controller state in data
+        Precondition: offset is an int >= 0, the start of a state written by
+        writeState
+        """
+        self._heading,self._direction,self._pendingDown=_MARCH_STATE.unpack_from(data,offset)
+        return offset+_MARCH_STATE.size
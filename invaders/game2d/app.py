@@ -16,6 +16,7 @@ from kivy.config import Config
 from kivy.clock  import Clock
 
 import os.path
+import collections
 
 class GameApp(kivy.app.App):
     """
@@ -39,6 +40,22 @@ class GameApp(kivy.app.App):
     # Class attribute for tracking textures (to reduce memory footprint)
     TEXTURE_CACHE = {}
     
+    # Class attribute for tracking rendered text, by (text, font name, font size)
+    TEXT_CACHE = collections.OrderedDict()
+    
+    # The most rendered text textures kept in TEXT_CACHE
+    TEXT_CACHE_SIZE = 128
+    
+    # Class attribute for tracking rendered fonts, by (font name, font size)
+    FONT_CACHE = {}
+    
+    # Class attribute for the regions of the loaded texture atlases, by name.  Each is
+    # the tuple (atlas file, (x, y, width, height) from the bottom left, atlas size)
+    ATLAS_REGIONS = {}
+    
+    # The longest frame (in seconds) that is caught up with in fixed-tick mode
+    MAX_FRAME_TIME = 0.25
+    
     
     # MUTABLE ATTRIBUTES
     @property
@@ -64,6 +81,49 @@ class GameApp(kivy.app.App):
     
     
     # IMMUTABLE PROPERTIES
+    @property
+    def tickrate(self):
+        """
+        The number of fixed ticks per second, or None to update once per frame
+        
+        If this value is None, ``update`` is called once per animation frame with the
+        time since the last frame.  Otherwise, ``update`` is called with a fixed time 
+        step of ``1/tickrate`` seconds, as many times as needed to keep up with the 
+        clock.  This may be zero times or several times in one frame.  The method 
+        ``draw`` is still called once per frame.
+        
+        **Invariant**: Must be None or an int or float > 0.
+        """
+        return self._tickrate
+    
+    @property
+    def alpha(self):
+        """
+        How far the current frame is between the last tick and the next one
+        
+        This is 0 if the frame is exactly at the last tick, and approaches 1 as it gets
+        closer to the next one.  Use it in ``draw`` to place moving objects in between
+        their positions at the last two ticks.  If ``tickrate`` is None, it is always 1.
+        
+        **Invariant**: Must be a float in 0..1.
+        """
+        return self._alpha
+    
+    @property
+    def retained(self):
+        """
+        Whether the view keeps what was drawn from one frame to the next
+        
+        If this value is False, the view is cleared at the start of every frame, and 
+        everything drawn in ``draw`` is added to the canvas again.  If it is True, 
+        ``draw`` works the same, but only the objects that were not drawn in the last
+        frame are added to the canvas, and only the ones no longer drawn are removed.
+        See the class :class:`GView` for more information.
+        
+        **Invariant**: Must be a bool.
+        """
+        return self._retained
+    
     @property
     def width(self):
         """
@@ -123,7 +183,7 @@ class GameApp(kivy.app.App):
         if type(name) != str:
             return False
     
-        return os.path.exists(cls.images+'/'+name)
+        return name in cls.ATLAS_REGIONS or os.path.exists(cls.images+'/'+name)
     
     @classmethod
     def is_font(cls,name):
@@ -166,9 +226,11 @@ class GameApp(kivy.app.App):
         """
         Returns: The texture for the given file name, or None if it cannot be loaded
         
-        The ``name`` must refer to the file in the **Images** folder.  If the texture
-        has already been loaded, it will return the cached texture.  Otherwise, it will
-        load the texture and cache it before returning it.
+        The ``name`` must refer to the file in the **Images** folder, or to a region of
+        a texture atlas (see :meth:`load_atlas`).  If the texture has already been 
+        loaded, it will return the cached texture.  Otherwise, it will load the texture 
+        and cache it before returning it.  The texture of an atlas region is a part of 
+        the atlas texture, so all of the regions of an atlas share a single texture.
         
         This method will crash if name is not a valid file.
         
@@ -179,6 +241,13 @@ class GameApp(kivy.app.App):
         if name in cls.TEXTURE_CACHE:
             return cls.TEXTURE_CACHE[name]
         
+        if name in cls.ATLAS_REGIONS:
+            source, region, size = cls.ATLAS_REGIONS[name]
+            atlas = cls.load_texture(source)
+            texture = None if atlas is None else atlas.get_region(*region)
+            cls.TEXTURE_CACHE[name] = texture
+            return texture
+        
         try:
             from kivy.core.image import Image
             texture = Image(name).texture
@@ -188,6 +257,95 @@ class GameApp(kivy.app.App):
         
         return texture
     
+    @classmethod
+    def load_text(cls,text,font_name=None,font_size=12):
+        """
+        Returns: The texture of the given text, rendered in white
+        
+        Rendering text is slow, so the texture is cached, keyed by the text, font name
+        and font size.  Only the ``TEXT_CACHE_SIZE`` most recently used textures are kept.
+        Lines in the text are centered.  Color the text by drawing it tinted.
+        
+        :param text: The text to render
+        :type text:  ``str``
+        
+        :param font_name: The font file in the **Fonts** folder (the Kivy font if None)
+        :type font_name:  ``str`` or None
+        
+        :param font_size: The size of the font in points
+        :type font_size:  ``int`` or ``float`` > 0
+        """
+        key = (text, font_name, font_size)
+        if key in cls.TEXT_CACHE:
+            cls.TEXT_CACHE.move_to_end(key)
+            return cls.TEXT_CACHE[key]
+        
+        from kivy.core.text import Label
+        options = {'text':text, 'font_size':font_size, 'halign':'center'}
+        if not font_name is None:
+            options['font_name'] = font_name
+        label = Label(**options)
+        label.refresh()
+        texture = label.texture
+        if texture is None:
+            # Kivy makes no texture for empty text
+            from kivy.graphics.texture import Texture
+            texture = Texture.create(size=(1,1))
+            texture.blit_buffer(bytes(4),colorfmt='rgba',bufferfmt='ubyte')
+        
+        cls.TEXT_CACHE[key] = texture
+        if len(cls.TEXT_CACHE) > cls.TEXT_CACHE_SIZE:
+            cls.TEXT_CACHE.popitem(last=False)
+        return texture
+    
+    @classmethod
+    def load_font(cls,font_name=None,font_size=12):
+        """
+        Returns: The glyph atlas of the given font (see :class:`GFont`)
+        
+        Rendering the glyphs of a font is slow, so the font is cached, keyed by the font
+        name and font size.  Every text drawn in the same font and size shares it.
+        
+        :param font_name: The font file in the **Fonts** folder (the Kivy font if None)
+        :type font_name:  ``str`` or None
+        
+        :param font_size: The size of the font in points
+        :type font_size:  ``int`` or ``float`` > 0
+        """
+        key = (font_name, font_size)
+        if not key in cls.FONT_CACHE:
+            from .gfont import GFont
+            cls.FONT_CACHE[key] = GFont(font_name,font_size)
+        return cls.FONT_CACHE[key]
+    
+    @classmethod
+    def load_atlas(cls,manifest):
+        """
+        Loads the regions of a texture atlas, so that they can be used by name.
+        
+        An atlas is an image with many images packed into it.  The ``manifest`` is a 
+        JSON file in the **Images** folder, with the atlas file name as "image", its 
+        [width, height] as "size", and the [x, y, width, height] of each image in it as 
+        "regions", by name, measured in pixels from the top left corner.
+        
+        Afterwards, the name of a region can be used wherever an image file name can 
+        (such as the ``source`` of a :class:`GImage` or :class:`GSprite`), and will 
+        draw from the atlas texture.  A region named after an image file replaces that
+        file.
+        
+        :param manifest: The manifest file name
+        :type manifest:  ``str``
+        """
+        import json
+        with open(os.path.join(cls.images,manifest)) as file:
+            data = json.load(file)
+        width, height = data['size']
+        for name in data['regions']:
+            x, y, w, h = data['regions'][name]
+            region = (x, height-y-h, w, h)
+            cls.ATLAS_REGIONS[name] = (data['image'], region, (width, height))
+            cls.TEXTURE_CACHE.pop(name, None)
+    
     @classmethod
     def unload_texture(cls,name):
         """
@@ -232,15 +390,24 @@ class GameApp(kivy.app.App):
         w = keywords.pop('width', 0.0)
         h = keywords.pop('height', 0.0)
         f = keywords.pop('fps', 60.0)
+        t = keywords.pop('tickrate', None)
+        r = keywords.pop('retained', False)
 
         assert type(w) in [int,float], 'width %s is not a number' % repr(w)
         assert type(h) in [int,float], 'height %s is not a number' % repr(h)
         assert type(f) in [int,float], 'fps %s is not a number' % repr(value)
         assert f > 0, 'fps %s is not positive' % repr(value)
+        assert t is None or type(t) in [int,float], 'tickrate %s is not a number' % repr(t)
+        assert t is None or t > 0, 'tickrate %s is not positive' % repr(t)
+        assert type(r) == bool, 'retained %s is not a bool' % repr(r)
 
         self._gwidth = w
         self._gheight = h
         self._fps = f
+        self._tickrate = t
+        self._retained = r
+        self._alpha = 1.0
+        self._accumulator = 0.0
         
         Config.set('graphics', 'width', str(self.width))
         Config.set('graphics', 'height', str(self.height))
@@ -259,7 +426,7 @@ class GameApp(kivy.app.App):
         It should **never** be overridden.
         """
         from .gview import GInput, GView
-        self._view = GView()
+        self._view = GView(self._retained)
         self._view.size_hint = (1,1)
         self._input = GInput()
         self._input._register(self._view)
@@ -302,9 +469,9 @@ class GameApp(kivy.app.App):
         """
         Updates the state of the game one animation frame.
         
-        This method is called 60x a second (depending on the ``fps``) to provide on-screen 
-        animation. Any code that moves objects or processes user input (keyboard or mouse)
-        goes in this method.
+        This method is called 60x a second (depending on the ``fps``, or on the 
+        ``tickrate`` if one was given) to provide on-screen animation. Any code that 
+        moves objects or processes user input (keyboard or mouse) goes in this method.
         
         Think of this method as the body of the loop.  You will need to add attributes
         that represent the current animation state, so that they can persist across
@@ -337,6 +504,9 @@ class GameApp(kivy.app.App):
             Clock.schedule_interval(self._refresh,1.0/self.fps)
         else:
             Clock.schedule_interval(self._refresh,0)
+        if not self._tickrate is None:
+            # The first frame always runs one tick
+            self._accumulator = 1.0/self._tickrate
         self.start()
     
     def _refresh(self,dt):
@@ -346,12 +516,30 @@ class GameApp(kivy.app.App):
         This method a callback-proxy for the methods `update` and `draw`.  It handles
         important issues behind the scenes, particularly with clearing the window.
         
+        If there is a ``tickrate``, the frame time is added to an accumulator, and 
+        `update` is called once for every whole tick in it.  The leftover fraction of
+        a tick is the ``alpha`` for `draw`.  Frames longer than ``MAX_FRAME_TIME`` 
+        (such as after the window was dragged) are cut short, so that the game does 
+        not spend several frames catching up.
+        
+        In ``retained`` mode, the view only swaps the commands that changed after 
+        `draw`.
+        
         :param dt: time in seconds since last update
         :type dt:  ``int`` or ``float``
         """
         self.view.clear()
-        self.update(dt)
+        if self._tickrate is None:
+            self.update(dt)
+        else:
+            step = 1.0/self._tickrate
+            self._accumulator += min(dt,self.MAX_FRAME_TIME)
+            while self._accumulator >= step:
+                self.update(step)
+                self._accumulator -= step
+            self._alpha = self._accumulator/step
         self.draw()
+        self.view._flush()
     
     def _setpaths(self):
         """
@@ -0,0 +1,259 @@
+"""
+A module to support drawing many images at once.
+
+This module draws many copies of an image (or of regions of an image) as a single
+Kivy ``Mesh``.
+
+Author: agent (agent@local), for the game2d package of Walker M. White (wmw2)
+Date:   October 18, 2026
+"""
+from kivy.graphics import *
+from kivy.graphics.instructions import *
+from .grectangle import GRectangle, GObject
+from .app import GameApp
+import numpy as np
+
+# The most quads in one mesh (the vertex indices of a Mesh are 16 bit)
+MAX_QUADS = 16384
+
+# The vertex indices of the two triangles of a quad
+QUAD_INDICES = (0,1,2,2,3,0)
+
+
+# #mark -
+class GBatch(GRectangle):
+    """
+    A class representing a batch of equal size images, drawn as a single mesh.
+    
+    The image is given by a file whose name is stored in the attribute `source`, as in
+    :class:`GImage`.  Each image in the batch (a "quad") is a rectangle of size ``width``
+    by ``height``, and shows one of the ``regions`` of the source image.  A region is a
+    tuple (left, bottom, right, top) of fractions of the image size, measured from the
+    bottom left corner.  By default there is one region, the whole image.  A region may
+    also be given by the name of a region of a texture atlas (see ``load_atlas`` in 
+    :class:`GameApp`).  Then the source is the atlas image, so a single batch can show 
+    many different images.
+    
+    The quads are placed with :meth:`set_quads`, relative to the point (x,y).  So
+    changing the attributes x and y moves every quad, without touching the mesh.  The
+    method :meth:`set_visible` hides and shows quads, which only changes the triangles
+    of the mesh, not its vertices.
+    
+    Batches of more than MAX_QUADS quads are split over several meshes.  The methods
+    ``contains`` and the border (``linewidth``) treat the batch as a single quad at (x,y).
+    """
+    
+    
+    # MUTABLE PROPERTIES
+    @property
+    def source(self):
+        """
+        The source file for the images.
+        
+        **invariant**. Value be a string refering to a valid file.
+        """
+        return self._source
+    
+    @source.setter
+    def source(self,value):
+        assert value is None or GameApp.is_image(value), '%s is not an image file' % repr(value)
+        self._source = value
+        if self._defined:
+            self._reset()
+    
+    
+    # IMMUTABLE PROPERTIES
+    @property
+    def count(self):
+        """
+        The number of quads in this batch, visible or not.
+        
+        **invariant**. Value is an int >= 0.
+        """
+        return len(self._frames)
+    
+    @property
+    def regions(self):
+        """
+        The regions of the source image that quads may show.
+        
+        **invariant**. Value is a nonempty tuple of (left, bottom, right, top) tuples
+        of numbers in 0..1 (atlas region names are converted to these).
+        """
+        return self._regions
+    
+    
+    # BUILT-IN METHODS
+    def __init__(self,**keywords):
+        """
+        Creates a new, empty batch.
+        
+        To use the constructor for this class, you should provide it with a list of
+        keyword arguments that initialize various attributes. For example, to make a
+        batch of 10x10 images of ``alien1.png``, use the constructor::
+        
+            GBatch(x=0,y=0,width=10,height=10,source='alien1.png')
+        
+        This class supports the all same keywords as :class:`GImage`; the only new
+        keyword is ``regions``.  The batch has no quads until :meth:`set_quads` is called.
+        To draw the images ``alien1.png`` and ``alien2.png`` of a loaded atlas, use::
+        
+            GBatch(x=0,y=0,width=10,height=10,regions=('alien1.png','alien2.png'))
+        
+        :param keywords: dictionary of keyword arguments
+        :type keywords:  keys are attribute names
+        """
+        self._defined = False
+        self.source = keywords['source'] if 'source' in keywords else None
+        self._setRegions(keywords['regions'] if 'regions' in keywords else ((0,0,1,1),))
+        self._xs = np.zeros(0)
+        self._ys = np.zeros(0)
+        self._frames = np.zeros(0,dtype=int)
+        self._visible = np.zeros(0,dtype=bool)
+        self._meshes = []
+        self._texture = None
+        GRectangle.__init__(self,**keywords)
+        self._defined = True
+    
+    
+    # PUBLIC METHODS
+    def set_quads(self,xs,ys,frames=None):
+        """
+        Places the quads of this batch, all visible.
+        
+        This replaces any quads already in the batch.  Quad i is centered at
+        (xs[i],ys[i]) relative to (x,y), and shows the region regions[frames[i]].
+        
+        :param xs: the x coordinates of the quad centers
+        :type xs:  1d array or list of numbers
+        
+        :param ys: the y coordinates of the quad centers
+        :type ys:  1d array or list of numbers (same length as xs)
+        
+        :param frames: the region of each quad (region 0 for every quad if None)
+        :type frames:  1d array or list of ints in 0..len(regions)-1, or None
+        """
+        xs = np.asarray(xs,dtype=float)
+        ys = np.asarray(ys,dtype=float)
+        assert xs.shape == ys.shape and xs.ndim == 1, 'xs and ys are not matching lists'
+        frames = np.zeros(len(xs),dtype=int) if frames is None else np.asarray(frames,dtype=int)
+        assert frames.shape == xs.shape, 'frames does not match xs'
+        
+        meshes = (len(xs)+MAX_QUADS-1)//MAX_QUADS
+        self._xs = xs.copy()
+        self._ys = ys.copy()
+        self._frames = frames.copy()
+        self._visible = np.ones(len(xs),dtype=bool)
+        if meshes != len(self._meshes):
+            self._reset()
+        else:
+            vertices = self._vertices()
+            for pos in range(meshes):
+                mesh = self._meshes[pos]
+                mesh.vertices = vertices[pos*MAX_QUADS:(pos+1)*MAX_QUADS].ravel().tolist()
+                mesh.indices = self._indices(pos)
+    
+    def set_visible(self,visible):
+        """
+        Shows the quads where visible is True, and hides the others.
+        
+        Only the meshes with a quad that changed are updated.
+        
+        :param visible: whether to show each quad
+        :type visible:  1d array or list of bools, one per quad
+        """
+        visible = np.asarray(visible,dtype=bool)
+        assert visible.shape == self._visible.shape, 'visible does not match the quads'
+        for pos in range(len(self._meshes)):
+            chunk = slice(pos*MAX_QUADS,(pos+1)*MAX_QUADS)
+            if not np.array_equal(visible[chunk],self._visible[chunk]):
+                self._visible[chunk] = visible[chunk]
+                self._meshes[pos].indices = self._indices(pos)
+    
+    
+    # HIDDEN METHODS
+    def _setRegions(self,value):
+        """
+        Sets the regions of the source image that quads may show.
+        
+        Named regions are looked up in the loaded atlases, and the source is set to
+        their atlas.
+        
+        Parameter value: The regions
+        Precondition: value is a nonempty sequence, each either a 4-element tuple of 
+        numbers in 0..1 or the name of an atlas region (all in the same atlas as source)
+        """
+        assert len(value) > 0, 'there are no regions'
+        regions = []
+        for region in value:
+            if type(region) == str:
+                assert region in GameApp.ATLAS_REGIONS, '%s is not an atlas region' % repr(region)
+                atlas, (x, y, w, h), (width, height) = GameApp.ATLAS_REGIONS[region]
+                assert self._source in [None, atlas], '%s is not in %s' % (repr(region),repr(self._source))
+                self._source = atlas
+                region = (x/width, y/height, (x+w)/width, (y+h)/height)
+            assert len(region) == 4, '%s is not a region' % repr(region)
+            assert all(0 <= r <= 1 for r in region), '%s is out of range' % repr(region)
+            regions.append(tuple(region))
+        self._regions = tuple(regions)
+    
+    def _vertices(self):
+        """
+        Returns: the vertices of every quad, a float array (count,4,4) of the
+        (x, y, u, v) of the bottom left, bottom right, top right and top left corners
+        """
+        w = self.width/2.0
+        h = self.height/2.0
+        vertices = np.empty((self.count,4,4))
+        vertices[:,:,0] = self._xs[:,None]+np.array([-w,w,w,-w])
+        vertices[:,:,1] = self._ys[:,None]+np.array([-h,-h,h,h])
+        
+        # Map the regions through the texture coordinates (textures may be flipped)
+        tc = (0,0,1,0,1,1,0,1) if self._texture is None else self._texture.tex_coords
+        regions = np.array(self._regions,dtype=float)
+        left   = tc[0]+regions[:,0]*(tc[2]-tc[0])
+        right  = tc[0]+regions[:,2]*(tc[2]-tc[0])
+        bottom = tc[1]+regions[:,1]*(tc[7]-tc[1])
+        top    = tc[1]+regions[:,3]*(tc[7]-tc[1])
+        corners = np.stack([np.stack([left,right,right,left],axis=1),
+                            np.stack([bottom,bottom,top,top],axis=1)],axis=2)
+        vertices[:,:,2:] = corners[self._frames]
+        return vertices
+    
+    def _indices(self,pos):
+        """
+        Returns: the vertex indices of the triangles of the visible quads in mesh pos
+        
+        Parameter pos: The mesh index
+        Precondition: pos is an int in 0..len(_meshes)-1
+        """
+        shown = np.flatnonzero(self._visible[pos*MAX_QUADS:(pos+1)*MAX_QUADS])
+        return (4*shown[:,None]+np.array(QUAD_INDICES)).ravel().tolist()
+    
+    def _reset(self):
+        """
+        Resets the drawing cache.
+        """
+        GObject._reset(self)
+        self._texture = GameApp.load_texture(self.source) if self.source else None
+        if not self._fillcolor is None:
+            self._cache.add(self._fillcolor)
+        else:
+            self._cache.add(Color(1,1,1))
+        
+        vertices = self._vertices()
+        self._meshes = []
+        for pos in range((self.count+MAX_QUADS-1)//MAX_QUADS):
+            mesh = Mesh(vertices=vertices[pos*MAX_QUADS:(pos+1)*MAX_QUADS].ravel().tolist(),
+                        indices=self._indices(pos),mode='triangles',texture=self._texture)
+            self._meshes.append(mesh)
+            self._cache.add(mesh)
+        
+        if not self._linecolor is None and self.linewidth > 0:
+            x = -self.width/2.0
+            y = -self.height/2.0
+            line = Line(rectangle=(x,y,self.width,self.height),joint='miter',close=True,width=self.linewidth)
+            self._cache.add(self._linecolor)
+            self._cache.add(line)
+        
+        self._cache.add(PopMatrix())
@@ -0,0 +1,361 @@
+"""
+A module to support text drawn from a prerendered font.
+
+This module renders every glyph of a font once, into a single texture, and draws
+strings as one textured quad per glyph.
+
+Author: agent (agent@local), for the game2d package of Walker M. White (wmw2)
+Date:   October 18, 2026
+"""
+from kivy.graphics import *
+from kivy.graphics.instructions import *
+from .grectangle import GRectangle, GObject
+from .app import GameApp
+
+# The glyphs in a font by default (the printable ASCII characters)
+FONT_GLYPHS = ''.join(chr(code) for code in range(32,127))
+
+# The glyphs in each row of the glyph atlas
+FONT_ROW_GLYPHS = 16
+
+# The vertex indices of the two triangles of a quad
+QUAD_INDICES = (0,1,2,2,3,0)
+
+
+# #mark -
+class GFont(object):
+    """
+    A class representing a font rendered at one size, as a glyph atlas.
+    
+    The glyphs are rendered in white, in rows of FONT_ROW_GLYPHS glyphs with a space
+    between each, by a single core Kivy text label.  The place of each glyph in the
+    texture is found from the extents of the text before it.  Characters that are not
+    in the font are drawn as '?'.
+    
+    Do not make a font directly; use ``load_font`` in :class:`GameApp`, which caches them.
+    """
+    
+    
+    # IMMUTABLE PROPERTIES
+    @property
+    def name(self):
+        """
+        The file name for the .ttf file of this font (None for the Kivy font)
+        
+        **invariant**. Value is None or a string referring to a .ttf file in folder Fonts
+        """
+        return self._name
+    
+    @property
+    def size(self):
+        """
+        The size of this font in points.
+        
+        **invariant**. Value is an int or float > 0
+        """
+        return self._size
+    
+    @property
+    def texture(self):
+        """
+        The glyph atlas of this font.
+        
+        **invariant**. Value is a Kivy ``Texture``
+        """
+        return self._texture
+    
+    @property
+    def line_height(self):
+        """
+        The height of a line of text in pixels.
+        
+        **invariant**. Value is a float > 0
+        """
+        return self._height
+    
+    
+    # BUILT-IN METHODS
+    def __init__(self,name=None,size=12,glyphs=FONT_GLYPHS):
+        """
+        Creates a new font, rendering its glyphs.
+        
+        :param name: The font file in the **Fonts** folder (the Kivy font if None)
+        :type name:  ``str`` or None
+        
+        :param size: The size of the font in points
+        :type size:  ``int`` or ``float`` > 0
+        
+        :param glyphs: The characters to render ('?' is always added)
+        :type glyphs:  nonempty ``str``
+        """
+        from kivy.core.text import Label
+        self._name = name
+        self._size = size
+        glyphs = ''.join(sorted(set(glyphs+'?')))
+        rows = [glyphs[pos:pos+FONT_ROW_GLYPHS] for pos in range(0,len(glyphs),FONT_ROW_GLYPHS)]
+        lines = [' '.join(row) for row in rows]
+        
+        options = {'text':'\n'.join(lines), 'font_size':size, 'halign':'left'}
+        if not name is None:
+            options['font_name'] = name
+        label = Label(**options)
+        label.refresh()
+        self._texture = label.texture
+        width  = float(self._texture.width)
+        height = float(self._texture.height)
+        self._height = height/len(rows)
+        
+        # Map fractions of the atlas through the texture coordinates (it may be flipped)
+        tc = self._texture.tex_coords
+        self._glyphs = {}
+        for row in range(len(rows)):
+            top = row*self._height
+            for col in range(len(rows[row])):
+                char = rows[row][col]
+                left = label.get_extents(lines[row][:2*col])[0] if col > 0 else 0
+                advance = label.get_extents(char)[0]
+                u0 = tc[0]+left/width*(tc[2]-tc[0])
+                u1 = tc[0]+(left+advance)/width*(tc[2]-tc[0])
+                v0 = tc[1]+(1-(top+self._height)/height)*(tc[7]-tc[1])
+                v1 = tc[1]+(1-top/height)*(tc[7]-tc[1])
+                self._glyphs[char] = (advance,(u0,v0,u1,v1))
+    
+    
+    # PUBLIC METHODS
+    def measure(self,text):
+        """
+        Returns: the width of a line of text in pixels
+        
+        :param text: The line of text
+        :type text:  ``str`` with no newlines
+        """
+        return sum(self._glyph(char)[0] for char in text)
+    
+    def quads(self,text,x,y):
+        """
+        Returns: the tuple (vertices, indices) of a line of text, for a ``Mesh``
+        
+        The line starts at x, and its bottom is at y.  Each visible glyph is a quad of
+        four (x, y, u, v) vertices.  Spaces advance the line but have no quad.
+        
+        :param text: The line of text
+        :type text:  ``str`` with no newlines
+        
+        :param x: The left edge of the line
+        :type x:  ``int`` or ``float``
+        
+        :param y: The bottom edge of the line
+        :type y:  ``int`` or ``float``
+        """
+        vertices = []
+        indices  = []
+        top = y+self._height
+        for char in text:
+            advance, (u0, v0, u1, v1) = self._glyph(char)
+            if not char.isspace():
+                base = len(vertices)//4
+                right = x+advance
+                vertices.extend((x,y,u0,v0, right,y,u1,v0, right,top,u1,v1, x,top,u0,v1))
+                indices.extend(base+index for index in QUAD_INDICES)
+            x += advance
+        return (vertices, indices)
+    
+    
+    # HIDDEN METHODS
+    def _glyph(self,char):
+        """
+        Returns: the tuple (advance, (u0, v0, u1, v1)) of a character
+        
+        :param char: The character
+        :type char:  ``str`` of length 1
+        """
+        return self._glyphs[char] if char in self._glyphs else self._glyphs['?']
+
+
+# #mark -
+class GBitmapText(GRectangle):
+    """
+    A class representing an (uneditable) text label, drawn from a glyph atlas.
+    
+    This object is like a :class:`GText`, except that the text is not rendered at all.
+    Instead, each glyph is drawn from the atlas of a :class:`GFont`, so changing the
+    text only updates the vertices of one mesh.  This is the label to use for values
+    that change often, like a score.
+    
+    The attribute `text` is the text of this label.  Uses of the escape character '\\n'
+    will result in a label that spans multiple lines, each line centered.  The `width`
+    and `height` of this label are always those of the text.  The color of the text is
+    `linecolor` (black by default), and the background color is `fillcolor`.
+    
+    The font is given by `font_name` and `font_size`, as for :class:`GLabel`.  Changing
+    either loads another font (rendering it if it was never loaded before).
+    """
+    
+    
+    # MUTABLE PROPERTIES
+    @property
+    def text(self):
+        """
+        The text for this label.
+        
+        **Invariant**: Must be a string"""
+        return self._text
+    
+    @text.setter
+    def text(self,value):
+        assert type(value) == str, 'value %s is not a string' % repr(value)
+        if value != self._text:
+            self._text = value
+            self._refresh()
+    
+    @property
+    def font_size(self):
+        """
+        The size of the text font in points.
+        
+        **Invariant**: Must be a positive number (int or float)"""
+        return self._fsize
+    
+    @font_size.setter
+    def font_size(self,value):
+        assert type(value) in [int,float], 'value %s is not a number' % repr(value)
+        assert value > 0, 'value %s is not positive' % repr(value)
+        if value != self._fsize:
+            self._fsize = value
+            self._refresh()
+    
+    @property
+    def font_name(self):
+        """
+        The file name for the .ttf file to use as a font (None for the Kivy font)
+        
+        **Invariant**: Must be None or a string referring to a .ttf file in folder Fonts"""
+        return self._fname
+    
+    @font_name.setter
+    def font_name(self,value):
+        assert value is None or GameApp.is_font(value) or GameApp.is_font(value+'.ttf'), \
+            'value %s is not a font name' % repr(value)
+        if value != self._fname:
+            self._fname = value
+            self._refresh()
+    
+    
+    # BUILT-IN METHODS
+    def __init__(self,**keywords):
+        """
+        Creates a new text label.
+        
+        To use the constructor for this class, you should provide it with a list of
+        keyword arguments that initialize various attributes.  For example, to create a
+        score label, use the constructor call::
+            
+            GBitmapText(text='Score: 0',font_name='Arcade',font_size=30)
+        
+        This class supports the all same keywords as :class:`GRectangle` (except for
+        ``width`` and ``height``, which come from the text), as well as ``text``,
+        ``font_name`` and ``font_size``.
+        
+        :param keywords: dictionary of keyword arguments
+        :type keywords:  keys are attribute names
+        """
+        self._defined = False
+        self._text  = keywords['text'] if 'text' in keywords else ''
+        self._fsize = 12
+        self._fname = None
+        self._mesh  = None
+        self.font_size = keywords['font_size'] if 'font_size' in keywords else 12
+        self.font_name = keywords['font_name'] if 'font_name' in keywords else None
+        
+        sanitized = {}
+        for key in keywords:
+            if not key in ['width','height','text','font_name','font_size']:
+                sanitized[key] = keywords[key]
+        sanitized['width'], sanitized['height'] = self._layout()
+        if sanitized.get('linecolor') is None:
+            sanitized['linecolor'] = (0,0,0,1)
+        GRectangle.__init__(self,**sanitized)
+    
+    def __str__(self):
+        """
+        :return: A readable string representation of this object.
+        :rtype:  ``str``
+        """
+        if self.name is None:
+            s = '['
+        else:
+            s = '[name=%s,' % self.name
+        return '%s,text=%s,center=(%s,%s),angle=%s]' \
+                % (s,repr(self.text),repr(self.x),repr(self.y),repr(self.angle))
+    
+    
+    # HIDDEN METHODS
+    def _layout(self):
+        """
+        Returns: the tuple (width, height) of the text, after laying it out
+        
+        This loads the font and sets the vertices and indices of the mesh, with the
+        text centered at (0,0).  It does not change the mesh itself.
+        """
+        self._font = GameApp.load_font(self._fname,self._fsize)
+        lines = self._text.split('\n')
+        height = self._font.line_height
+        width  = max(1.0,max(self._font.measure(line) for line in lines))
+        
+        self._vertices = []
+        self._indices  = []
+        for pos in range(len(lines)):
+            x = -self._font.measure(lines[pos])/2.0
+            y = len(lines)*height/2.0-(pos+1)*height
+            vertices, indices = self._font.quads(lines[pos],x,y)
+            base = len(self._vertices)//4
+            self._vertices.extend(vertices)
+            self._indices.extend(base+index for index in indices)
+        return (width, max(1.0,len(lines)*height))
+    
+    def _refresh(self):
+        """
+        Updates the mesh to the current text, keeping the drawing cache.
+        
+        The drawing cache is only built again if the font changed, or if the label has
+        a background or a border, as they depend on the size.
+        """
+        if not self._defined:
+            return
+        
+        texture = self._font.texture
+        self._defined = False
+        self.width, self.height = self._layout()
+        self._defined = True
+        
+        if self._fillcolor or self.linewidth > 0 or self._font.texture is not texture:
+            self._reset()
+        else:
+            self._mesh.vertices = self._vertices
+            self._mesh.indices  = self._indices
+    
+    def _reset(self):
+        """
+        Resets the drawing cache.
+        """
+        GObject._reset(self)
+        x = -self.width/2.0
+        y = -self.height/2.0
+        
+        if self._fillcolor:
+            fill = Rectangle(pos=(x,y), size=(self.width,self.height))
+            self._cache.add(self._fillcolor)
+            self._cache.add(fill)
+        
+        self._mesh = Mesh(vertices=self._vertices,indices=self._indices,
+                          mode='triangles',texture=self._font.texture)
+        self._cache.add(self._linecolor if self._linecolor else Color(0,0,0,1))
+        self._cache.add(self._mesh)
+        
+        if not self._linecolor is None and self._linewidth > 0:
+            line = Line(rectangle=(x,y,self.width,self.height),joint='miter',close=True,width=self.linewidth)
+            self._cache.add(self._linecolor)
+            self._cache.add(line)
+        
+        self._cache.add(PopMatrix())
+    
\ No newline at end of file
@@ -0,0 +1,177 @@
+"""
+A module to support text labels that are cheap to change.
+
+This module draws text from the text cache of :class:`GameApp`, instead of through a
+Kivy ``Label`` widget.
+
+Author: agent (agent@local), for the game2d package of Walker M. White (wmw2)
+Date:   October 18, 2026
+"""
+from kivy.graphics import *
+from kivy.graphics.instructions import *
+from .grectangle import GRectangle, GObject
+from .app import GameApp
+
+
+# #mark -
+class GText(GRectangle):
+    """
+    A class representing an (uneditable) line of text, drawn from a texture cache.
+    
+    The attribute `text` is the text of this label.  Uses of the escape character '\\n'
+    will result in a label that spans multiple lines, each line centered.  Unlike
+    :class:`GLabel`, the `width` and `height` of this label are always those of the
+    rendered text.  The color of the text is `linecolor` (black by default), and the
+    background color is `fillcolor`.
+    
+    To change the font, you need a .ttf (TrueType Font) file in the Fonts folder, as for
+    :class:`GLabel`.  Setting `text`, `font_name` or `font_size` to the value it already
+    has does nothing, so it is safe to set them every frame.
+    """
+    
+    # MUTABLE PROPERTIES
+    @property
+    def text(self):
+        """
+        The text for this label.
+        
+        **Invariant**: Must be a string"""
+        return self._text
+    
+    @text.setter
+    def text(self,value):
+        assert type(value) == str, 'value %s is not a string' % repr(value)
+        if value != self._text:
+            self._text = value
+            self._refresh()
+    
+    @property
+    def font_size(self):
+        """
+        The size of the text font in points.
+        
+        **Invariant**: Must be a positive number (int or float)"""
+        return self._fsize
+    
+    @font_size.setter
+    def font_size(self,value):
+        assert type(value) in [int,float], 'value %s is not a number' % repr(value)
+        assert value > 0, 'value %s is not positive' % repr(value)
+        if value != self._fsize:
+            self._fsize = value
+            self._refresh()
+    
+    @property
+    def font_name(self):
+        """
+        The file name for the .ttf file to use as a font (None for the Kivy font)
+        
+        **Invariant**: Must be None or a string referring to a .ttf file in folder Fonts"""
+        return self._fname
+    
+    @font_name.setter
+    def font_name(self,value):
+        assert value is None or GameApp.is_font(value) or GameApp.is_font(value+'.ttf'), \
+            'value %s is not a font name' % repr(value)
+        if value != self._fname:
+            self._fname = value
+            self._refresh()
+    
+    
+    # BUILT-IN METHODS
+    def __init__(self,**keywords):
+        """
+        Creates a new text label.
+        
+        To use the constructor for this class, you should provide it with a list of
+        keyword arguments that initialize various attributes.  For example, to create a
+        label containing the word 'Hello', use the constructor call::
+            
+            GText(text='Hello',font_name='Arcade',font_size=30)
+        
+        This class supports the all same keywords as :class:`GRectangle` (except for
+        ``width`` and ``height``, which come from the text), as well as ``text``,
+        ``font_name`` and ``font_size``.
+        
+        :param keywords: dictionary of keyword arguments
+        :type keywords:  keys are attribute names
+        """
+        self._defined = False
+        self._text  = keywords['text'] if 'text' in keywords else ''
+        self._fsize = 12
+        self._fname = None
+        self._rect  = None
+        self.font_size = keywords['font_size'] if 'font_size' in keywords else 12
+        self.font_name = keywords['font_name'] if 'font_name' in keywords else None
+        
+        sanitized = {}
+        for key in keywords:
+            if not key in ['width','height','text','font_name','font_size']:
+                sanitized[key] = keywords[key]
+        self._texture = GameApp.load_text(self._text,self._fname,self._fsize)
+        sanitized['width']  = max(1,self._texture.width)
+        sanitized['height'] = max(1,self._texture.height)
+        if sanitized.get('linecolor') is None:
+            sanitized['linecolor'] = (0,0,0,1)
+        GRectangle.__init__(self,**sanitized)
+    
+    def __str__(self):
+        """
+        :return: A readable string representation of this object.
+        :rtype:  ``str``
+        """
+        if self.name is None:
+            s = '['
+        else:
+            s = '[name=%s,' % self.name
+        return '%s,text=%s,center=(%s,%s),angle=%s]' \
+                % (s,repr(self.text),repr(self.x),repr(self.y),repr(self.angle))
+    
+    
+    # HIDDEN METHODS
+    def _refresh(self):
+        """
+        Swaps in the texture of the current text, keeping the drawing cache.
+        
+        Only the text rectangle is changed.  The drawing cache is only built again if
+        the label has a background or a border, as they depend on the size.
+        """
+        if not self._defined:
+            return
+        
+        self._texture = GameApp.load_text(self._text,self._fname,self._fsize)
+        self._defined = False
+        self.width  = max(1,self._texture.width)
+        self.height = max(1,self._texture.height)
+        self._defined = True
+        
+        if self._fillcolor or self.linewidth > 0:
+            self._reset()
+        else:
+            self._rect.texture = self._texture
+            self._rect.pos  = (-self.width/2.0,-self.height/2.0)
+            self._rect.size = (self.width,self.height)
+    
+    def _reset(self):
+        """
+        Resets the drawing cache.
+        """
+        GObject._reset(self)
+        x = -self.width/2.0
+        y = -self.height/2.0
+        
+        if self._fillcolor:
+            fill = Rectangle(pos=(x,y), size=(self.width,self.height))
+            self._cache.add(self._fillcolor)
+            self._cache.add(fill)
+        
+        self._rect = Rectangle(pos=(x,y), size=(self.width,self.height), texture=self._texture)
+        self._cache.add(self._linecolor if self._linecolor else Color(0,0,0,1))
+        self._cache.add(self._rect)
+        
+        if not self._linecolor is None and self._linewidth > 0:
+            line = Line(rectangle=(x,y,self.width,self.height),joint='miter',close=True,width=self.linewidth)
+            self._cache.add(self._linecolor)
+            self._cache.add(line)
+        
+        self._cache.add(PopMatrix())
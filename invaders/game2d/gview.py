@@ -319,14 +319,35 @@ class GView(FloatLayout):
     :class:`GObject` instances to the :meth:`draw` method.  You must do this every 
     animation frame, as the game is constantly clearing the window.
     
+    In retained mode (see the attribute ``retained`` of :class:`GameApp`), the window 
+    is not really cleared.  The graphics commands drawn in a frame stay in the canvas, 
+    and at the end of the frame they are compared (by identity) with the ones drawn in 
+    the frame before.  Only the commands that differ are removed or added, so a frame 
+    that draws the same objects as the last one costs no Kivy work at all.  Moving an 
+    object only changes its transform, which Kivy updates in place.  In this mode, 
+    each object should be drawn at most once per frame.
+    
     **You should never construct an object of this class**.  Creating a new instance
     of this class will not properly display it on the screen.  Instead, you should 
     only use the one provided in the `view` attribute of :class:`GameApp`. 
     See the documentation of that class for more information.
     """
     
+    # IMMUTABLE PROPERTIES
+    @property
+    def retained(self):
+        """
+        Whether this view keeps the commands drawn from one frame to the next.
+        
+        **Immutable**: This value cannot be altered.
+        
+        **Invariant**: Must be a bool
+        """
+        return self._retained
+    
+    
     # BUILT-IN METHODS
-    def __init__(self):
+    def __init__(self,retained=False):
         """
         Creates a new view for display
         
@@ -334,9 +355,15 @@ class GView(FloatLayout):
         window.  That functionality happens behind the scenes with hidden methods.  
         You should only use use the object provided in the `view` attribute of 
         :class:`GameApp`. See the documentation of that class for more information.
+        
+        :param retained: whether to keep the commands drawn from one frame to the next
+        :type retained:  ``bool``
         """
         FloatLayout.__init__(self)
         self._frame = InstructionGroup()
+        self._retained = retained
+        self._drawn = []
+        self._next = []
         self.bind(pos=self._reset)
         self.bind(size=self._reset)
         self._reset()
@@ -353,19 +380,54 @@ class GView(FloatLayout):
         :param cmd: the command to draw
         :type cmd:  A Kivy graphics command
         """
-        self._frame.add(cmd)
+        if self._retained:
+            self._next.append(cmd)
+        else:
+            self._frame.add(cmd)
     
     def clear(self):
         """
         Clears the contents of the view.
         
         This method is called for you automatically at the start of the animation
-        frame.  That way, you are not drawing images on top of one another.
+        frame.  That way, you are not drawing images on top of one another.  In 
+        retained mode, this only starts a new (empty) list of commands for the frame.
         """
-        self._frame.clear()
+        if self._retained:
+            self._next = []
+        else:
+            self._frame.clear()
     
     
     # HIDDEN METHODS
+    def _flush(self):
+        """
+        Brings the canvas up to date with the commands drawn in this frame.
+        
+        This method is called for you automatically at the end of the animation frame.
+        It does nothing unless the view is in retained mode.  The commands drawn in 
+        both frames at the start and at the end of the list are left alone; only the
+        ones in between are swapped.
+        """
+        if not self._retained or self._next == self._drawn:
+            return
+        
+        drawn = self._drawn
+        fresh = self._next
+        size = min(len(drawn),len(fresh))
+        first = 0
+        while first < size and drawn[first] is fresh[first]:
+            first += 1
+        last = 0
+        while last < size-first and drawn[-1-last] is fresh[-1-last]:
+            last += 1
+        
+        for cmd in drawn[first:len(drawn)-last]:
+            self._frame.remove(cmd)
+        for pos in range(first,len(fresh)-last):
+            self._frame.insert(pos,fresh[pos])
+        self._drawn = fresh
+    
     def _reset(self,obj=None,value=None):
         """
         Resets the view canvas in response to a resizing event
@@ -0,0 +1,114 @@
+"""
+Heads-up display module for Alien Invaders
+
+This module contains the class Hud, which keeps the labels for the score, level,
+lives and sound setting, and the message shown in the middle of the screen.
+
+Author: agent (agent@local)
+Date: October 18, 2026
+"""
+from game2d import *
+from consts import *
+
+# PRIMARY RULE: Hud may only access consts.py and game2d.  Like Wave, it is NOT allowed
+# to access anything in app.py.
+
+
+class Hud(object):
+    """
+    This class shows the text of Alien Invaders.
+
+    INSTANCE ATTRIBUTES:
+        _score:   the label showing the score of the player [GBitmapText]
+        _level:   the label showing the level the player is on [GBitmapText]
+        _lives:   the label showing how many lives the player has [GBitmapText]
+        _sound:   the label showing whether sound is on or not [GBitmapText]
+        _message: the message in the middle of the screen [GText]
+    """
+
+    def __init__(self):
+        """
+        Initializer: creates the labels, with no text
+        """
+        top=GAME_HEIGHT-ALIEN_CEILING/2
+        self._score=self._makeLabel(LABEL_DX_APART,top)
+        self._level=self._makeLabel(GAME_WIDTH/2-LABEL_DX_APART,top)
+        self._lives=self._makeLabel(GAME_WIDTH/2+LABEL_DX_APART,top)
+        self._sound=self._makeLabel(GAME_WIDTH-LABEL_DX_APART,top)
+        self._message=GText(text='',font_size=40,font_name=LABEL_FONT,x=400,y=400)
+
+
+    def setStats(self, score, level, lives, soundOn):
+        """
+        Sets the labels along the top of the screen
+
+        Only the labels whose value changed show new text.
+
+        Parameter score: the score of the player
+        Precondition: score is an int >= 0
+
+        Parameter level: the level the player is on
+        Precondition: level is an int >= 1
+
+        Parameter lives: how many lives the player has
+        Precondition: lives is an int >= 0
+
+        Parameter soundOn: whether sound is on
+        Precondition: soundOn is a bool
+        """
+        self._score.text='Score: '+repr(score)
+        self._level.text='Level: '+repr(level)
+        self._lives.text='Lives: '+repr(lives)
+        self._sound.text='Sound: '+('ON' if soundOn else 'OFF')
+
+
+    def setMessage(self, text, size=40):
+        """
+        Sets the message in the middle of the screen
+
+        Parameter text: the message
+        Precondition: text is a string
+
+        Parameter size: the font size of the message
+        Precondition: size is an int > 0
+        """
+        self._message.text=text
+        self._message.font_size=size
+
+
+    def drawStats(self, view):
+        """
+        Draws the labels along the top of the screen
+
+        Parameter view: the view of the game
+        Precondition: view is a GView
+        """
+        self._score.draw(view)
+        self._lives.draw(view)
+        self._level.draw(view)
+        self._sound.draw(view)
+
+
+    def drawMessage(self, view):
+        """
+        Draws the message in the middle of the screen
+
+        Parameter view: the view of the game
+        Precondition: view is a GView
+        """
+        self._message.draw(view)
+
+
+    # HELPER METHODS
+
+    def _makeLabel(self, x, y):
+        """
+        Returns: a new label along the top, centered at (x,y), with no text
+
+        Parameter x: the x coordinate of the label center
+        Precondition: x is a number (int or float)
+
+        Parameter y: the y coordinate of the label center
+        Precondition: y is a number (int or float)
+        """
+        return GBitmapText(text='',font_size=LABEL_FONT_SIZE,font_name=LABEL_FONT,x=x,y=y)
@@ -19,6 +19,11 @@ You are free to add even more models to this module.  You may wish to do this wh
 add new features to your game, such as power-ups.  If you are unsure about whether to 
 make a new class or not, please ask on Piazza.
 
+The rules of the game (movement, firing, collisions) live in simulation.py, which has
+no graphics.  The classes here are only what Wave draws to show that simulation.
+The aliens have no class of their own, as Wave draws the whole Formation of
+formation.py as batches (see GBatch in game2d).
+
 Author: Jane Zhang (jz393)
 Date: December 3, 2017
 """
@@ -33,44 +38,11 @@ from game2d import *
 
 class Ship(GImage):
     """
-    A class to represent the game ship.
-    
-    At the very least, you want a __init__ method to initialize the ships dimensions.
-    These dimensions are all specified in consts.py.
-    
-    You should probably add a method for moving the ship.  While moving a ship just means
-    changing the x attribute (which you can do directly), you want to prevent the player
-    from moving the ship offscreen.  This is an ideal thing to do in a method.
-    
-    You also MIGHT want to add code to detect a collision with a bolt. We do not require
-    this.  You could put this method in Wave if you wanted to.  But the advantage of 
-    putting it here is that Ships and Aliens collide with different bolts.  Ships 
-    collide with Alien bolts, not Ship bolts.  And Aliens collide with Ship bolts, not 
-    Alien bolts. An easy way to keep this straight is for this class to have its own 
-    collision method.
-    
-    However, there is no need for any more attributes other than those inherited by
-    GImage. You would only add attributes if you needed them for extra gameplay
-    features (like animation). If you add attributes, list them below.
+    A class to represent the game ship on screen.
     
-    LIST MORE ATTRIBUTES (AND THEIR INVARIANTS) HERE IF NECESSARY
+    The position of the ship is decided by the ShipState in simulation.py.  Wave
+    copies it over to this object before the ship is drawn.
     """
-    # GETTERS AND SETTERS (ONLY ADD IF YOU NEED THEM)
-    
-    def getXPos(self):
-        """
-        Returns attribute x of Ship
-        """
-        return self.x
-    
-    
-    def getYPos(self):
-        """
-        Returns attribute y of Ship
-        """
-        return self.y
-    
-    
     # INITIALIZER TO CREATE A NEW SHIP
     
     def __init__(self,x1,y1,width1,height1,source1):
@@ -95,312 +67,32 @@ class Ship(GImage):
         
         """
         super().__init__(x=x1,y=y1,width=width1,height=height1,source=source1)
-    
-    
-    # METHODS TO MOVE THE SHIP AND CHECK FOR COLLISIONS
-    
-    def collides(self, bolt):
-        """
-        Returns: True if the bolt was fired by the alien and
-        collides with this ship
-            
-        Parameter bolt: The laser bolt to check
-        Precondition: bolt is of class Bolt
-        """
-        
-        boolean=False
-        if bolt.isPlayerBolt():
-            return boolean
-        
-        #top left
-        elif self.contains((bolt.getXPos()-(BOLT_WIDTH/2),
-                         bolt.getYPos()+(BOLT_HEIGHT/2))): 
-            boolean=True
-        #top right
-        elif self.contains((bolt.getXPos()+(BOLT_WIDTH/2),
-                           bolt.getYPos()+(BOLT_HEIGHT/2))): 
-            boolean=True
-        #bottom left
-        elif self.contains((bolt.getXPos()-(BOLT_WIDTH/2),
-                           bolt.getYPos()-(BOLT_HEIGHT/2))): 
-            boolean=True
-        #bottom right
-        elif self.contains((bolt.getXPos()+(BOLT_WIDTH/2),
-                           bolt.getYPos()-(BOLT_HEIGHT/2))): 
-            boolean=True
-        
-        return boolean
-    
-    
-    def moveXPos(self, dx):
-        """
-        Moves x position of the ship dx positions to the left
-        if dx is negative, to the right if dx is positive,
-        called in moveShip function in wave class 
-        
-        Parameter dx: how much the x value is to shift
-        Precondition: dx is an int 
-        """
-        newval=max(0.5*SHIP_WIDTH, self.x+dx)
-        newval=min(newval, GAME_WIDTH-0.5*SHIP_WIDTH)
-        self.x=newval
-        
-
-class Alien(GImage):
-    """
-    A class to represent a single alien.
-    
-    At the very least, you want a __init__ method to initialize the alien dimensions.
-    These dimensions are all specified in consts.py.
-    
-    You also MIGHT want to add code to detect a collision with a bolt. We do not require
-    this.  You could put this method in Wave if you wanted to.  But the advantage of 
-    putting it here is that Ships and Aliens collide with different bolts.  Ships 
-    collide with Alien bolts, not Ship bolts.  And Aliens collide with Ship bolts, not 
-    Alien bolts. An easy way to keep this straight is for this class to have its own 
-    collision method.
-    
-    However, there is no need for any more attributes other than those inherited by
-    GImage. You would only add attributes if you needed them for extra gameplay
-    features (like giving each alien a score value). If you add attributes, list
-    them below.
-    
-    LIST MORE ATTRIBUTES (AND THEIR INVARIANTS) HERE IF NECESSARY
-    _lastXPos: the alien's X position in the previous frame [0<int<GAME_WIDTH]
-    _score: the score killing the alien will bring [int>0]
-    """
-    # GETTERS AND SETTERS (ONLY ADD IF YOU NEED THEM)
-    
-    def getScore(self):
-        """
-        Returns score alien is worth
-        """
-        return self._score
-    
-    
-    def getXPos(self):
-        """
-        Returns attribute x of alien
-        """
-        return self.x
-    
-    
-    def getYPos(self):
-        """
-        Returns attribute y of alien
-        """
-        return self.y
-    
-    
-    def setLastXPos(self, x):
-        """
-        Sets _lastXPos to x
-        
-        This function saves the alien's previous x position
-        into an attribute
-        
-        Parameter x: the alien's last x position
-        Precondition: x is an int in the bounds of
-        game window
-        """
-        self._lastXPos=x
-    
-    
-    def getLastXPos(self):
-        """
-        Returns attribute _lastXPos
-        """
-        return self._lastXPos
-    
-    
-    # INITIALIZER TO CREATE AN ALIEN
-    
-    def __init__(self,x1,y1,width1,height1,source1, score):
-        """
-        Initializer: creates a new alien
-        
-        Parameter x1: The alien's x coordinate
-        Precondition: x1 is an int > 0
-        
-        Parameter y1: The alien's y coordinate
-        Precondition: y1 is an int > 0
-        
-        Parameter width1: The window width
-        Precondition: width1 is a float > 0
-        
-        Parameter height1: The window height
-        Precondition: height1 is a float > 0.
-        
-        Parameter source1: The alien's photo file name
-        Precondition: source1 is a string
-            e.g. 'alien1.png'
-        
-        """
-        super().__init__(x=x1,y=y1,width=width1,height=height1,source=source1)
-        self.setLastXPos(x1)
-        self._score=score
-    
         
-    # METHOD TO CHECK FOR COLLISION (IF DESIRED)
-    
-    def collides(self, bolt):
-        """
-        Returns: True if the bolt was fired by the player and
-        collides with this alien
-            
-        Parameter bolt: The laser bolt to check
-        Precondition: bolt is of class Bolt
-        """
-        
-        boolean=False
-        
-        if not bolt.isPlayerBolt():
-            return boolean
-        
-        #top left
-        if self.contains((bolt.getXPos()-(BOLT_WIDTH/2),
-                         bolt.getYPos()+(BOLT_HEIGHT/2))): 
-            boolean=True
-        #top right
-        elif self.contains((bolt.getXPos()+(BOLT_WIDTH/2),
-                           bolt.getYPos()+(BOLT_HEIGHT/2))): 
-            boolean=True
-        #bottom left
-        elif self.contains((bolt.getXPos()-(BOLT_WIDTH/2),
-                           bolt.getYPos()-(BOLT_HEIGHT/2))): 
-            boolean=True
-        #bottom right
-        elif self.contains((bolt.getXPos()+(BOLT_WIDTH/2),
-                           bolt.getYPos()-(BOLT_HEIGHT/2))): 
-            boolean=True
-        
-        return boolean
-    
-    
-    # ADD MORE METHODS (PROPERLY SPECIFIED) AS NECESSARY
-    
-    def moveXPos(self, dx):
-        """
-        Moves position of the alien dx positions to the left
-        if dx is negative, to the right if dx is positive,
-        called in moveAlien function in wave class 
-        
-        Parameter dx: how much the x value is to shift
-        Precondition: dx is an int 
-        """
-        self.x=self.x+dx
-    
-        
-    def moveYPos(self, dy):
-        """
-        Moves position of the alien dy positions to the left
-        if dx is negative, to the right if dx is positive,
-        called in moveAlien function in wave class 
-        
-        Parameter dy: how much the y value is to shift
-        Precondition: dy is an int 
-        """
-        self.y=self.y+dy
-
 
 class Bolt(GRectangle):
     """
-    A class representing a laser bolt.
-    
-    Laser bolts are often just thin, white rectangles.  The size of the bolt is 
-    determined by constants in consts.py. We MUST subclass GRectangle, because we
-    need to add an extra attribute for the velocity of the bolt.
-    
-    The class Wave will need to look at these attributes, so you will need getters for 
-    them.  However, it is possible to write this assignment with no setters for the 
-    velocities.  That is because the velocity is fixed and cannot change once the bolt
-    is fired.
-    
-    In addition to the getters, you need to write the __init__ method to set the starting
-    velocity. This __init__ method will need to call the __init__ from GRectangle as a 
-    helper.
+    A class representing a laser bolt on screen.
     
-    You also MIGHT want to create a method to move the bolt.  You move the bolt by adding
-    the velocity to the y-position.  However, the getter allows Wave to do this on its
-    own, so this method is not required.
-    
-    INSTANCE ATTRIBUTES:
-        _velocity: The velocity in y direction [int or float]
-        _isPlayerBolt: boolean value, True if originally came from ship,
-                        False if came from alien
-    LIST MORE ATTRIBUTES (AND THEIR INVARIANTS) HERE IF NECESSARY
+    Laser bolts are thin, blue rectangles.  The size and color of the bolt are 
+    determined by constants in consts.py.  The bolts themselves are slots in the 
+    BoltPool of bolts.py.  Wave keeps one Bolt for each slot, and copies the position 
+    of the slot over to it before the bolt is drawn.
     """
-
-    # GETTERS AND SETTERS (ONLY ADD IF YOU NEED THEM)
-
-    def getVelocity(self):
-        """
-        Returns _velocity attribute of bolt
-        """
-        return self._velocity
-
-    
-    def getXPos(self):
-        """
-        Returns attribute x of bolt
-        """
-        return self.x
-
-    
-    def getYPos(self):
-        """
-        Returns attribute y of bolt
-        """
-        return self.y
-
     
-    def isPlayerBolt(self):
-        """
-        Getter method that returns attribute
-        _isPlayerBolt
-        """
-        return self._isPlayerBolt
-
+    # INITIALIZER
     
-    # INITIALIZER TO SET THE VELOCITY
-
-    def __init__(self, x, y, isPlayerBolt):
+    def __init__(self, x, y):
         """
-        Initializer: creates a new Bolt to be fired at the aliens
+        Initializer: creates a new Bolt to draw
         
         Parameter x: the starting x coordinate of the bolt
         Precondition: x is an number within the range of GAME_WIDTH
         
         Parameter y: the starting y coordinate of the bolt
         Precondition: y is an number within the range of GAME_HEIGHT
-       
-        Parameter isPlayerBolt: True if bolt originally
-        came from ship, False if came from alien
-        Precondition: isPlayerBolt is a bool
         """
-        self._isPlayerBolt=isPlayerBolt
-        
-        if isPlayerBolt:
-            self._velocity=BOLT_SPEED
-        else:
-            self._velocity=-BOLT_SPEED
-        
         super().__init__(x=x,y=y,
-                         width=BOLT_WIDTH,height=BOLT_HEIGHT,fillcolor='blue')
-
-    
-    # ADD MORE METHODS (PROPERLY SPECIFIED) AS NECESSARY
-
-    def moveYPos(self, dy):
-        """
-        Moves position of the bolt dy positions to the left
-        if dx is negative, to the right if dx is positive,
-        called as helper in moveBolts function in wave class 
-        
-        Parameter dy: how much the y value is to shift
-        Precondition: dy is an int 
-        """
-        self.y=self.y+dy
+                         width=BOLT_WIDTH,height=BOLT_HEIGHT,fillcolor=BOLT_COLOR)
 
 
 # IF YOU NEED ADDITIONAL MODEL CLASSES, THEY GO HERE
@@ -429,4 +121,3 @@ class DefenseLine(GPath):
         super().__init__(points=[0,DEFENSE_LINE,GAME_WIDTH,DEFENSE_LINE]
                         , y=DEFENSE_LINE, linecolor='black', linewidth=1)
         
-    
\ No newline at end of file
@@ -0,0 +1,420 @@
+"""
+Software rasterizer module for Alien Invaders
+
+This module draws the state of a WaveSim into a NumPy framebuffer, with no window, for
+pixel observations and thumbnails.  It also contains the small PNG reader and writer
+that load the images and save frames.
+
+Author: agent (agent@local)
+Date: October 18, 2026
+"""
+from consts import *
+import numpy as np
+import struct
+import zlib
+import os
+
+# The folder with the game images
+_IMAGE_FOLDER=os.path.join(os.path.dirname(os.path.abspath(__file__)),'Images')
+# The number of channels for each PNG color type
+_PNG_CHANNELS={0:1,2:3,3:1,4:2,6:4}
+
+
+def readPNG(filename):
+    """
+    Returns: the image in a PNG file, as a uint8 array (height, width, 4) of RGBA
+
+    Only 8-bit, non-interlaced images are supported (every image in the Images
+    folder is one).
+
+    Parameter filename: the name of the file to read
+    Precondition: filename is a string naming an 8-bit, non-interlaced PNG file
+    """
+    with open(filename,'rb') as file:
+        data=file.read()
+    assert data[:8]==b'\x89PNG\r\n\x1a\n', '%s is not a PNG file' % repr(filename)
+
+    pos=8
+    idat=[]
+    palette=None
+    transparency=None
+    while pos<len(data):
+        length,kind=struct.unpack_from('>I4s',data,pos)
+        body=data[pos+8:pos+8+length]
+        pos+=12+length
+        if kind==b'IHDR':
+            width,height,depth,color,_,_,interlace=struct.unpack('>IIBBBBB',body)
+        elif kind==b'PLTE':
+            palette=np.frombuffer(body,dtype=np.uint8).reshape(-1,3)
+        elif kind==b'tRNS':
+            transparency=np.frombuffer(body,dtype=np.uint8)
+        elif kind==b'IDAT':
+            idat.append(body)
+        elif kind==b'IEND':
+            break
+    assert depth==8 and interlace==0, '%s is not an 8-bit, non-interlaced PNG' % repr(filename)
+
+    channels=_PNG_CHANNELS[color]
+    pixels=_unfilter(zlib.decompress(b''.join(idat)),width,height,channels)
+    pixels=pixels.reshape(height,width,channels)
+
+    rgba=np.empty((height,width,4),dtype=np.uint8)
+    rgba[...,3]=255
+    if color==0 or color==4:
+        rgba[...,:3]=pixels[...,:1]
+        if color==4:
+            rgba[...,3]=pixels[...,1]
+    elif color==2 or color==6:
+        rgba[...,:channels]=pixels
+    else:
+        index=pixels[...,0]
+        rgba[...,:3]=palette[index]
+        if transparency is not None:
+            alpha=np.full(256,255,dtype=np.uint8)
+            alpha[:len(transparency)]=transparency
+            rgba[...,3]=alpha[index]
+    return rgba
+
+
+def writePNG(filename, rgba):
+    """
+    Writes an image to a PNG file, as 8-bit RGBA with no filtering
+
+    Parameter filename: the name of the file to write
+    Precondition: filename is a string naming a file that can be written
+
+    Parameter rgba: the image
+    Precondition: rgba is a uint8 array (height, width, 4) of RGBA
+    """
+    height,width=rgba.shape[:2]
+    raw=np.zeros((height,1+4*width),dtype=np.uint8)
+    raw[:,1:]=rgba.reshape(height,4*width)
+    with open(filename,'wb') as file:
+        file.write(b'\x89PNG\r\n\x1a\n')
+        file.write(_pngChunk(b'IHDR',struct.pack('>IIBBBBB',width,height,8,6,0,0,0)))
+        file.write(_pngChunk(b'IDAT',zlib.compress(raw.tobytes(),9)))
+        file.write(_pngChunk(b'IEND',b''))
+
+
+def _pngChunk(kind, body):
+    """
+    Returns: the bytes of a PNG chunk, with its length and CRC
+
+    Parameter kind: the chunk type
+    Precondition: kind is a 4-byte bytes object
+
+    Parameter body: the chunk data
+    Precondition: body is a bytes object
+    """
+    return struct.pack('>I',len(body))+kind+body+struct.pack('>I',zlib.crc32(kind+body))
+
+
+def _unfilter(raw, width, height, channels):
+    """
+    Returns: the pixel bytes of a PNG image, as a flat uint8 array, after
+    undoing the filter of each row
+
+    Parameter raw: the decompressed image data (a filter byte, then the row)
+    Precondition: raw is a bytes object
+
+    Parameter width: the width of the image in pixels
+    Precondition: width is an int > 0
+
+    Parameter height: the height of the image in pixels
+    Precondition: height is an int > 0
+
+    Parameter channels: the number of bytes per pixel
+    Precondition: channels is an int in 1..4
+    """
+    stride=width*channels
+    out=np.zeros((height+1,stride),dtype=np.int32)
+    rows=np.frombuffer(raw,dtype=np.uint8).reshape(height,stride+1)
+    for y in range(height):
+        kind=rows[y,0]
+        line=rows[y,1:].astype(np.int32)
+        up=out[y]
+        if kind==0:
+            out[y+1]=line
+        elif kind==1:
+            pixels=line.reshape(width,channels)
+            out[y+1]=(np.cumsum(pixels,axis=0)%256).ravel()
+        elif kind==2:
+            out[y+1]=(line+up)%256
+        else:
+            # Average and Paeth depend on the byte just decoded, so go byte by byte
+            row=out[y+1]
+            for x in range(stride):
+                left=row[x-channels] if x>=channels else 0
+                above=up[x]
+                if kind==3:
+                    guess=(left+above)//2
+                else:
+                    corner=up[x-channels] if x>=channels else 0
+                    p=left+above-corner
+                    pa,pb,pc=abs(p-left),abs(p-above),abs(p-corner)
+                    if pa<=pb and pa<=pc:
+                        guess=left
+                    elif pb<=pc:
+                        guess=above
+                    else:
+                        guess=corner
+                row[x]=(line[x]+guess)%256
+    return out[1:].astype(np.uint8).ravel()
+
+
+class Rasterizer(object):
+    """
+    A class that draws the state of a wave into a framebuffer.
+
+    The framebuffer has a margin of _margin pixels on every side, so that a sprite
+    partly outside the frame can be copied without clipping.  The frame is the
+    view of the framebuffer inside that margin.
+
+    INSTANCE ATTRIBUTES:
+        _width:   the width of the frame in pixels [int > 0]
+        _height:  the height of the frame in pixels [int > 0]
+        _scaleX:  pixels per game unit, horizontally [float > 0]
+        _scaleY:  pixels per game unit, vertically [float > 0]
+        _margin:  the width of the margin around the frame [int >= 0]
+        _buffer:  the framebuffer, with its margin
+                  [uint8 array (height+2*margin, width+2*margin, 3)]
+        _frame:   the frame, a view of _buffer [uint8 array (height, width, 3)]
+        _aliens:  the sprite of each image in ALIEN_IMAGES, scaled, by the alien
+                  (width, height) of a formation [dict of lists of sprites]
+        _ship:    the ship sprite, scaled [sprite]
+        _boltColor: the color of the bolts [uint8 array (3,)]
+
+    A sprite is a tuple (color, alpha, dy, dx): color is the premultiplied color
+    [float array (h,w,3)], alpha is 1 minus the opacity [float array (h,w,1)],
+    and dy, dx are the pixel offsets of the sprite [int arrays (h,1) and (1,w)].
+    """
+
+    # GETTERS AND SETTERS
+
+    def getSize(self):
+        """
+        Returns the (width, height) of the frame in pixels
+        """
+        return (self._width,self._height)
+
+
+    # INITIALIZER
+
+    def __init__(self, width=GAME_WIDTH//8, height=GAME_HEIGHT//8):
+        """
+        Initializer: creates a rasterizer for frames of the given size
+
+        Parameter width: the width of the frame in pixels
+        Precondition: width is an int > 0
+
+        Parameter height: the height of the frame in pixels
+        Precondition: height is an int > 0
+        """
+        self._width=width
+        self._height=height
+        self._scaleX=width/GAME_WIDTH
+        self._scaleY=height/GAME_HEIGHT
+        aliens=[self._loadSprite(name,ALIEN_WIDTH,ALIEN_HEIGHT) for name in ALIEN_IMAGES]
+        self._aliens={(ALIEN_WIDTH,ALIEN_HEIGHT):aliens}
+        self._ship=self._loadSprite('ship.png',SHIP_WIDTH,SHIP_HEIGHT)
+        self._boltColor=np.array([round(255*c) for c in BOLT_COLOR[:3]],dtype=np.uint8)
+
+        # formations are never scaled up, so full size aliens are the largest
+        self._margin=max(self._ship[0].shape[0],self._ship[0].shape[1],
+                         aliens[0][0].shape[0],aliens[0][0].shape[1])
+        m=self._margin
+        self._buffer=np.empty((height+2*m,width+2*m,3),dtype=np.uint8)
+        self._frame=self._buffer[m:m+height,m:m+width]
+
+
+    # PUBLIC METHODS
+
+    def draw(self, sim):
+        """
+        Returns: the frame for the current state of a wave, as a uint8 array
+        (height, width, 3) of RGB
+
+        The array is reused by the next call to draw.  Copy it to keep it.
+
+        Parameter sim: the wave to draw
+        Precondition: sim is a WaveSim
+        """
+        self._buffer[...]=255
+
+        # the defense line
+        m=self._margin
+        row=m+min(int((GAME_HEIGHT-DEFENSE_LINE)*self._scaleY),self._height-1)
+        self._buffer[row,m:m+self._width]=0
+
+        formation=sim.getFormation()
+        size=(formation.getAlienWidth(),formation.getAlienHeight())
+        if not size in self._aliens:
+            self._aliens[size]=[self._loadSprite(name,size[0],size[1])
+                                for name in ALIEN_IMAGES]
+        aliens=self._aliens[size]
+        alive=formation.getAlive()
+        images=formation.getImages()
+        xs=formation.getXs()
+        ys=formation.getYs()
+        for image in range(len(aliens)):
+            which=alive & (images==image)
+            if which.any():
+                self._blit(aliens[image],xs[which],ys[which])
+
+        ship=sim.getShip()
+        if ship is not None:
+            self._blit(self._ship,np.array([ship.getXPos()]),np.array([ship.getYPos()]))
+
+        pool=sim.getBolts()
+        if pool.getSize()>0:
+            self._fillRects(pool.getXs(),pool.getYs(),BOLT_WIDTH,BOLT_HEIGHT,
+                            self._boltColor)
+        return self._frame
+
+
+    # HELPER METHODS
+
+    def _loadSprite(self, name, width, height):
+        """
+        Returns: the sprite of an image, scaled (nearest neighbor) to the size of
+        an object width by height in the game
+
+        Parameter name: the file name of the image in the Images folder
+        Precondition: name is a string naming an 8-bit PNG file
+
+        Parameter width: the width of the object in the game
+        Precondition: width is a number > 0
+
+        Parameter height: the height of the object in the game
+        Precondition: height is a number > 0
+        """
+        image=readPNG(os.path.join(_IMAGE_FOLDER,name))
+        w=max(1,round(width*self._scaleX))
+        h=max(1,round(height*self._scaleY))
+        rows=(np.arange(h)*image.shape[0])//h
+        cols=(np.arange(w)*image.shape[1])//w
+        image=image[rows[:,None],cols[None,:]].astype(np.float32)
+        opacity=image[...,3:]/255
+        return (image[...,:3]*opacity,1-opacity,
+                np.arange(h)[:,None],np.arange(w)[None,:])
+
+
+    def _corners(self, xs, ys, width, height):
+        """
+        Returns: the (top, left) pixel in the framebuffer of objects centered at
+        (xs, ys) in the game, each an int array, clamped so that objects of up
+        to the margin in size stay inside the framebuffer
+
+        Parameter xs: the x coordinates of the object centers
+        Precondition: xs is a float array
+
+        Parameter ys: the y coordinates of the object centers
+        Precondition: ys is a float array (same shape as xs)
+
+        Parameter width: the width of the objects in pixels
+        Precondition: width is an int > 0
+
+        Parameter height: the height of the objects in pixels
+        Precondition: height is an int > 0
+        """
+        m=self._margin
+        left=np.rint(xs*self._scaleX-width/2).astype(np.int64)+m
+        top=np.rint((GAME_HEIGHT-ys)*self._scaleY-height/2).astype(np.int64)+m
+        np.clip(left,0,self._width+m,out=left)
+        np.clip(top,0,self._height+m,out=top)
+        return (top,left)
+
+
+    def _blit(self, sprite, xs, ys):
+        """
+        Copies a sprite into the framebuffer, centered at each (x, y) in the game
+
+        The copies may overlap (the sprites of a swarm are at least a pixel, and
+        may be larger than the spacing of the formation).  They are copied in
+        layers from _layers, so that each copy is blended over the ones before it.
+
+        Parameter sprite: the sprite to copy
+        Precondition: sprite is a sprite made by _loadSprite
+
+        Parameter xs: the x coordinates of the copies
+        Precondition: xs is a 1d float array
+
+        Parameter ys: the y coordinates of the copies
+        Precondition: ys is a 1d float array (same length as xs)
+        """
+        color,alpha,dy,dx=sprite
+        top,left=self._corners(xs,ys,color.shape[1],color.shape[0])
+        for layer in self._layers(top,left,color.shape[1],color.shape[0]):
+            rows=top[layer,None,None]+dy[None]
+            cols=left[layer,None,None]+dx[None]
+            under=self._buffer[rows,cols]
+            self._buffer[rows,cols]=(under*alpha+color).astype(np.uint8)
+
+
+    def _layers(self, top, left, width, height):
+        """
+        Returns: a list of index arrays that splits copies of a sprite into layers,
+        where no two copies in a layer overlap
+
+        The framebuffer is cut into cells the size of the sprite.  A copy only
+        overlaps copies whose corner is in the same cell or in a neighboring one.
+        So copies are split by the parity of the row and column of their cell, and
+        by their rank among the copies in the same cell.  A formation that is not
+        packed tighter than its sprites has one copy per cell, and at most four
+        layers.
+
+        Parameter top: the top pixel of each copy
+        Precondition: top is a 1d int array >= 0
+
+        Parameter left: the left pixel of each copy
+        Precondition: left is a 1d int array >= 0 (same length as top)
+
+        Parameter width: the width of the sprite in pixels
+        Precondition: width is an int > 0
+
+        Parameter height: the height of the sprite in pixels
+        Precondition: height is an int > 0
+        """
+        if len(top)<2:
+            return [np.arange(len(top))]
+        cellY=top//height
+        cellX=left//width
+        cells=cellY*(self._buffer.shape[1]//width+1)+cellX
+        order=np.argsort(cells,kind='stable')
+        ordered=cells[order]
+        first=np.flatnonzero(np.concatenate(([True],ordered[1:]!=ordered[:-1])))
+        sizes=np.diff(np.append(first,len(ordered)))
+        rank=np.empty(len(cells),dtype=np.int64)
+        rank[order]=np.arange(len(ordered))-np.repeat(first,sizes)
+        layers=4*rank+2*(cellY%2)+cellX%2
+        order=np.argsort(layers,kind='stable')
+        ordered=layers[order]
+        cuts=np.flatnonzero(ordered[1:]!=ordered[:-1])+1
+        return np.split(order,cuts)
+
+
+    def _fillRects(self, xs, ys, width, height, color):
+        """
+        Fills rectangles of one color, centered at each (x, y) in the game
+
+        Parameter xs: the x coordinates of the rectangles
+        Precondition: xs is a 1d float array
+
+        Parameter ys: the y coordinates of the rectangles
+        Precondition: ys is a 1d float array (same length as xs)
+
+        Parameter width: the width of the rectangles in the game
+        Precondition: width is a number > 0
+
+        Parameter height: the height of the rectangles in the game
+        Precondition: height is a number > 0
+
+        Parameter color: the fill color
+        Precondition: color is a uint8 array (3,)
+        """
+        w=max(1,round(width*self._scaleX))
+        h=max(1,round(height*self._scaleY))
+        top,left=self._corners(xs,ys,w,h)
+        rows=top[:,None,None]+np.arange(h)[None,:,None]
+        cols=left[:,None,None]+np.arange(w)[None,None,:]
+        self._buffer[rows,cols]=color
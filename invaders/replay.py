@@ -0,0 +1,594 @@
+"""
+Replay module for Alien Invaders
+
+This module records and plays back games, as the settings of the session and the keys
+of every tick.  Replay files are written in chunks, each starting with a snapshot of
+the session, so that a ReplayReader can jump to any tick.  Running this module as a
+script plays back a replay file as fast as possible, or with --check, checks that
+seeking in a recorded replay gives back the exact recorded states:
+
+    python replay.py game.rpl
+    python replay.py --check [seed]
+
+Author: agent (agent@local)
+Date: October 18, 2026
+"""
+from consts import *
+from difficulty import *
+from session import *
+import numpy as np
+import random
+import struct
+import mmap
+import time
+import os
+import tempfile
+
+# The header of a replay file: magic, version, seed, ticks per chunk
+_REPLAY_HEADER=struct.Struct('<4sHQI')
+_REPLAY_MAGIC=b'INVR'
+_REPLAY_VERSION=3
+# The difficulty settings, right after the header: rows, cols, speed, boltRate,
+# levelSpeed, alienSpeed, scale
+_REPLAY_DIFFICULTY=struct.Struct('<iididdd')
+# The header of a chunk: magic, first tick, keyframe size, number of ticks
+_CHUNK_HEADER=struct.Struct('<4sQII')
+_CHUNK_MAGIC=b'CHNK'
+# An entry of the seek index: first tick of the chunk, file offset of the chunk
+_INDEX_ENTRY=np.dtype([('tick','<u8'),('offset','<u8')])
+# The footer of a replay file: index offset, number of ticks, number of chunks, magic
+_REPLAY_FOOTER=struct.Struct('<QQI4s')
+_FOOTER_MAGIC=b'INVX'
+
+
+class Replay(object):
+    """
+    A class representing the recorded input of one play session.
+
+    INSTANCE ATTRIBUTES:
+        _seed: the seed of the random source of the session [int in 0..2**64-1]
+        _difficulty: the difficulty settings of the session [Difficulty]
+        _keys: the keys held down in each tick, in order [bytearray]
+    """
+
+    # GETTERS AND SETTERS
+
+    def getSeed(self):
+        """
+        Returns the seed of the random source of the session
+        """
+        return self._seed
+
+
+    def getDifficulty(self):
+        """
+        Returns the difficulty settings of the session
+        """
+        return self._difficulty
+
+
+    def getLength(self):
+        """
+        Returns the number of ticks in the replay
+        """
+        return len(self._keys)
+
+
+    def getKeys(self, tick):
+        """
+        Returns the keys held down in the given tick, as a bitwise or of KEY constants
+
+        Parameter tick: the tick to look up
+        Precondition: tick is an int in 0..getLength()-1
+        """
+        return self._keys[tick]
+
+
+    def getAllKeys(self):
+        """
+        Returns the keys of every tick, as a bytearray owned by the replay
+        """
+        return self._keys
+
+
+    # INITIALIZER
+
+    def __init__(self, seed=None, keys=b'', difficulty=None):
+        """
+        Initializer: creates a replay
+
+        Parameter seed: the seed of the session (a new random one if None)
+        Precondition: seed is an int in 0..2**64-1 or None
+
+        Parameter keys: the keys of the ticks recorded so far
+        Precondition: keys is a bytes-like object
+
+        Parameter difficulty: the settings of the session (the ones in consts.py if None)
+        Precondition: difficulty is a Difficulty or None
+        """
+        self._seed=random.getrandbits(64) if seed is None else seed
+        self._difficulty=Difficulty() if difficulty is None else difficulty
+        self._keys=bytearray(keys)
+
+
+    # PUBLIC METHODS
+
+    def newSession(self):
+        """
+        Returns: a new GameSession seeded for this replay, with its difficulty settings
+        """
+        return GameSession(random.Random(self._seed),self._difficulty)
+
+
+    def record(self, keys):
+        """
+        Adds a tick to the end of the replay
+
+        Parameter keys: the keys held down in the tick
+        Precondition: keys is an int, a bitwise or of KEY constants
+        """
+        self._keys.append(keys)
+
+
+    def save(self, filename, chunkTicks=600):
+        """
+        Writes the replay to a file
+
+        The game is played back to make the keyframes, so this takes about as
+        long as runReplay.
+
+        Parameter filename: the name of the file to write
+        Precondition: filename is a string
+
+        Parameter chunkTicks: the number of ticks between keyframes
+        Precondition: chunkTicks is an int > 0
+        """
+        writer=ReplayWriter(filename,self._seed,chunkTicks,self._difficulty)
+        session=self.newSession()
+        for keys in self._keys:
+            writer.record(keys,session)
+            session.tick(keys)
+        writer.close()
+
+
+class ReplayWriter(object):
+    """
+    A class that streams a replay to a file while the game is played.
+
+    Call record before every tick, and close when the game is over.  Until then the
+    file has no seek index, and cannot be read.
+
+    INSTANCE ATTRIBUTES:
+        _file:       the file being written [binary file object, or None if closed]
+        _chunkTicks: the number of ticks in a full chunk [int > 0]
+        _length:     the number of ticks recorded so far [int >= 0]
+        _index:      the first tick and file offset of every chunk so far
+                     [list of (int, int) tuples]
+        _chunkTicksAt: the file offset of the tick count in the current chunk
+                     header [int, or None if no chunk was started yet]
+    """
+
+    # GETTERS AND SETTERS
+
+    def getLength(self):
+        """
+        Returns the number of ticks recorded so far
+        """
+        return self._length
+
+
+    # INITIALIZER
+
+    def __init__(self, filename, seed, chunkTicks=600, difficulty=None):
+        """
+        Initializer: creates a new replay file and writes its header
+
+        The header holds the seed and the difficulty settings, so that the
+        session can be made again when the file is read.
+
+        Parameter filename: the name of the file to write
+        Precondition: filename is a string
+
+        Parameter seed: the seed of the session being recorded
+        Precondition: seed is an int in 0..2**64-1
+
+        Parameter chunkTicks: the number of ticks between keyframes
+        Precondition: chunkTicks is an int > 0
+
+        Parameter difficulty: the settings of the session being recorded (the
+        ones in consts.py if None)
+        Precondition: difficulty is a Difficulty or None
+        """
+        difficulty=Difficulty() if difficulty is None else difficulty
+        self._file=open(filename,'wb')
+        self._chunkTicks=chunkTicks
+        self._length=0
+        self._index=[]
+        self._chunkTicksAt=None
+        self._file.write(_REPLAY_HEADER.pack(_REPLAY_MAGIC,_REPLAY_VERSION,seed,chunkTicks))
+        self._file.write(_REPLAY_DIFFICULTY.pack(difficulty.getRows(),difficulty.getCols(),
+                                                 difficulty.getSpeed(),
+                                                 difficulty.getBoltRate(),
+                                                 difficulty.getLevelSpeed(),
+                                                 difficulty.getAlienSpeed(),
+                                                 difficulty.getScale()))
+
+
+    # PUBLIC METHODS
+
+    def record(self, keys, session):
+        """
+        Adds a tick to the replay
+
+        A new chunk (with a keyframe of session) is started every chunkTicks ticks.
+
+        Parameter keys: the keys held down in the tick
+        Precondition: keys is an int, a bitwise or of KEY constants
+
+        Parameter session: the session, right before it plays the tick
+        Precondition: session is a GameSession
+        """
+        if self._length%self._chunkTicks==0:
+            self._startChunk(session)
+        self._file.write(bytes((keys,)))
+        self._length+=1
+
+
+    def close(self):
+        """
+        Finishes the last chunk, writes the seek index and closes the file
+        """
+        if self._file is None:
+            return
+        self._endChunk()
+        indexAt=self._file.tell()
+        self._file.write(np.array(self._index,dtype=_INDEX_ENTRY).tobytes())
+        self._file.write(_REPLAY_FOOTER.pack(indexAt,self._length,len(self._index),
+                                             _FOOTER_MAGIC))
+        self._file.close()
+        self._file=None
+
+
+    # HELPER METHODS
+
+    def _startChunk(self, session):
+        """
+        Ends the current chunk, and starts a new one with a keyframe of session
+
+        Parameter session: the session, right before it plays the first tick
+        of the chunk
+        Precondition: session is a GameSession
+        """
+        self._endChunk()
+        keyframe=session.snapshot()
+        offset=self._file.tell()
+        self._index.append((self._length,offset))
+        self._chunkTicksAt=offset+_CHUNK_HEADER.size-4
+        self._file.write(_CHUNK_HEADER.pack(_CHUNK_MAGIC,self._length,len(keyframe),0))
+        self._file.write(keyframe)
+
+
+    def _endChunk(self):
+        """
+        Fills in the number of ticks in the header of the current chunk
+        """
+        if self._chunkTicksAt is None:
+            return
+        count=self._length-self._index[-1][0]
+        end=self._file.tell()
+        self._file.seek(self._chunkTicksAt)
+        self._file.write(struct.pack('<I',count))
+        self._file.seek(end)
+        self._chunkTicksAt=None
+
+
+class ReplayReader(object):
+    """
+    A class that reads a replay file through a memory map.
+
+    Only the header, footer and seek index are read when the file is opened.  The
+    keys and keyframes are read from the map when they are needed, so opening a 
+    replay and jumping to a late tick costs the same for short and long files.
+
+    INSTANCE ATTRIBUTES:
+        _file:   the open replay file [binary file object, or None if closed]
+        _map:    the memory map of the file [mmap.mmap, or None if closed]
+        _seed:   the seed of the recorded session [int in 0..2**64-1]
+        _difficulty: the difficulty settings of the recorded session [Difficulty]
+        _length: the number of ticks in the replay [int >= 0]
+        _ticks:  the first tick of every chunk [uint64 array (chunks,)]
+        _offsets: the file offset of every chunk [uint64 array (chunks,)]
+    """
+
+    # GETTERS AND SETTERS
+
+    def getSeed(self):
+        """
+        Returns the seed of the recorded session
+        """
+        return self._seed
+
+
+    def getDifficulty(self):
+        """
+        Returns the difficulty settings of the recorded session
+        """
+        return self._difficulty
+
+
+    def getLength(self):
+        """
+        Returns the number of ticks in the replay
+        """
+        return self._length
+
+
+    def getChunkCount(self):
+        """
+        Returns the number of chunks (and keyframes) in the replay
+        """
+        return len(self._ticks)
+
+
+    # INITIALIZER
+
+    def __init__(self, filename):
+        """
+        Initializer: opens a replay file written by ReplayWriter
+
+        Parameter filename: the name of the file to read
+        Precondition: filename is a string naming a replay file
+        """
+        self._file=open(filename,'rb')
+        self._map=mmap.mmap(self._file.fileno(),0,access=mmap.ACCESS_READ)
+        data=self._map
+        magic,version,self._seed,chunkTicks=_REPLAY_HEADER.unpack_from(data,0)
+        assert magic==_REPLAY_MAGIC, '%s is not a replay file' % repr(filename)
+        assert version==_REPLAY_VERSION, 'unsupported replay version %d' % version
+        self._difficulty=Difficulty(*_REPLAY_DIFFICULTY.unpack_from(data,_REPLAY_HEADER.size))
+        
+        footerAt=len(data)-_REPLAY_FOOTER.size
+        indexAt,self._length,chunks,magic=_REPLAY_FOOTER.unpack_from(data,footerAt)
+        assert magic==_FOOTER_MAGIC, '%s was not closed properly' % repr(filename)
+        index=np.frombuffer(data,dtype=_INDEX_ENTRY,count=chunks,offset=indexAt)
+        self._ticks=index['tick'].copy()
+        self._offsets=index['offset'].copy()
+
+
+    # PUBLIC METHODS
+
+    def getKeys(self, start=0, stop=None):
+        """
+        Returns: the keys of the ticks start..stop-1, as bytes
+
+        Parameter start: the first tick
+        Precondition: start is an int in 0..getLength()
+
+        Parameter stop: the tick after the last one (the end of the replay if None)
+        Precondition: stop is None or an int in start..getLength()
+        """
+        stop=self._length if stop is None else stop
+        parts=[]
+        while start<stop:
+            chunk=self._findChunk(start)
+            first,keysAt,count=self._readChunk(chunk)
+            end=min(stop,first+count)
+            parts.append(self._map[keysAt+start-first:keysAt+end-first])
+            start=end
+        return b''.join(parts)
+
+
+    def seek(self, tick):
+        """
+        Returns: a new GameSession in the state it was in right before the
+        given tick (after tick ticks were played)
+
+        The session is restored from the keyframe of the chunk holding the tick,
+        then plays the ticks of that chunk up to the given one.
+
+        Parameter tick: the tick to seek to
+        Precondition: tick is an int in 0..getLength()
+        """
+        if self._length==0:
+            return Replay(self._seed,difficulty=self._difficulty).newSession()
+        
+        chunk=self._findChunk(min(tick,self._length-1))
+        first,keysAt,count=self._readChunk(chunk)
+        keyframeAt=int(self._offsets[chunk])+_CHUNK_HEADER.size
+        session=GameSession(difficulty=self._difficulty)
+        session.restore(memoryview(self._map)[keyframeAt:keysAt])
+        for keys in self._map[keysAt:keysAt+tick-first]:
+            session.tick(keys)
+        return session
+
+
+    def toReplay(self):
+        """
+        Returns: the whole replay, loaded into memory as a Replay
+        """
+        return Replay(self._seed,self.getKeys(),self._difficulty)
+
+
+    def close(self):
+        """
+        Closes the memory map and the file
+        """
+        if self._map is not None:
+            self._map.close()
+            self._file.close()
+            self._map=None
+            self._file=None
+
+
+    # HELPER METHODS
+
+    def _findChunk(self, tick):
+        """
+        Returns: the index of the chunk holding the given tick
+
+        Parameter tick: the tick to find
+        Precondition: tick is an int in 0..getLength()-1
+        """
+        return int(np.searchsorted(self._ticks,tick,side='right'))-1
+
+
+    def _readChunk(self, chunk):
+        """
+        Returns: the tuple (first, keysAt, count) of a chunk, where first is
+        its first tick, keysAt the file offset of its keys and count the
+        number of ticks in it
+
+        Parameter chunk: the index of the chunk
+        Precondition: chunk is an int in 0..getChunkCount()-1
+        """
+        offset=int(self._offsets[chunk])
+        magic,first,size,count=_CHUNK_HEADER.unpack_from(self._map,offset)
+        assert magic==_CHUNK_MAGIC, 'bad chunk at offset %d' % offset
+        return (first,offset+_CHUNK_HEADER.size+size,count)
+
+
+class ReplayPlayer(object):
+    """
+    A class that feeds the ticks of a Replay to a game, one at a time.
+
+    INSTANCE ATTRIBUTES:
+        _replay: the replay being played [Replay]
+        _tick:   the next tick to play [int in 0..replay length]
+    """
+
+    # GETTERS AND SETTERS
+
+    def getReplay(self):
+        """
+        Returns the replay being played
+        """
+        return self._replay
+
+
+    def isDone(self):
+        """
+        Returns True if every tick of the replay has been played
+        """
+        return self._tick>=self._replay.getLength()
+
+
+    # INITIALIZER
+
+    def __init__(self, replay):
+        """
+        Initializer: creates a player at the start of a replay
+
+        Parameter replay: the replay to play
+        Precondition: replay is a Replay
+        """
+        self._replay=replay
+        self._tick=0
+
+
+    # PUBLIC METHODS
+
+    def nextKeys(self):
+        """
+        Returns: the keys of the next tick (0 once the replay is done)
+        """
+        if self.isDone():
+            return 0
+        keys=self._replay.getKeys(self._tick)
+        self._tick+=1
+        return keys
+
+
+def loadReplay(filename):
+    """
+    Returns: the Replay stored in a file written by ReplayWriter or Replay.save
+
+    Parameter filename: the name of the file to read
+    Precondition: filename is a string naming a replay file
+    """
+    reader=ReplayReader(filename)
+    replay=reader.toReplay()
+    reader.close()
+    return replay
+
+
+def runReplay(replay):
+    """
+    Returns: the GameSession after playing every tick of replay, with no
+    window and as fast as possible
+
+    Parameter replay: the replay to play
+    Precondition: replay is a Replay
+    """
+    session=replay.newSession()
+    tick=session.tick
+    for keys in replay.getAllKeys():
+        tick(keys)
+    return session
+
+
+def checkReplay(seed=0, ticks=5000, chunkTicks=256):
+    """
+    Returns: the number of ticks sought, after checking that ReplayReader.seek
+    lands on the exact state of a recorded game
+
+    A seeded game, with random keys that always hold down 's' and a difficulty
+    that is not the default, is written to a temporary replay file.  The session
+    is saved before every tick at a chunk boundary, right next to one, or picked
+    at random.  Seeking to each of those ticks must give back the same snapshot,
+    and playing the whole replay back must end in the final state.  An
+    AssertionError is raised otherwise.
+
+    Parameter seed: the seed of the game and the keys
+    Precondition: seed is an int
+
+    Parameter ticks: the number of ticks to record
+    Precondition: ticks is an int > 0
+
+    Parameter chunkTicks: the number of ticks between keyframes
+    Precondition: chunkTicks is an int > 0
+    """
+    rng=random.Random(seed)
+    keys=[rng.getrandbits(3) | KEY_S for tick in range(ticks)]
+    picks=set(rng.randrange(ticks+1) for pick in range(20))
+    for first in range(0,ticks+1,chunkTicks):
+        picks.update(tick for tick in (first-1,first,first+1) if 0<=tick<=ticks)
+
+    replay=Replay(seed,difficulty=Difficulty(4,9,speed=0.4,boltRate=3))
+    session=replay.newSession()
+    saved={}
+    with tempfile.TemporaryDirectory() as folder:
+        filename=os.path.join(folder,'check.rpl')
+        writer=ReplayWriter(filename,seed,chunkTicks,replay.getDifficulty())
+        for tick in range(ticks):
+            if tick in picks:
+                saved[tick]=session.snapshot()
+            writer.record(keys[tick],session)
+            session.tick(keys[tick])
+        saved[ticks]=session.snapshot()
+        writer.close()
+
+        reader=ReplayReader(filename)
+        assert reader.getKeys()==bytes(keys), 'the keys were not read back'
+        for tick in sorted(picks):
+            assert reader.seek(tick).snapshot()==saved[tick], 'seek(%d) missed' % tick
+        played=runReplay(reader.toReplay())
+        reader.close()
+    assert played.snapshot()==saved[ticks], 'the replay ended in another state'
+    return len(picks)
+
+
+# Script code
+if __name__ == '__main__':
+    import sys
+    if len(sys.argv)>1 and sys.argv[1]=='--check':
+        seed=int(sys.argv[2]) if len(sys.argv)>2 else 0
+        print('replay check passed, %d ticks sought' % checkReplay(seed))
+        sys.exit()
+    replay=loadReplay(sys.argv[1])
+    start=time.perf_counter()
+    session=runReplay(replay)
+    elapsed=max(time.perf_counter()-start,1e-9)
+    print('%d ticks in %.3f s (%.0f ticks/s, %.1fx real time)' %
+          (replay.getLength(),elapsed,replay.getLength()/elapsed,
+           replay.getLength()*TICK_SECONDS/elapsed))
+    print('level %d, score %d' % (session.getLevel(),session.getScore()))
@@ -0,0 +1,322 @@
+"""
+Parallel rollout module for Alien Invaders
+
+This module spreads headless games across worker processes, one VecWaveSim per
+process.  The actions, observations, rewards and done flags live in shared memory, as
+ring buffers along the step axis, and the trainer and the workers take turns through
+a pair of semaphores.
+
+Author: agent (agent@local)
+Date: October 18, 2026
+"""
+from consts import *
+from vecsim import *
+from env import *
+from multiprocessing import shared_memory
+import multiprocessing
+import numpy as np
+
+# The commands the trainer sends to the workers, in the control block
+_COMMAND_STEP  = 0
+_COMMAND_RESET = 1
+_COMMAND_STOP  = 2
+
+
+def _attach(name, shape, dtype):
+    """
+    Returns: the tuple (block, array) of an existing shared memory block and
+    an array using it
+
+    Parameter name: the name of the block
+    Precondition: name is a string naming a shared memory block
+
+    Parameter shape: the shape of the array
+    Precondition: shape is a tuple of ints > 0
+
+    Parameter dtype: the type of the array elements
+    Precondition: dtype is a NumPy dtype
+    """
+    block=shared_memory.SharedMemory(name=name)
+    return (block,np.ndarray(shape,dtype=dtype,buffer=block.buf))
+
+
+def _runWorker(specs, first, last, level, seed, maxBolts, difficulty, go, ready):
+    """
+    Runs the games first..last-1 until the trainer sends _COMMAND_STOP
+
+    This is the body of a worker process.
+
+    Parameter specs: the (name, shape, dtype) of every shared block, by key
+    Precondition: specs is a dict of the blocks made by RolloutRunner
+
+    Parameter first: the first game of this worker
+    Precondition: first is an int >= 0
+
+    Parameter last: the game after the last game of this worker
+    Precondition: last is an int > first
+
+    Parameter level: the level of every game
+    Precondition: level is an int > 0
+
+    Parameter seed: the seed of the random source of this worker
+    Precondition: seed is an int >= 0 or None
+
+    Parameter maxBolts: the number of bolts in an observation
+    Precondition: maxBolts is an int > 0
+
+    Parameter difficulty: the settings of every game
+    Precondition: difficulty is a Difficulty
+
+    Parameter go: the semaphore the trainer releases when there is a command
+    Precondition: go is a multiprocessing.Semaphore
+
+    Parameter ready: the semaphore this worker releases after each command
+    Precondition: ready is a multiprocessing.Semaphore
+    """
+    blocks={}
+    arrays={}
+    for key in specs:
+        blocks[key],arrays[key]=_attach(*specs[key])
+    control=arrays['control']
+    obs=arrays['obs']
+    actions=arrays['actions']
+    rewards=arrays['rewards']
+    dones=arrays['dones']
+    length=obs.shape[0]
+
+    games=VecWaveSim(last-first,level=level,seed=seed,difficulty=difficulty)
+    while True:
+        go.acquire()
+        command,tick=int(control[0]),int(control[1])
+        if command==_COMMAND_STOP:
+            break
+        if command==_COMMAND_RESET:
+            games.resetGames(np.ones(last-first,dtype=bool))
+        else:
+            slot=tick%length
+            reward,kills,deaths,done=games.step(actions[slot,first:last])
+            rewards[slot,first:last]=reward
+            dones[slot,first:last]=done
+            tick+=1
+        obs[tick%length,first:last]=games.observe(maxBolts)
+        ready.release()
+
+    del control,obs,actions,rewards,dones,arrays
+    for block in blocks.values():
+        block.close()
+    ready.release()
+
+
+class RolloutRunner(object):
+    """
+    A class that runs many headless games in worker processes.
+
+    Step t reads its actions from slot t % length of the ring buffers, writes its
+    rewards and done flags to that slot, and writes the observations after the step
+    to slot (t+1) % length.
+
+    INSTANCE ATTRIBUTES:
+        _workers: the worker processes [list of multiprocessing.Process]
+        _go:      the semaphore each worker waits on for a command
+                  [list of multiprocessing.Semaphore]
+        _ready:   the semaphore each worker releases when it is done with a command
+                  [list of multiprocessing.Semaphore]
+        _blocks:  the shared memory blocks, by key [dict of SharedMemory]
+        _control: the command and the current step, read by the workers
+                  [int64 array (2,)]
+        _obs:     the observation ring buffer [float32 array (length, games, size)]
+        _actions: the action ring buffer [uint8 array (length, games)]
+        _rewards: the reward ring buffer [float32 array (length, games)]
+        _dones:   the done flag ring buffer [bool array (length, games)]
+        _tick:    the number of steps taken since the last reset [int >= 0]
+    """
+
+    # GETTERS AND SETTERS
+
+    def getGameCount(self):
+        """
+        Returns the total number of games
+        """
+        return self._actions.shape[1]
+
+
+    def getLength(self):
+        """
+        Returns the length of the ring buffers
+        """
+        return self._actions.shape[0]
+
+
+    def getTick(self):
+        """
+        Returns the number of steps taken since the last reset
+        """
+        return self._tick
+
+
+    def getBuffers(self):
+        """
+        Returns the tuple (observations, actions, rewards, dones) of ring buffers
+
+        The arrays are shared with the workers.  They must not be modified, and
+        are only valid until close is called.
+        """
+        return (self._obs,self._actions,self._rewards,self._dones)
+
+
+    # INITIALIZER
+
+    def __init__(self, workers=None, gamesPerWorker=64, length=128, level=1,
+                 seed=None, maxBolts=16, difficulty=None):
+        """
+        Initializer: creates the shared buffers and starts the workers
+
+        Call reset before the first step, and close when done.
+
+        Parameter workers: the number of worker processes (one per core if None)
+        Precondition: workers is an int > 0 or None
+
+        Parameter gamesPerWorker: the number of games in each worker
+        Precondition: gamesPerWorker is an int > 0
+
+        Parameter length: the length of the ring buffers, in steps
+        Precondition: length is an int > 1
+
+        Parameter level: the level of every game
+        Precondition: level is an int > 0
+
+        Parameter seed: the seed of the whole run (unpredictable if None)
+        Precondition: seed is an int >= 0 or None
+
+        Parameter maxBolts: the number of bolts in an observation
+        Precondition: maxBolts is an int > 0
+
+        Parameter difficulty: the settings of every game (the ones in consts.py if None)
+        Precondition: difficulty is a Difficulty or None
+        """
+        workers=multiprocessing.cpu_count() if workers is None else workers
+        difficulty=Difficulty() if difficulty is None else difficulty
+        count=workers*gamesPerWorker
+        size=3+difficulty.getRows()*difficulty.getCols()+3*maxBolts
+        specs={'control':((2,),np.int64),
+               'obs':((length,count,size),np.float32),
+               'actions':((length,count),np.uint8),
+               'rewards':((length,count),np.float32),
+               'dones':((length,count),bool)}
+
+        self._blocks={}
+        arrays={}
+        for key in specs:
+            shape,dtype=specs[key]
+            nbytes=int(np.prod(shape))*np.dtype(dtype).itemsize
+            block=shared_memory.SharedMemory(create=True,size=nbytes)
+            self._blocks[key]=block
+            arrays[key]=np.ndarray(shape,dtype=dtype,buffer=block.buf)
+            arrays[key][...]=0
+            specs[key]=(block.name,shape,dtype)
+        self._control=arrays['control']
+        self._obs=arrays['obs']
+        self._actions=arrays['actions']
+        self._rewards=arrays['rewards']
+        self._dones=arrays['dones']
+        self._tick=0
+
+        seeds=np.random.SeedSequence(seed).spawn(workers)
+        self._go=[]
+        self._ready=[]
+        self._workers=[]
+        for pos in range(workers):
+            go=multiprocessing.Semaphore(0)
+            ready=multiprocessing.Semaphore(0)
+            workerSeed=int(seeds[pos].generate_state(1)[0])
+            process=multiprocessing.Process(target=_runWorker,daemon=True,
+                        args=(specs,pos*gamesPerWorker,(pos+1)*gamesPerWorker,
+                              level,workerSeed,maxBolts,difficulty,go,ready))
+            process.start()
+            self._go.append(go)
+            self._ready.append(ready)
+            self._workers.append(process)
+
+
+    # PUBLIC METHODS
+
+    def reset(self):
+        """
+        Returns: the observations of every game after starting a new wave in
+        each, as a view of slot 0 of the observation buffer
+        """
+        self._tick=0
+        self._send(_COMMAND_RESET)
+        return self._obs[0]
+
+
+    def step(self, actions):
+        """
+        Returns: the tuple (observations, rewards, dones) after every game
+        plays one tick, as views of the ring buffers
+
+        The views are overwritten length steps later.  Games that end are
+        reset to a new wave, so the observation of a done game is the first
+        one of its next wave.
+
+        Parameter actions: the keys held down in each game
+        Precondition: actions is an int array (games,) of bitwise ors of KEY
+        constants
+        """
+        length=self.getLength()
+        slot=self._tick%length
+        self._actions[slot]=actions
+        self._send(_COMMAND_STEP)
+        self._tick+=1
+        return (self._obs[self._tick%length],self._rewards[slot],self._dones[slot])
+
+
+    def close(self):
+        """
+        Stops the workers and frees the shared memory
+        """
+        if not self._workers:
+            return
+        self._send(_COMMAND_STOP)
+        for process in self._workers:
+            process.join()
+        self._workers=[]
+        self._control=self._obs=self._actions=self._rewards=self._dones=None
+        for block in self._blocks.values():
+            block.close()
+            block.unlink()
+        self._blocks={}
+
+
+    # HELPER METHODS
+
+    def _send(self, command):
+        """
+        Sends a command to every worker, and waits until they are all done
+
+        Parameter command: the command to send
+        Precondition: command is one of the _COMMAND constants
+        """
+        self._control[0]=command
+        self._control[1]=self._tick
+        for go in self._go:
+            go.release()
+        for ready in self._ready:
+            ready.acquire()
+
+
+# Script code
+if __name__ == '__main__':
+    import time
+    runner=RolloutRunner(seed=0)
+    runner.reset()
+    rng=np.random.default_rng(0)
+    steps=1000
+    start=time.perf_counter()
+    for step in range(steps):
+        runner.step(rng.integers(0,ACTION_COUNT,size=runner.getGameCount(),
+                                 dtype=np.uint8))
+    elapsed=time.perf_counter()-start
+    print('%d games, %.0f game-ticks/s' % (runner.getGameCount(),
+                                            steps*runner.getGameCount()/elapsed))
+    runner.close()
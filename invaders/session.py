@@ -0,0 +1,307 @@
+"""
+Headless game session module for Alien Invaders
+
+This module contains the class GameSession, the state machine of the Invaders
+controller (app.py) with no graphics attached.  A session advances one fixed tick at a
+time from a bit mask of the keys held down, and plays out the same for the same seed
+and keys.
+
+Author: agent (agent@local)
+Date: October 18, 2026
+"""
+from consts import *
+from simulation import *
+from snapshot import *
+import random
+import struct
+
+# The snapshot header of a GameSession: state, originalScore, score, level, sound,
+# soundtime, ticks, hasWave
+_SESSION_STATE=struct.Struct('<iiii?dq?')
+
+
+class GameSession(object):
+    """
+    A class representing one play session of Alien Invaders, from the start screen on.
+
+    See the method update in class Invaders for a description of the states.  The
+    transitions here are the same, and happen on the same keys.
+
+    INSTANCE ATTRIBUTES:
+        _state: the current state of the game represented as a value from consts.py
+                [one of the STATE constants]
+        _wave:  the simulation of the current wave [WaveSim, or None if no wave
+                has been started yet]
+        _originalScore: Initial score at the start of the current wave [int >= 0]
+        _score: Total score obtained by player [int >= 0]
+        _level: the level the player is on [int >= 0]
+        _sound: True if player has enabled sound effects/music, False otherwise [bool]
+        _soundtime: amount of seconds elapsed since user last changed sound settings
+                [number >= 0]
+        _ticks: the number of ticks run so far [int >= 0]
+        _rng:   the random source that seeds the generator of each new wave
+                [random.Random]
+        _difficulty: the difficulty settings of every wave [Difficulty]
+    """
+
+    # GETTERS AND SETTERS
+
+    def getState(self):
+        """
+        Returns the current state of the game (one of the STATE constants)
+        """
+        return self._state
+
+
+    def getWave(self):
+        """
+        Returns the simulation of the current wave, or None if there is none yet
+        """
+        return self._wave
+
+
+    def getScore(self):
+        """
+        Returns the total score of the player
+        """
+        return self._score
+
+
+    def getLevel(self):
+        """
+        Returns the level the player is on
+        """
+        return self._level
+
+
+    def isSoundOn(self):
+        """
+        Returns True if the player has enabled sound
+        """
+        return self._sound
+
+
+    def getDifficulty(self):
+        """
+        Returns the difficulty settings of every wave
+        """
+        return self._difficulty
+
+
+    def getTicks(self):
+        """
+        Returns the number of ticks run so far
+        """
+        return self._ticks
+
+
+    def isWaveWon(self):
+        """
+        Returns True if the game is complete because all aliens were killed
+        """
+        return self._state==STATE_COMPLETE and self._wave.noMoreAliens()
+
+
+    # INITIALIZER
+
+    def __init__(self, rng=None, difficulty=None):
+        """
+        Initializer: creates a new session on the start screen
+
+        Parameter rng: the random source for this session (a new unseeded one if None)
+        Precondition: rng is a random.Random or None
+
+        Parameter difficulty: the settings of every wave (the ones in consts.py if None)
+        Precondition: difficulty is a Difficulty or None
+        """
+        self._rng=random.Random() if rng is None else rng
+        self._difficulty=Difficulty() if difficulty is None else difficulty
+        self._state=STATE_INACTIVE
+        self._wave=None
+        self._originalScore=0
+        self._score=0
+        self._level=0
+        self._sound=False
+        self._soundtime=0
+        self._ticks=0
+
+
+    # UPDATE METHOD
+
+    def tick(self, keys):
+        """
+        Advances the session by one tick of TICK_SECONDS
+
+        Parameter keys: the keys held down during this tick
+        Precondition: keys is an int, a bitwise or of KEY constants
+        """
+        self._ticks+=1
+        self._updateSound(keys)
+
+        if self._state==STATE_INACTIVE:
+            self._updateInactive(keys)
+
+        if self._state==STATE_NEWWAVE:
+            self._updateNewWave()
+
+        if self._state==STATE_ACTIVE:
+            self._updateActive(keys)
+
+        if self._state==STATE_PLAYER_PAUSED:
+            self._updatePlayerPaused(keys)
+
+        if self._state==STATE_PAUSED:
+            self._updatePaused(keys)
+
+        if self._state==STATE_CONTINUE:
+            self._updateContinue()
+
+        if self._state==STATE_COMPLETE:
+            self._updateComplete(keys)
+
+
+    # METHODS TO SAVE AND RESTORE THE SESSION
+
+    def snapshot(self):
+        """
+        Returns: a compact binary snapshot of the whole session, as bytes
+        """
+        wave=self._wave
+        buf=bytearray(_SESSION_STATE.pack(self._state,self._originalScore,self._score,
+                                          self._level,self._sound,self._soundtime,
+                                          self._ticks,wave is not None))
+        writeRandom(buf,self._rng)
+        if wave is not None:
+            wave.writeState(buf)
+        return bytes(buf)
+
+
+    def restore(self, data):
+        """
+        Sets the session back to the state saved in a snapshot
+
+        The current wave is restored in place if there is one, so any Wave
+        showing it stays valid.  Otherwise a new wave is made for the snapshot.
+
+        Parameter data: the snapshot
+        Precondition: data is a bytes-like object returned by snapshot on a
+        session with the same difficulty settings
+        """
+        (self._state,self._originalScore,self._score,self._level,self._sound,
+         self._soundtime,self._ticks,hasWave)=_SESSION_STATE.unpack_from(data,0)
+        offset=readRandom(self._rng,data,_SESSION_STATE.size)
+        if not hasWave:
+            self._wave=None
+        else:
+            if self._wave is None:
+                self._wave=WaveSim(difficulty=self._difficulty)
+            self._wave.readState(data,offset)
+
+
+    # HELPER METHODS FOR THE STATES
+
+    def _updateSound(self, keys):
+        """
+        Switches the sound setting when X is held, at most once every
+        TIME_SOUND_SWITCH seconds
+
+        Parameter keys: the keys held down during this tick
+        Precondition: keys is an int, a bitwise or of KEY constants
+        """
+        if self._soundtime>TIME_SOUND_SWITCH:
+            if keys & KEY_X:
+                self._soundtime=0
+                self._sound=not self._sound
+        else:
+            self._soundtime+=TICK_SECONDS
+
+
+    def _updateInactive(self, keys):
+        """
+        Helper method for the inactive state's protocol for tick
+        """
+        if keys & KEY_S:
+            self._state=STATE_NEWWAVE
+
+
+    def _updateNewWave(self):
+        """
+        Helper method for the new wave state's protocol for tick
+        """
+        self._wave=WaveSim(random.Random(self._rng.getrandbits(64)),self._difficulty)
+        self._level+=1
+        self._originalScore=self._score
+        self._state=STATE_ACTIVE
+
+
+    def _updateActive(self, keys):
+        """
+        Helper method for the active state's protocol for tick
+        """
+        wave=self._wave
+        wave.moveShip(bool(keys & KEY_LEFT),bool(keys & KEY_RIGHT))
+        wave.moveAliens(self._level,TICK_SECONDS)
+        wave.moveBolts(bool(keys & KEY_SPACEBAR))
+        wave.checkAlienCollisions()
+        self._score=self._originalScore+wave.getScore()
+        self._transitionActive(keys)
+
+
+    def _transitionActive(self, keys):
+        """
+        Helper method that lists all the posible transitions
+        from the active state
+        """
+        wave=self._wave
+        if keys & KEY_P:
+            self._state=STATE_PLAYER_PAUSED
+
+        elif wave.noMoreAliens():
+            self._state=STATE_COMPLETE
+
+        elif wave.isShipCollision() and wave.getLives()>0:
+            self._state=STATE_PAUSED
+
+        elif wave.getLives()==0:
+            self._state=STATE_COMPLETE
+
+        elif wave.crossedDefenseLine():
+            self._state=STATE_COMPLETE
+
+
+    def _updatePaused(self, keys):
+        """
+        Helper method for the paused (resulting from lost life) state's
+        protocol for tick
+        """
+        self._wave.clearBolts()
+        if keys & KEY_S:
+            self._state=STATE_CONTINUE
+
+
+    def _updatePlayerPaused(self, keys):
+        """
+        Helper method for the player-induced paused state's protocol for tick
+        """
+        if keys & KEY_S:
+            self._state=STATE_CONTINUE
+
+
+    def _updateContinue(self):
+        """
+        Helper method for the continue state's protocol for tick
+        """
+        self._wave.setNewShip()
+        self._state=STATE_ACTIVE
+
+
+    def _updateComplete(self, keys):
+        """
+        Helper method for the completed state's protocol for tick
+        """
+        if self._wave.noMoreAliens():
+            if keys & KEY_S:
+                self._state=STATE_NEWWAVE
+        elif self._wave.getLives()>0:
+            # raises EVENT_LINE_CROSSED while the aliens sit on the line
+            self._wave.crossedDefenseLine()
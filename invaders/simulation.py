@@ -0,0 +1,535 @@
+"""
+Headless simulation module for Alien Invaders
+
+This module contains the rules for a single wave of Alien Invaders with no graphics
+attached.  Instances of WaveSim hold the ship, the aliens, the laser bolts, the lives
+and the score as plain data, and can be stepped (or saved and restored, see
+snapshot.py) without Kivy being installed.
+
+The class Wave in wave.py draws a WaveSim and plays its sounds.
+
+Author: agent (agent@local)
+Date: October 18, 2026
+"""
+from consts import *
+from formation import *
+from bolts import *
+from snapshot import *
+from difficulty import *
+import random
+import struct
+
+# PRIMARY RULE: This module may only access consts.py and the other headless modules
+# (formation.py, bolts.py, snapshot.py, difficulty.py).  It must NEVER import game2d 
+# (directly, or indirectly through models.py or wave.py), as that would pull in Kivy.
+
+# The snapshot header of a WaveSim: hasShip, shipX, shipY, lives, time, steps,
+# totalsteps, score, aliensGone, events
+_WAVE_STATE=struct.Struct('<?ddidiiiii')
+
+
+class ShipState(object):
+    """
+    A class to represent the game ship, with no graphics attached.
+
+    INSTANCE ATTRIBUTES:
+        _x: the x coordinate of the ship center
+            [number in 0.5*SHIP_WIDTH..GAME_WIDTH-0.5*SHIP_WIDTH]
+        _y: the y coordinate of the ship center [number > 0]
+    """
+
+    # GETTERS AND SETTERS
+
+    def getXPos(self):
+        """
+        Returns attribute _x of ShipState
+        """
+        return self._x
+
+
+    def getYPos(self):
+        """
+        Returns attribute _y of ShipState
+        """
+        return self._y
+
+
+    # INITIALIZER
+
+    def __init__(self, x, y):
+        """
+        Initializer: creates a new ship
+
+        Parameter x: The ship's x coordinate
+        Precondition: x is a number > 0
+
+        Parameter y: The ship's y coordinate
+        Precondition: y is a number > 0
+        """
+        self._x=x
+        self._y=y
+
+
+    # METHODS TO MOVE THE SHIP
+
+    def moveXPos(self, dx):
+        """
+        Moves x position of the ship dx positions to the left
+        if dx is negative, to the right if dx is positive,
+        keeping the ship inside the window
+
+        Parameter dx: how much the x value is to shift
+        Precondition: dx is an int
+        """
+        newval=max(0.5*SHIP_WIDTH, self._x+dx)
+        self._x=min(newval, GAME_WIDTH-0.5*SHIP_WIDTH)
+
+
+class WaveSim(object):
+    """
+    This class runs the rules of a single wave of Alien Invaders.
+
+    It is the same game as the one played in the window, with the same update methods
+    that Invaders calls through Wave every frame.  Instead of a GInput, the update
+    methods take the state of the keys they care about as bools.  Instead of playing
+    sounds, they record what happened in an event mask (see the EVENT constants in
+    consts.py), which the caller reads with getEvents and resets with clearEvents.
+
+    INSTANCE ATTRIBUTES:
+        _ship:   the player ship [ShipState, or None if it was just destroyed]
+        _formation: the aliens in the wave [Formation]
+        _march:  the controller deciding how _formation marches [MarchController]
+        _bolts:  the laser bolts currently on screen [BoltPool]
+        _lives:  the number of lives left [int >= 0]
+        _time:   The amount of time since the last Alien "step" [number >= 0]
+        _totalsteps: The total amount of alien steps alien has marched [int >= 0]
+        _steps: The amount of alien steps since the last bolt fired from alien
+                [int >= 0]
+        _score: Total score obtained by player in this wave [int >= 0]
+        _aliensGone: Total amount of aliens killed, speed depends on this [int >= 0]
+        _events: the events raised since the last call to clearEvents
+                [int, a bitwise or of EVENT constants]
+        _rng:    the source of all randomness in this wave [random.Random]
+        _difficulty: the difficulty settings of this wave [Difficulty]
+    """
+
+    # GETTERS AND SETTERS
+
+    def getScore(self):
+        """
+        Returns score player has accummulated in current wave
+        """
+        return self._score
+
+
+    def getLives(self):
+        """
+        Returns how much lives player has left before game is lost
+        """
+        return self._lives
+
+
+    def getShip(self):
+        """
+        Returns the player ship, or None if it was destroyed
+        """
+        return self._ship
+
+
+    def getFormation(self):
+        """
+        Returns the alien formation of this wave
+        """
+        return self._formation
+
+
+    def getBolts(self):
+        """
+        Returns the pool of bolts currently on screen
+        """
+        return self._bolts
+
+
+    def getTotalSteps(self):
+        """
+        Returns the total number of steps the aliens have marched
+        """
+        return self._totalsteps
+
+
+    def getDifficulty(self):
+        """
+        Returns the difficulty settings of this wave
+        """
+        return self._difficulty
+
+
+    def getRandom(self):
+        """
+        Returns the random source of this wave
+        """
+        return self._rng
+
+
+    def getEvents(self):
+        """
+        Returns the events raised since the last call to clearEvents
+
+        The value is a bitwise or of the EVENT constants in consts.py
+        """
+        return self._events
+
+
+    def clearEvents(self):
+        """
+        Resets the event mask to 0
+        """
+        self._events=0
+
+
+    def setNewShip(self):
+        """
+        Creates a new ship and sets it to self._ship
+        """
+        self._ship=ShipState(SHIP_CENTER,SHIP_BOTTOM)
+
+
+    # INITIALIZER
+
+    def __init__(self, rng=None, difficulty=None):
+        """
+        Initializer: creates a new wave with a full alien formation
+
+        All of the randomness in the wave comes from rng, so two waves given
+        generators with the same seed play out the same for the same input.
+
+        Parameter rng: the random source for this wave (a new unseeded one if None)
+        Precondition: rng is a random.Random or None
+
+        Parameter difficulty: the settings of this wave (the ones in consts.py if None)
+        Precondition: difficulty is a Difficulty or None
+        """
+        self._rng=random.Random() if rng is None else rng
+        self._difficulty=Difficulty() if difficulty is None else difficulty
+        self.setNewShip()
+        self._formation=Formation(self._difficulty.getRows(),self._difficulty.getCols(),
+                                  self._difficulty.getScale())
+        self._march=MarchController(self._formation)
+        self._bolts=BoltPool()
+        self._lives=SHIP_LIVES
+        self._time=0
+        self._steps=0
+        self._totalsteps=0
+        self._score=0
+        self._aliensGone=0
+        self._events=0
+
+
+    # UPDATE METHODS TO MOVE THE SHIP, ALIENS, AND LASER BOLTS
+
+    def moveShip(self, left, right):
+        """
+        Moves the ship by SHIP_MOVEMENT in the direction of the keys held
+
+        Parameter left: whether the left key is held down
+        Precondition: left is a bool
+
+        Parameter right: whether the right key is held down
+        Precondition: right is a bool
+        """
+        if left:
+            self._ship.moveXPos(-SHIP_MOVEMENT)
+        if right:
+            self._ship.moveXPos(SHIP_MOVEMENT)
+
+
+    def moveAliens(self, level, dt):
+        """
+        Moves the aliens every dt seconds, horizontally by ALIEN_H_WALK
+        and vertically by ALIEN_V_WALK when alien wave reaches left side
+        (both multiplied by the scale of the formation).
+        Raises EVENT_ALIEN_STEP when the aliens step.
+
+        Aliens increase their speed as level increases
+
+        Parameter level: the level the player is on
+        Precondition: level is an int > 0
+
+        Parameter dt: number of seconds that have passed since the last update
+        Precondition: dt is a float > 0
+        """
+        settings=self._difficulty
+        levelM=settings.getLevelSpeed()**(level-1) #level multiplier
+        aliensM=settings.getAlienSpeed()**(self._aliensGone) #aliens multiplier
+
+        if self._time>settings.getSpeed()*levelM*aliensM:
+            self._events|=EVENT_ALIEN_STEP
+            self._steps+=self._march.step()
+            self._time=0
+            self._totalsteps+=1
+
+        else:
+            self._time+=dt
+
+
+    def moveBolts(self, fire):
+        """
+        Fires a bolt from the ship if fire is True (and there is no other
+        player bolt on screen), fires bolts from the alien wave with random
+        frequency, and moves every bolt on screen.
+
+        Raises EVENT_PLAYER_FIRE and EVENT_ALIEN_FIRE for new bolts.
+
+        Parameter fire: whether the fire key is held down
+        Precondition: fire is a bool
+        """
+        #for player bolts
+        if fire and self._bolts.getPlayerCount()<1:
+            self._bolts.fire(self._ship.getXPos(),SHIP_BOTTOM+SHIP_HEIGHT,True)
+            self._events|=EVENT_PLAYER_FIRE
+
+        #for alien bolts
+        self._moveAlienBolts()
+
+        #for both
+        self._bolts.move()
+
+
+    def runTicks(self, actions, level):
+        """
+        Returns: the tuple (ticks, kills, deaths, score, done) after advancing
+        the wave one tick for each action, stopping early if the wave ends
+
+        This runs the same tick as the active state of GameSession, with no
+        state machine around it.  When the ship is hit and lives remain, the
+        bolts are cleared and a new ship is made right away, as if the player
+        had continued at once.  KEY_P, KEY_S and KEY_X are ignored.
+
+        In the result, ticks is the number of ticks run, kills the number of
+        aliens killed, deaths the number of ships lost, and score the points
+        gained.  The value done is True if the wave is over (all aliens are
+        dead, all lives are lost or the aliens reached the defense line).
+
+        Parameter actions: the keys held down in each tick
+        Precondition: actions is a sequence (or 1d array) of ints, each a
+        bitwise or of KEY constants
+
+        Parameter level: the level the player is on
+        Precondition: level is an int > 0
+        """
+        if hasattr(actions,'tolist'):
+            actions=actions.tolist()
+        startScore=self._score
+        startGone=self._aliensGone
+        deaths=0
+        ticks=0
+        done=self.noMoreAliens() or self._lives==0
+        dt=TICK_SECONDS
+
+        for keys in actions:
+            if done:
+                break
+            ticks+=1
+            self.moveShip((keys & KEY_LEFT)!=0,(keys & KEY_RIGHT)!=0)
+            self.moveAliens(level,dt)
+            self.moveBolts((keys & KEY_SPACEBAR)!=0)
+            self.checkAlienCollisions()
+
+            if self._formation.isEmpty():
+                done=True
+            elif self.isShipCollision():
+                deaths+=1
+                if self._lives>0:
+                    self.clearBolts()
+                    self.setNewShip()
+                else:
+                    done=True
+            elif self.crossedDefenseLine():
+                done=True
+
+        return (ticks,self._aliensGone-startGone,deaths,self._score-startScore,done)
+
+
+    # UPDATE METHODS FOR COLLISION DETECTION
+
+    def checkAlienCollisions(self):
+        """
+        Checks if there is a collision between any aliens and a bolt fired
+        by the player, removing both if so. Raises EVENT_ALIEN_HIT for
+        each alien killed.
+
+        Each player bolt is looked up in the formation lattice, so the cost
+        is proportional to the number of bolts, not aliens times bolts.
+        """
+        bolts=self._bolts
+        if bolts.getPlayerCount()==0:
+            return
+
+        xs=bolts.getXs()
+        ys=bolts.getYs()
+        players=bolts.getPlayerMask()
+        killed=False
+        for slot in range(bolts.getSize()-1,-1,-1):
+            if players[slot]:
+                hit=self._formation.findHit(xs[slot],ys[slot],
+                                            BOLT_WIDTH/2,BOLT_HEIGHT/2)
+                if hit is not None:
+                    self._score+=self._formation.kill(hit[0],hit[1])
+                    self._aliensGone+=1
+                    self._events|=EVENT_ALIEN_HIT
+                    bolts.remove(slot)
+                    killed=True
+
+        if killed:
+            self._march.replan()
+
+
+    def isShipCollision(self):
+        """
+        Returns True if ship collision with alien bolt is detected
+
+        If so, the ship is destroyed (set to None), a life is lost and
+        EVENT_SHIP_HIT is raised.
+        """
+        ship=self._ship
+        if self._bolts.findHit(ship.getXPos(),ship.getYPos(),
+                               SHIP_WIDTH/2,SHIP_HEIGHT/2,False)>=0:
+            self._events|=EVENT_SHIP_HIT
+            self._ship=None
+            self._lives-=1
+            return True
+        return False
+
+
+    def clearBolts(self):
+        """
+        Removes every bolt from the screen
+
+        Called in paused state when life is lost, so that player
+        can resume game without any previous bullets on screen
+        """
+        self._bolts.clear()
+
+
+    def crossedDefenseLine(self):
+        """
+        Returns True if alien wave has reached the defense line,
+        False otherwise
+
+        Raises EVENT_LINE_CROSSED on the step the aliens land exactly
+        on the defense line.
+        """
+        smallestY=self._findAlienSmallestY()
+        if smallestY==DEFENSE_LINE:
+            self._events|=EVENT_LINE_CROSSED
+
+        return smallestY<=DEFENSE_LINE
+
+
+    def noMoreAliens(self):
+        """
+        Returns True if all the aliens have been successfully
+        fired at and the player has won the wave, False otherwise
+        """
+        return self._formation.isEmpty()
+
+
+    # METHODS TO SAVE AND RESTORE THE WAVE
+
+    def snapshot(self):
+        """
+        Returns: a compact binary snapshot of the whole wave, as bytes
+
+        The snapshot holds the ship, formation, march plan, bolts, lives,
+        timers, score, events and the state of the random source.
+        """
+        buf=bytearray()
+        self.writeState(buf)
+        return bytes(buf)
+
+
+    def restore(self, data):
+        """
+        Sets the wave back to the state saved in a snapshot
+
+        The wave keeps its objects (and its random source), and overwrites
+        their state, so any Wave showing it stays valid.
+
+        Parameter data: the snapshot
+        Precondition: data is a bytes-like object returned by snapshot on a
+        wave with a formation of the same shape
+        """
+        self.readState(data,0)
+
+
+    def writeState(self, buf):
+        """
+        Appends the state of the wave to the snapshot buf
+
+        Parameter buf: the snapshot being written
+        Precondition: buf is a bytearray
+        """
+        ship=self._ship
+        buf+=_WAVE_STATE.pack(ship is not None,
+                              0.0 if ship is None else ship.getXPos(),
+                              0.0 if ship is None else ship.getYPos(),
+                              self._lives,self._time,self._steps,self._totalsteps,
+                              self._score,self._aliensGone,self._events)
+        self._formation.writeState(buf)
+        self._march.writeState(buf)
+        self._bolts.writeState(buf)
+        writeRandom(buf,self._rng)
+
+
+    def readState(self, data, offset):
+        """
+        Returns: the offset just past the wave state, after restoring the wave
+        from data starting at offset
+
+        Parameter data: the snapshot
+        Precondition: data is a bytes-like object
+
+        Parameter offset: the position of the wave state in data
+        Precondition: offset is an int >= 0, the start of a state written by
+        writeState
+        """
+        (hasShip,x,y,self._lives,self._time,self._steps,self._totalsteps,
+         self._score,self._aliensGone,self._events)=_WAVE_STATE.unpack_from(data,offset)
+        self._ship=ShipState(x,y) if hasShip else None
+        offset+=_WAVE_STATE.size
+        offset=self._formation.readState(data,offset)
+        offset=self._march.readState(data,offset)
+        offset=self._bolts.readState(data,offset)
+        return readRandom(self._rng,data,offset)
+
+
+    # HELPER METHODS
+
+    def _moveAlienBolts(self):
+        """
+        Helper method to fire alien bolts from alien waves
+        with random frequency from random alien in wave
+
+        The bolt comes from the lowest live alien of a random live column.
+        """
+        formation=self._formation
+        rng=self._rng
+        numAlienSteps=rng.randint(1,self._difficulty.getBoltRate())
+        if self._steps>numAlienSteps and formation.getLiveColCount()>0:
+            self._steps=0
+            colToFire=formation.getLiveCol(rng.randrange(formation.getLiveColCount()))
+            rowToFire=formation.findColBottomRow(colToFire)
+            self._bolts.fire(formation.getColX(colToFire),
+                             formation.getRowY(rowToFire),False)
+            self._events|=EVENT_ALIEN_FIRE
+
+
+    def _findAlienSmallestY(self):
+        """
+        Returns: y coordinate of alien on the most bottom, measured
+        from the top of the ship
+
+        Useful for determining when the aliens have crossed the
+        defense line.
+        """
+        return self._formation.findSmallestY() - (SHIP_BOTTOM+SHIP_HEIGHT)
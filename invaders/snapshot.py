@@ -0,0 +1,140 @@
+"""
+Snapshot helper module for Alien Invaders
+
+This module contains the functions that the classes with a saved state use to append
+their fields to a snapshot (a bytearray), and to read them back in the same order.
+Arrays are saved as their raw bytes, so a snapshot is only meant to be restored on the
+same kind of machine that made it.  Running this module as a script checks that a
+restored game plays out exactly as the original:
+
+    python snapshot.py [seed]
+
+Author: agent (agent@local)
+Date: October 18, 2026
+"""
+import numpy as np
+import hashlib
+import random
+import struct
+
+# PRIMARY RULE: This module may not access any other module of the game.  The only
+# exception is checkSnapshot, which imports a session to play.
+
+# The Mersenne Twister state: version, position and 624 words, then the cached gauss
+_RANDOM_STATE=struct.Struct('<i625Ibd')
+
+
+def writeArray(buf, array):
+    """
+    Appends the raw bytes of array to the snapshot buf
+
+    Parameter buf: the snapshot being written
+    Precondition: buf is a bytearray
+
+    Parameter array: the array to save
+    Precondition: array is a contiguous NumPy array
+    """
+    buf+=array.tobytes()
+
+
+def readArray(array, data, offset):
+    """
+    Returns: the offset just past the array, after filling array with the
+    bytes of data starting at offset
+
+    Parameter array: the array to fill (its shape and dtype are kept)
+    Precondition: array is a NumPy array, written with writeArray
+
+    Parameter data: the snapshot
+    Precondition: data is a bytes-like object
+
+    Parameter offset: the position of the array in data
+    Precondition: offset is an int >= 0
+    """
+    saved=np.frombuffer(data,dtype=array.dtype,count=array.size,offset=offset)
+    array[...]=saved.reshape(array.shape)
+    return offset+array.nbytes
+
+
+def writeRandom(buf, rng):
+    """
+    Appends the state of the random source rng to the snapshot buf
+
+    Parameter buf: the snapshot being written
+    Precondition: buf is a bytearray
+
+    Parameter rng: the random source to save
+    Precondition: rng is a random.Random
+    """
+    version,words,gauss=rng.getstate()
+    hasGauss=gauss is not None
+    buf+=_RANDOM_STATE.pack(version,*words,hasGauss,gauss if hasGauss else 0.0)
+
+
+def readRandom(rng, data, offset):
+    """
+    Returns: the offset just past the state, after setting the state of rng
+    to the one in data starting at offset
+
+    Parameter rng: the random source to restore
+    Precondition: rng is a random.Random
+
+    Parameter data: the snapshot
+    Precondition: data is a bytes-like object
+
+    Parameter offset: the position of the state in data
+    Precondition: offset is an int >= 0
+    """
+    fields=_RANDOM_STATE.unpack_from(data,offset)
+    gauss=fields[-1] if fields[-2] else None
+    rng.setstate((fields[0],fields[1:-2],gauss))
+    return offset+_RANDOM_STATE.size
+
+
+def checkSnapshot(seed=0, ticks=3000):
+    """
+    Returns: the SHA-256 hex digest of the last snapshot of a seeded game, after
+    checking that restoring a snapshot taken in the middle of a wave replays the
+    rest of the game to the same state
+
+    The game is played with random keys that always hold down 's'.  The snapshot
+    is taken at the first active tick after half of the ticks.  It is restored both
+    into the session that made it and into a new session.  An AssertionError is
+    raised if either one ends in another state.
+
+    Parameter seed: the seed of the game and the keys
+    Precondition: seed is an int
+
+    Parameter ticks: the number of ticks to play
+    Precondition: ticks is an int >= 2
+    """
+    from session import GameSession
+    import consts
+    rng=random.Random(seed)
+    keys=[rng.getrandbits(3) | consts.KEY_S for tick in range(ticks)]
+    session=GameSession(random.Random(seed))
+    middle=None
+    for tick in range(ticks):
+        if (middle is None and tick>=ticks//2 and
+            session.getState()==consts.STATE_ACTIVE):
+            middle=tick
+            saved=session.snapshot()
+        session.tick(keys[tick])
+    assert middle is not None, 'the game never became active'
+    final=hashlib.sha256(session.snapshot()).hexdigest()
+
+    for restored in (session,GameSession()):
+        restored.restore(saved)
+        assert restored.snapshot()==saved, 'restore did not give back the snapshot'
+        for tick in range(middle,ticks):
+            restored.tick(keys[tick])
+        digest=hashlib.sha256(restored.snapshot()).hexdigest()
+        assert digest==final, 'restored game ended in another state'
+    return final
+
+
+# Script code
+if __name__ == '__main__':
+    import sys
+    seed=int(sys.argv[1]) if len(sys.argv)>1 else 0
+    print('snapshot check passed, final state %s' % checkSnapshot(seed))
@@ -0,0 +1,100 @@
+"""
+Stress test module for Alien Invaders
+
+This module measures how the cost of a tick of the game grows with the size of the
+alien formation, up to swarms of thousands of aliens.  The tick is timed through
+GameSession, as the game runs it.  The Kivy drawing needs a window, so it is not
+timed; the frames of the headless Rasterizer are timed instead, as a separate
+column.  Running this module as a script prints a table:
+
+    python stress.py [frames per size]
+
+Author: agent (agent@local)
+Date: October 18, 2026
+"""
+from consts import *
+from difficulty import *
+from session import *
+from raster import *
+import random
+import time
+
+#: the formation sizes measured by default, as (rows, cols)
+SIZES = ((5,12),(10,15),(20,40),(40,80),(60,150),(100,200))
+
+
+def measureFrames(rows, cols, frames=500, seed=0, raster=None):
+    """
+    Returns: the tuple (tick, draw) of the mean seconds to advance a game with
+    formations of the given size by one tick, and to rasterize the wave
+
+    The game is a GameSession, with random keys that always hold down 's', so
+    that it starts a new wave after each wave and carries on after a lost life.
+    When the game is over, a new game takes its place.  draw is None if raster
+    is None.
+
+    Parameter rows: the number of rows of aliens
+    Precondition: rows is an int > 0
+
+    Parameter cols: the number of aliens in a row
+    Precondition: cols is an int > 0
+
+    Parameter frames: the number of frames to time
+    Precondition: frames is an int > 0
+
+    Parameter seed: the seed of the games and the keys
+    Precondition: seed is an int
+
+    Parameter raster: the rasterizer to draw with (nothing is drawn if None)
+    Precondition: raster is a Rasterizer or None
+    """
+    difficulty=Difficulty(rows,cols,speed=0.05,scale=swarmScale(rows,cols))
+    rng=random.Random(seed)
+    session=GameSession(random.Random(rng.getrandbits(64)),difficulty)
+    tick=0.0
+    draw=0.0
+    for frame in range(frames):
+        keys=rng.getrandbits(3) | KEY_S
+        start=time.perf_counter()
+        session.tick(keys)
+        middle=time.perf_counter()
+        if raster is not None and session.getWave() is not None:
+            raster.draw(session.getWave())
+        tick+=middle-start
+        draw+=time.perf_counter()-middle
+        if session.getState()==STATE_COMPLETE and not session.isWaveWon():
+            session=GameSession(random.Random(rng.getrandbits(64)),difficulty)
+    return (tick/frames,None if raster is None else draw/frames)
+
+
+def runStress(sizes=SIZES, frames=500, seed=0, raster=None):
+    """
+    Returns: a list with the tuple (aliens, tick, draw) for each formation size,
+    where aliens is the number of aliens and tick, draw are as in measureFrames
+
+    Parameter sizes: the formation sizes to measure
+    Precondition: sizes is a list of (rows, cols) pairs of ints > 0
+
+    Parameter frames: the number of frames to time for each size
+    Precondition: frames is an int > 0
+
+    Parameter seed: the seed of the games and the keys
+    Precondition: seed is an int
+
+    Parameter raster: the rasterizer to draw with (nothing is drawn if None)
+    Precondition: raster is a Rasterizer or None
+    """
+    results=[]
+    for rows,cols in sizes:
+        tick,draw=measureFrames(rows,cols,frames,seed,raster)
+        results.append((rows*cols,tick,draw))
+    return results
+
+
+# Script code
+if __name__ == '__main__':
+    import sys
+    frames=int(sys.argv[1]) if len(sys.argv)>1 else 500
+    print('%8s %10s %10s %10s' % ('aliens','tick ms','ticks/s','raster ms'))
+    for aliens,tick,draw in runStress(frames=frames,raster=Rasterizer()):
+        print('%8d %10.3f %10.0f %10.3f' % (aliens,1000*tick,1/tick,1000*draw))
@@ -0,0 +1,473 @@
+"""
+Vectorized simulation module for Alien Invaders
+
+This module contains the rules of a wave (those of WaveSim.runTicks) for many games at
+once.  A VecWaveSim stores the state of N games as stacked NumPy arrays, and advances
+all of them in one vectorized tick.  The games share one random generator, so a game
+does not play out the same as a WaveSim with the same seed.
+
+Author: agent (agent@local)
+Date: October 18, 2026
+"""
+from consts import *
+from difficulty import *
+from formation import *
+import numpy as np
+
+
+class VecWaveSim(object):
+    """
+    A class representing N independent waves of Alien Invaders, advanced in lockstep.
+
+    Game g has its ship at (_shipX[g], SHIP_BOTTOM), and the alien at (row, col) of
+    game g is alive if _alive[g,row,col] is True.  That alien is centered at
+    (_colX[col]+_offsetX[g], _rowY[row]+_offsetY[g]), as in a Formation.
+
+    INSTANCE ATTRIBUTES:
+        _count:   the number of games [int > 0]
+        _rows:    the number of rows in each formation [int > 0]
+        _cols:    the number of aliens in each row [int > 0]
+        _level:   the level of every game [int > 0]
+        _difficulty: the difficulty settings of every game [Difficulty]
+        _rng:     the source of all randomness [numpy.random.Generator]
+        _colX:    the starting x coordinate of every column [float array (cols,)]
+        _rowY:    the starting y coordinate of every row [float array (rows,)]
+        _hSep:    the horizontal separation between aliens, from the scaled
+                  Formation [float > 0]
+        _vSep:    the vertical separation between aliens [float > 0]
+        _alienWidth:  the width of an alien [float > 0]
+        _alienHeight: the height of an alien [float > 0]
+        _hWalk:   the sideways step of a formation, ALIEN_H_WALK scaled [float]
+        _vWalk:   the downward step of a formation, ALIEN_V_WALK scaled [float]
+        _scores:  the score for killing each alien [int array (rows,cols)]
+        _shipX:   the x coordinate of each ship [float array (N,)]
+        _alive:   whether each alien is alive [bool array (N,rows,cols)]
+        _offsetX: how far each formation has marched right [float array (N,)]
+        _offsetY: how far each formation has marched up [float array (N,)]
+        _heading: the direction of the last sideways step of each formation,
+                  1 for right and -1 for left [int array (N,)]
+        _time:    the time since the last alien step of each game [float array (N,)]
+        _steps:   the alien steps since the last alien bolt of each game
+                  [int array (N,)]
+        _totalsteps: the total alien steps of each game [int array (N,)]
+        _aliensGone: the number of aliens killed in each game [int array (N,)]
+        _score:   the score of each game [int array (N,)]
+        _lives:   the number of lives left in each game [int array (N,)]
+        _boltX:   the x coordinate of each bolt slot [float array (N,capacity)]
+        _boltY:   the y coordinate of each bolt slot [float array (N,capacity)]
+        _boltV:   the velocity of each bolt slot [float array (N,capacity)]
+        _boltOn:  whether each bolt slot holds a live bolt [bool array (N,capacity)]
+        _boltPlayer: whether each bolt slot holds a player bolt
+                  [bool array (N,capacity)]
+        _games:   the index of every game, for fancy indexing [int array (N,)]
+    """
+
+    # GETTERS AND SETTERS
+
+    def getCount(self):
+        """
+        Returns the number of games
+        """
+        return self._count
+
+
+    def getShipXs(self):
+        """
+        Returns the x coordinates of the ships [float array (N,)]
+        """
+        return self._shipX
+
+
+    def getAlive(self):
+        """
+        Returns the alive masks of the formations [bool array (N,rows,cols)]
+        """
+        return self._alive
+
+
+    def getDifficulty(self):
+        """
+        Returns the difficulty settings of every game
+        """
+        return self._difficulty
+
+
+    def getOffsets(self):
+        """
+        Returns the offsets of the formations [float array (N,2)]
+        """
+        return np.stack((self._offsetX,self._offsetY),axis=1)
+
+
+    def getBolts(self):
+        """
+        Returns the tuple (xs, ys, velocities, live) of the bolt slots of every
+        game, each an array (N,capacity)
+
+        The arrays are owned by the simulation and must not be modified.
+        """
+        return (self._boltX,self._boltY,self._boltV,self._boltOn)
+
+
+    def getScores(self):
+        """
+        Returns the score of the current wave of each game [int array (N,)]
+        """
+        return self._score
+
+
+    def getLives(self):
+        """
+        Returns the lives left in each game [int array (N,)]
+        """
+        return self._lives
+
+
+    # INITIALIZER
+
+    def __init__(self, count, level=1, seed=None, capacity=32, difficulty=None):
+        """
+        Initializer: creates count games, each at the start of a new wave
+
+        Parameter count: the number of games
+        Precondition: count is an int > 0
+
+        Parameter level: the level of every game (the aliens are faster on later levels)
+        Precondition: level is an int > 0
+
+        Parameter seed: the seed of the random source (an unpredictable one if None)
+        Precondition: seed is an int >= 0 or None
+
+        Parameter capacity: the number of bolt slots in each game
+        Precondition: capacity is an int > 0
+
+        Parameter difficulty: the settings of every game (the ones in consts.py if None)
+        Precondition: difficulty is a Difficulty or None
+        """
+        difficulty=Difficulty() if difficulty is None else difficulty
+        rows=difficulty.getRows()
+        cols=difficulty.getCols()
+        self._count=count
+        self._rows=rows
+        self._cols=cols
+        self._level=level
+        self._difficulty=difficulty
+        self._rng=np.random.default_rng(seed)
+
+        template=Formation(rows,cols,difficulty.getScale())
+        self._colX=np.array([template.getColX(col) for col in range(cols)])
+        self._rowY=np.array([template.getRowY(row) for row in range(rows)])
+        self._scores=template.getScores().astype(np.int64)
+        self._hSep=template.getHSep()
+        self._vSep=template.getVSep()
+        self._alienWidth=template.getAlienWidth()
+        self._alienHeight=template.getAlienHeight()
+        self._hWalk=ALIEN_H_WALK*template.getScale()
+        self._vWalk=ALIEN_V_WALK*template.getScale()
+
+        self._shipX=np.empty(count)
+        self._alive=np.empty((count,rows,cols),dtype=bool)
+        self._offsetX=np.empty(count)
+        self._offsetY=np.empty(count)
+        self._heading=np.empty(count,dtype=np.int64)
+        self._time=np.empty(count)
+        self._steps=np.empty(count,dtype=np.int64)
+        self._totalsteps=np.empty(count,dtype=np.int64)
+        self._aliensGone=np.empty(count,dtype=np.int64)
+        self._score=np.empty(count,dtype=np.int64)
+        self._lives=np.empty(count,dtype=np.int64)
+        self._boltX=np.zeros((count,capacity))
+        self._boltY=np.zeros((count,capacity))
+        self._boltV=np.zeros((count,capacity))
+        self._boltOn=np.zeros((count,capacity),dtype=bool)
+        self._boltPlayer=np.zeros((count,capacity),dtype=bool)
+        self._games=np.arange(count)
+        self.resetGames(np.ones(count,dtype=bool))
+
+
+    # PUBLIC METHODS
+
+    def resetGames(self, mask):
+        """
+        Starts a new wave in every game where mask is True
+
+        Parameter mask: the games to reset
+        Precondition: mask is a bool array (N,)
+        """
+        self._shipX[mask]=SHIP_CENTER
+        self._alive[mask]=True
+        self._offsetX[mask]=0
+        self._offsetY[mask]=0
+        self._heading[mask]=1
+        self._time[mask]=0
+        self._steps[mask]=0
+        self._totalsteps[mask]=0
+        self._aliensGone[mask]=0
+        self._score[mask]=0
+        self._lives[mask]=SHIP_LIVES
+        self._boltOn[mask]=False
+
+
+    def step(self, actions):
+        """
+        Returns: the tuple (rewards, kills, deaths, done) after advancing every
+        game by one tick, each an array (N,)
+
+        For each game, rewards is the score gained, kills the number of aliens
+        killed (0 or 1) and deaths the number of ships lost (0 or 1).  The value
+        done is True for the games whose wave ended in this tick.  Those games
+        have already been reset to a new wave.
+
+        Parameter actions: the keys held down in each game
+        Precondition: actions is an int array (N,) of bitwise ors of KEY constants
+        """
+        actions=np.asarray(actions)
+        startScore=self._score.copy()
+
+        self._moveShips(actions)
+        self._moveAliens()
+        self._fireBolts((actions & KEY_SPACEBAR)!=0)
+        self._moveBolts()
+        kills=self._checkAlienHits()
+
+        won=~self._alive.any(axis=(1,2))
+        hit=~won & self._checkShipHits()
+        self._lives-=hit
+        respawn=hit & (self._lives>0)
+        self._boltOn[respawn]=False
+        self._shipX[respawn]=SHIP_CENTER
+        crossed=~won & ~hit & self._crossedDefenseLine()
+        done=won | (hit & ~respawn) | crossed
+
+        rewards=self._score-startScore
+        if done.any():
+            self.resetGames(done)
+        return (rewards,kills,hit.astype(np.int64),done)
+
+
+    def observe(self, maxBolts=16):
+        """
+        Returns: the observations of every game, as a float32 array (N, size)
+
+        Each row is laid out like an observation of InvadersEnv (see env.py):
+        ship x, formation offset, alive mask, then the x, y and direction of up
+        to maxBolts bolts, padded with zeros.
+
+        Parameter maxBolts: the number of bolts in an observation
+        Precondition: maxBolts is an int > 0
+        """
+        n=self._count
+        cells=self._rows*self._cols
+        obs=np.zeros((n,3+cells+3*maxBolts),dtype=np.float32)
+        obs[:,0]=self._shipX
+        obs[:,1]=self._offsetX
+        obs[:,2]=self._offsetY
+        obs[:,3:3+cells]=self._alive.reshape(n,cells)
+
+        # pack the live bolts of each game to the front, as a BoltPool does
+        order=np.argsort(~self._boltOn,axis=1,kind='stable')[:,:maxBolts]
+        taken=np.take_along_axis(self._boltOn,order,axis=1)
+        start=3+cells
+        width=order.shape[1]
+        obs[:,start:start+width]=np.where(taken,np.take_along_axis(self._boltX,order,axis=1),0)
+        start+=maxBolts
+        obs[:,start:start+width]=np.where(taken,np.take_along_axis(self._boltY,order,axis=1),0)
+        start+=maxBolts
+        obs[:,start:start+width]=np.where(taken,np.sign(np.take_along_axis(self._boltV,order,axis=1)),0)
+        return obs
+
+
+    # HELPER METHODS
+
+    def _moveShips(self, actions):
+        """
+        Moves every ship by SHIP_MOVEMENT in the direction of the keys held
+
+        The ship is clamped after each key, as in ShipState.moveXPos.
+
+        Parameter actions: the keys held down in each game
+        Precondition: actions is an int array (N,) of bitwise ors of KEY constants
+        """
+        low=0.5*SHIP_WIDTH
+        high=GAME_WIDTH-0.5*SHIP_WIDTH
+        x=self._shipX
+        x-=SHIP_MOVEMENT*((actions & KEY_LEFT)!=0)
+        np.clip(x,low,high,out=x)
+        x+=SHIP_MOVEMENT*((actions & KEY_RIGHT)!=0)
+        np.clip(x,low,high,out=x)
+
+
+    def _moveAliens(self):
+        """
+        Steps every formation whose march timer ran out, and advances the
+        timers of the others by one tick
+
+        The plan of a MarchController only depends on the heading and the
+        bounds of the formation, so it is worked out here for the games
+        that step.
+        """
+        settings=self._difficulty
+        threshold=(settings.getSpeed()*settings.getLevelSpeed()**(self._level-1)*
+                   np.power(settings.getAlienSpeed(),self._aliensGone))
+        stepping=self._time>threshold
+        self._time+=TICK_SECONDS
+        if not stepping.any():
+            return
+
+        colAlive=self._alive.any(axis=1)
+        leftCol=np.argmax(colAlive,axis=1)
+        rightCol=self._cols-1-np.argmax(colAlive[:,::-1],axis=1)
+        empty=~colAlive.any(axis=1)
+        # an empty formation is at x 0, as in Formation.findSmallestX
+        leftX=np.where(empty,0,self._colX[leftCol]+self._offsetX)
+        rightX=np.where(empty,0,self._colX[rightCol]+self._offsetX)
+        left=leftX<=self._hSep
+        right=rightX+self._alienWidth>=GAME_WIDTH
+
+        heading=self._heading
+        down=stepping & left & (heading<0)
+        direction=np.where(left | ((heading>0) & ~right),1,-1)
+        self._offsetY-=self._vWalk*down
+        self._offsetX+=np.where(stepping,direction*self._hWalk,0)
+        self._heading=np.where(stepping,direction,heading)
+        self._steps+=stepping+down
+        self._totalsteps+=stepping
+        self._time[stepping]=0
+
+
+    def _fireBolts(self, fire):
+        """
+        Fires a player bolt in every game where fire is held and there is no
+        player bolt, then fires alien bolts at random as in WaveSim
+
+        Parameter fire: whether the fire key is held in each game
+        Precondition: fire is a bool array (N,)
+        """
+        player=self._boltOn & self._boltPlayer
+        shoot=fire & ~player.any(axis=1)
+        self._addBolts(shoot,self._shipX,SHIP_BOTTOM+SHIP_HEIGHT,True)
+
+        # every game draws its number of steps, as WaveSim does every tick
+        numAlienSteps=self._rng.integers(1,self._difficulty.getBoltRate()+1,
+                                         size=self._count)
+        colAlive=self._alive.any(axis=1)
+        liveCols=colAlive.sum(axis=1)
+        shoot=(self._steps>numAlienSteps) & (liveCols>0)
+        if not shoot.any():
+            return
+
+        self._steps[shoot]=0
+        # the pick-th live column (in order) of each game
+        pick=np.floor(self._rng.random(self._count)*liveCols)
+        col=np.argmax(np.cumsum(colAlive,axis=1)>pick[:,None],axis=1)
+        column=self._alive[self._games,:,col]
+        row=self._rows-1-np.argmax(column[:,::-1],axis=1)
+        self._addBolts(shoot,self._colX[col]+self._offsetX,
+                       self._rowY[row]+self._offsetY,False)
+
+
+    def _addBolts(self, mask, x, y, isPlayerBolt):
+        """
+        Adds a bolt to the first free slot of every game where mask is True
+
+        A bolt is dropped if its game has no free slot.
+
+        Parameter mask: the games to add a bolt to
+        Precondition: mask is a bool array (N,)
+
+        Parameter x: the x coordinate of the bolt in each game
+        Precondition: x is a float array (N,)
+
+        Parameter y: the y coordinate of the bolts
+        Precondition: y is a number, or a float array (N,)
+
+        Parameter isPlayerBolt: True if the bolts came from the ships
+        Precondition: isPlayerBolt is a bool
+        """
+        slot=np.argmin(self._boltOn,axis=1)
+        mask=mask & ~self._boltOn[self._games,slot]
+        games=self._games[mask]
+        slot=slot[mask]
+        self._boltX[games,slot]=x[mask]
+        self._boltY[games,slot]=y[mask] if np.ndim(y) else y
+        self._boltV[games,slot]=BOLT_SPEED if isPlayerBolt else -BOLT_SPEED
+        self._boltPlayer[games,slot]=isPlayerBolt
+        self._boltOn[games,slot]=True
+
+
+    def _moveBolts(self):
+        """
+        Moves every live bolt by its velocity, and removes the bolts that
+        have left the window
+        """
+        self._boltY+=self._boltV
+        y=self._boltY
+        self._boltOn&=(y<GAME_HEIGHT) & (y>0)
+
+
+    def _checkAlienHits(self):
+        """
+        Returns: the number of aliens killed in each game [int array (N,)]
+
+        A game has at most one player bolt.  It is looked up in the lattice cells
+        it can reach, in row-major order as in Formation.findHit.  A bolt reaches
+        the same number of cells in every game, so the loop over them is short.
+        """
+        player=self._boltOn & self._boltPlayer
+        has=player.any(axis=1)
+        kills=np.zeros(self._count,dtype=np.int64)
+        if not has.any():
+            return kills
+
+        games=self._games[has]
+        slot=np.argmax(player[has],axis=1)
+        reachX=self._alienWidth/2+BOLT_WIDTH/2
+        reachY=self._alienHeight/2+BOLT_HEIGHT/2
+        localX=self._boltX[games,slot]-self._colX[0]-self._offsetX[games]
+        localY=self._rowY[0]+self._offsetY[games]-self._boltY[games,slot]
+        firstCol=np.ceil((localX-reachX)/self._hSep).astype(np.int64)
+        firstRow=np.ceil((localY-reachY)/self._vSep).astype(np.int64)
+
+        hitRow=np.full(len(games),-1)
+        hitCol=np.full(len(games),-1)
+        for dr in range(int(2*reachY//self._vSep)+1):
+            row=firstRow+dr
+            rowOk=(row>=0) & (row<self._rows) & (np.abs(localY-row*self._vSep)<reachY)
+            for dc in range(int(2*reachX//self._hSep)+1):
+                col=firstCol+dc
+                ok=(rowOk & (col>=0) & (col<self._cols) &
+                    (np.abs(localX-col*self._hSep)<reachX) & (hitRow<0))
+                ok[ok]=self._alive[games[ok],row[ok],col[ok]]
+                hitRow[ok]=row[ok]
+                hitCol[ok]=col[ok]
+
+        hit=hitRow>=0
+        games=games[hit]
+        row=hitRow[hit]
+        col=hitCol[hit]
+        self._alive[games,row,col]=False
+        self._score[games]+=self._scores[row,col]
+        self._aliensGone[games]+=1
+        self._boltOn[games,slot[hit]]=False
+        kills[games]=1
+        return kills
+
+
+    def _checkShipHits(self):
+        """
+        Returns: whether an alien bolt hit the ship in each game [bool array (N,)]
+        """
+        near=((np.abs(self._boltX-self._shipX[:,None])<SHIP_WIDTH/2+BOLT_WIDTH/2) &
+              (np.abs(self._boltY-SHIP_BOTTOM)<SHIP_HEIGHT/2+BOLT_HEIGHT/2))
+        return (near & self._boltOn & ~self._boltPlayer).any(axis=1)
+
+
+    def _crossedDefenseLine(self):
+        """
+        Returns: whether the aliens of each game reached the defense line
+        [bool array (N,)]
+        """
+        rowAlive=self._alive.any(axis=2)
+        bottomRow=self._rows-1-np.argmax(rowAlive[:,::-1],axis=1)
+        smallestY=self._rowY[bottomRow]+self._offsetY-(SHIP_BOTTOM+SHIP_HEIGHT)
+        return rowAlive.any(axis=1) & (smallestY<=DEFENSE_LINE)
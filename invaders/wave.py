@@ -8,6 +8,11 @@ new level, you are expected to make a new instance of the class.
 The subcontroller Wave manages the ship, the aliens and any laser bolts on screen.  
 These are model objects.  Their classes are defined in models.py.
 
+The rules of the wave are not in this module.  They are in the class WaveSim in
+simulation.py, which does not need Kivy, and the WaveSim is stepped by the GameSession
+in session.py.  Wave plays the sounds for the events its WaveSim raises, and draws the
+model objects to match the WaveSim state.
+
 Most of your work on this assignment will be in either this module or models.py.
 Whether a helper method belongs in this module or models.py is often a complicated
 issue.  If you do not know, ask on Piazza and we will answer.
@@ -19,7 +24,7 @@ Date: December 3, 2017
 from game2d import *
 from consts import *
 from models import *
-import random
+from simulation import *
 
 # PRIMARY RULE: Wave can only access attributes in models.py via getters/setters
 # Wave is NOT allowed to access anything in app.py (Subcontrollers are not permitted 
@@ -28,47 +33,30 @@ import random
 
 class Wave(object):
     """
-    This class controls a single level or wave of Alien Invaders.
+    This class shows a single level or wave of Alien Invaders.
     
     This subcontroller has a reference to the ship, aliens, and any laser bolts on screen. 
-    It animates the laser bolts, removing any aliens as necessary. It also marches the
-    aliens back and forth across the screen until they are all destroyed or they reach
-    the defense line (at which point the player loses). When the wave is complete, you 
-    should create a NEW instance of Wave (in Invaders) if you want to make a new wave of 
-    aliens.
+    The game rules are run by a WaveSim (see simulation.py), which Invaders advances 
+    through its GameSession.  This class keeps the on screen models in sync with that 
+    WaveSim, and plays the sounds for what happened in it.  When the session starts a 
+    new wave, you should create a NEW instance of Wave (in Invaders) for its WaveSim.
     
-    If you want to pause the game, tell this controller to draw, but do not update.  See 
-    subcontrollers.py from Lecture 24 for an example.  This class will be similar to
-    than one in how it interacts with the main class Invaders.
+    The game advances in fixed ticks, which need not line up with the animation frames.
+    To keep motion smooth, the ship and bolts are drawn part of the way between their 
+    positions at the last two ticks.  Call saveLastState before every tick so that the 
+    positions at the previous tick are known.
     
-    #UPDATE ME LATER
     INSTANCE ATTRIBUTES:
-        _ship:   the player ship to control [Ship]
-        _aliens: the 2d list of aliens in the wave [rectangular 2d list of Alien or None] 
-        _bolts:  the laser bolts currently on screen [list of Bolt, possibly empty]
+        _sim:    the headless simulation of this wave [WaveSim]
+        _ship:   the player ship to draw [Ship]
+        _lastShipX: the x coordinate of the ship at the previous tick
+                 [number, or None if there was no ship]
+        _aliens: the aliens to draw, with a quad at the starting position of every 
+                 slot in the formation of _sim, in row-major order [GBatch]
+        _shownVersion: the version of the formation shown in _aliens [int >= 0]
+        _bolts:  the bolts to draw, one for each slot of the bolt pool of _sim
+                 that has been used so far [list of Bolt, possibly empty]
         _dline:  the defensive line being protected [GPath]
-        _lives:  the number of lives left  [int >= 0]
-        _time:   The amount of time since the last Alien "step" [number >= 0]
-    
-    As you can see, all of these attributes are hidden.  You may find that you want to
-    access an attribute in class Invaders. It is okay if you do, but you MAY NOT ACCESS 
-    THE ATTRIBUTES DIRECTLY. You must use a getter and/or setter for any attribute that 
-    you need to access in Invaders.  Only add the getters and setters that you need for 
-    Invaders. You can keep everything else hidden.
-    
-    You may change any of the attributes above as you see fit. For example, may want to 
-    keep track of the score.  You also might want some label objects to display the score
-    and number of lives. If you make changes, please list the changes with the invariants.
-    
-    LIST MORE ATTRIBUTES (AND THEIR INVARIANTS) HERE IF NECESSARY
-        _totalsteps: The total amount of alien steps alien has marched 
-                [int >= 0]
-        _steps: The amount of alien steps since the last bolt fired from alien
-                [int >= 0]
-        _score: Total score obtained by player (increases as more aliens get hit)
-                [int >=0]
-        _aliensGone: Total amount of aliens killed, speed depends on this
-                [int >=0]
         _pew1: Sound played in game when player fires
                 [Sound object]
         _pew2: Sound played in game when alien fires
@@ -86,43 +74,39 @@ class Wave(object):
     
     # GETTERS AND SETTERS (ONLY ADD IF YOU NEED THEM)
     
-    def getScore(self):
-        """
-        Returns score player has accummulated in current Wave
-        """
-        return self._score
-
-    
     def getLives(self):
         """
         Returns how much lives player has left before game is lost
         """
-        return self._lives
-
+        return self._sim.getLives()
     
-    def setNewShip(self):
+    
+    def isShowing(self, sim):
         """
-        Creates a new ship and sets it to self._ship
+        Returns True if this Wave shows the given simulation
+        
+        Parameter sim: the simulation to check
+        Precondition: sim is a WaveSim or None
         """
-        self._ship=Ship(SHIP_CENTER,SHIP_BOTTOM,SHIP_WIDTH,SHIP_HEIGHT,'ship.png')
+        return self._sim is sim
 
     
     # INITIALIZER (standard form) TO CREATE SHIP AND ALIENS
 
-    def __init__(self):
+    def __init__(self, sim):
         """
-        Initializer: creates the Wave subcontroller
+        Initializer: creates the Wave subcontroller for a wave simulation
+        
+        Parameter sim: the simulation to show
+        Precondition: sim is a WaveSim
         """
-        self.setNewShip()
+        self._sim=sim
+        self._ship=Ship(SHIP_CENTER,SHIP_BOTTOM,SHIP_WIDTH,SHIP_HEIGHT,'ship.png')
+        self._lastShipX=None
         self._aliens=self._makeAlienWave()
+        self._shownVersion=self._sim.getFormation().getVersion()
         self._bolts=[]
         self._dline=DefenseLine()
-        self._lives=SHIP_LIVES
-        self._time=0
-        self._steps=0
-        self._totalsteps=0
-        self._score=0
-        self._aliensGone=0
         #sounds
         self._pew1=Sound('pew1.wav')
         self._pew2=Sound('pew2.wav')
@@ -133,197 +117,44 @@ class Wave(object):
         self._MUSIC_SEQUENCE=(Sound('A.wav'),
                     Sound('B_flat.wav'), Sound('B.wav'), Sound('C.wav'))
     
-    # UPDATE METHOD TO MOVE THE SHIP, ALIENS, AND LASER BOLTS
+    # UPDATE METHODS
 
-    def moveBolts(self, input, sound):
+    def saveLastState(self):
         """
-        Fires bolts from ship to user input
-        if space key is pressed, fires bolts from alien wave with
-        random frequency and from random alien. Plays sound
-        if sound is enabled
-        
-        Parameter input: the keyboard input
-        Precondition: input is string of valid key
-        
-        Parameter sound: whether user has enabled sound or not
-        Precondition: sound is a bool
-        """
-        #for player bolts
-        if input.is_key_down('spacebar') and self._numPlayerBolts()<1:
-            bolt=Bolt(self._ship.getXPos(), SHIP_BOTTOM+SHIP_HEIGHT, True)
-            self._bolts.append(bolt)
-            if sound:
-                self._pew1.play()
-        
-        #for alien bolts      
-        self._moveAlienBolts(sound)      
-        
-        #for both
-        for bolt in self._bolts:
-            bolt.moveYPos(bolt.getVelocity())
-            inBounds=bolt.getYPos()<GAME_HEIGHT and bolt.getYPos()>0
-            if not inBounds:
-                self._bolts.remove(bolt)
-
+        Remembers the positions needed to draw in between ticks
         
-    def moveShip(self, input):
+        Call this right before the simulation is advanced by a tick.
         """
-        Moves the ship according
-        to user input (left key moves ship left,
-        right key moves right)
-        
-        Parameter input: the keyboard input
-        Precondition: input is string of valid key
-        """
-        
-        if input.is_key_down('left'):
-            self._ship.moveXPos(-SHIP_MOVEMENT)
-        if input.is_key_down('right'):
-            self._ship.moveXPos(SHIP_MOVEMENT)
-        
-        
-    def moveAliens(self, level, dt, sound): 
-        """
-        Moves the aliens every dt seconds, horizontally by ALIEN_H_WALK
-        and vertically by ALIEN_V_WALK when alien wave reaches left side.
-        Plays sound if sound is enabled        
-        
-        Aliens increase their speed as level increases
-        
-        Parameter level: the level the player is on, passed as a
-        parameter through app class
-        Precondition: level is an int > 0
-        
-        Parameter dt: number of seconds that have
-        passed since the last animation frame
-        Precondition: dt is a float > 0
-        
-        Parameter sound: whether user has enabled sound or not
-        Precondition: sound is a bool
-        """
-        
-        TouchingLeftSide=self._findAlienSmallestX()<=ALIEN_H_SEP 
-        TouchingRightSide=self._findAlienBiggestX()+ALIEN_WIDTH>=GAME_WIDTH         
-        inBounds= not TouchingLeftSide and not TouchingRightSide 
-        goingRight= TouchingLeftSide or (self._isMovingRight() and inBounds)
-        goingLeft= TouchingRightSide or (self._isMovingLeft() and inBounds)
-        
-        levelM=INCR_SPEED_LEVEL**(level-1) #level multiplier
-        aliensM=INCR_SPEED_ALIEN**(self._aliensGone) #aliens multiplier
-        
-        if self._time>ALIEN_SPEED*levelM*aliensM:
-            if sound:
-                pos= self._totalsteps % len(self._MUSIC_SEQUENCE)
-                self._MUSIC_SEQUENCE[pos].play()
-            
-            if TouchingLeftSide and self._isMovingLeft():
-                self._moveAlienWaveDown()
-       
-            if goingRight:
-                self._moveAlienWaveRight()
-         
-            elif goingLeft:
-                self._moveAlienWaveLeft()
-            
-            self._totalsteps+=1
-
-        else:
-            self._time+=dt
-            
-            
-    #UPDATE (NOT HELPER) METHODS FOR COLLISION DETECTION
-
-    def checkAlienCollisions(self, sound):
-        """
-        Checks if there is a collision between any aliens
-        in _aliens and a bolt fired by player, deletes the
-        alien and bolt from their respective lists and changes
-        index values to None if collision is detected. Plays
-        sound if sound is enabled.
-        
-        Parameter sound: whether user has enabled sound or not
-        Precondition: sound is a bool
-        """
-        
-        for row in range(ALIEN_ROWS):
-            for col in range(ALIENS_IN_ROW):
-                if isinstance(self._aliens[row][col], Alien):
-                    for bolt in self._bolts:
-                        if bolt.isPlayerBolt() and self._aliens[row][col].collides(bolt):
-                            self._score+=self._aliens[row][col].getScore()
-                            self._aliens[row][col]=None
-                            self._bolts.remove(bolt)
-                            self._aliensGone+=1
-                            if sound:
-                                self._pop2.play()
-                            
-
+        ship=self._sim.getShip()
+        self._lastShipX=None if ship is None else ship.getXPos()
     
-    def isShipCollision(self, sound):
-        """
-        Returns True if ship collision with alien bolt is detected
-        
-        Checks if there is a collision between any bolts
-        in _bolts fired by alien and the ship, deletes the
-        bolt from the list (and the player) and changes index values to None
-        if collision is detected. PLays sound effect if sound is enabled
-        
-        Parameter sound: whether user has enabled sound or not
-        Precondition: sound is a bool
-        """
-        
-        for bolt in self._bolts:
-            if not bolt.isPlayerBolt() and self._ship.collides(bolt):
-                    if sound:
-                        self._blast1.play()
-                    self._ship=None
-                    self._lives-=1
-                    return True
-        return False
-
-    
-    def clearBolts(self):
-        """
-        Clears the list of _bolts and makes it an empty list
-        
-        Called in paused state when life is lost, so that player
-        can resume game without any previous bullets on screen
-        """
-        self._bolts=[]
-
     
-    def crossedDefenseLine(self, sound):
+    def playEvents(self, sound):
         """
-        Returns True if alien wave has reached the defense line,
-        False otherwise
-        
-        Finds the lowest y coordinate alien in wave and compares it to
-        the y coordinate of the defense line. Called in update method
-        of controller class to determine state of game, plays sound effect
-        if sound is enabled
+        Plays the sounds for the events the simulation raised since
+        the last call, and clears them
         
         Parameter sound: whether user has enabled sound or not
         Precondition: sound is a bool
         """
-        if sound and self._findAlienSmallestY()==self._dline.getYPos():
+        events=self._sim.getEvents()
+        self._sim.clearEvents()
+        if not sound or events==0:
+            return
+        
+        if events & EVENT_ALIEN_STEP:
+            pos=(self._sim.getTotalSteps()-1) % len(self._MUSIC_SEQUENCE)
+            self._MUSIC_SEQUENCE[pos].play()
+        if events & EVENT_PLAYER_FIRE:
+            self._pew1.play()
+        if events & EVENT_ALIEN_FIRE:
+            self._pew2.play()
+        if events & EVENT_ALIEN_HIT:
+            self._pop2.play()
+        if events & EVENT_SHIP_HIT:
+            self._blast1.play()
+        if events & EVENT_LINE_CROSSED:
             self._blast2.play()
-        
-        return self._findAlienSmallestY()<=self._dline.getYPos()
-
-    
-    def noMoreAliens(self):
-        """
-        Returns True if all the aliens have been successfully
-        fired at and the player has won the game, False otherwise
-        
-        Checks to see of _aliens is an empty list
-        """
-        for row in range(ALIEN_ROWS):
-            for col in range(ALIENS_IN_ROW):
-                if self._aliens[row][col] is not None:
-                    return False
-                
-        return True
     
         
     # DRAW METHOD TO DRAW THE SHIP, ALIENS, DEFENSIVE LINE AND BOLTS
@@ -332,23 +163,42 @@ class Wave(object):
         """
         Draws the alien wave in the provided view.
         
+        The aliens march in discrete steps, so they are drawn where they are.
+        They are drawn as a single batch, moved by the offset of the formation,
+        so the aliens are never moved one by one.  The batch only changes when 
+        the alive mask of the formation changes (a kill, or a restored snapshot).
+        
         Parameter view: the view to draw to
         Precondition: view is a GView
         """
-        for row in range(ALIEN_ROWS):
-            for col in range(ALIENS_IN_ROW):
-                if isinstance(self._aliens[row][col],Alien):
-                    self._aliens[row][col].draw(view)
+        formation=self._sim.getFormation()
+        if formation.getVersion()!=self._shownVersion:
+            self._aliens.set_visible(formation.getAlive().ravel())
+            self._shownVersion=formation.getVersion()
+        offset=formation.getOffset()
+        self._aliens.x=float(offset[0])
+        self._aliens.y=float(offset[1])
+        self._aliens.draw(view)
           
                 
-    def drawShip(self, view):
+    def drawShip(self, view, alpha=1.0):
         """
-        Draws the alien wave in the provided view.
+        Draws the ship in the provided view.
         
         Parameter view: the view to draw to
         Precondition: view is a GView
-        """
-        self._ship.draw(view)
+        
+        Parameter alpha: how far the frame is from the previous tick 
+        to the current one
+        Precondition: alpha is a number in 0..1
+        """
+        ship=self._sim.getShip()
+        if ship is not None:
+            x=ship.getXPos()
+            if self._lastShipX is not None:
+                x=self._lastShipX+(x-self._lastShipX)*alpha
+            self._ship.x=float(x)
+            self._ship.draw(view)
           
                 
     def drawLine(self, view):
@@ -361,327 +211,50 @@ class Wave(object):
         self._dline.draw(view)
 
         
-    def drawBolts(self, view):
+    def drawBolts(self, view, alpha=1.0):
         """
-        Draws the current list of bolts (_bolts)
-        in the provided view.
+        Draws the bolts currently on screen in the provided view.
+        
+        A Bolt model is made the first time a slot of the bolt pool is used,
+        and reused for every later bolt in that slot.  Bolts move at a constant
+        velocity, so a bolt is drawn (1-alpha) ticks behind where it is.
         
         Parameter view: the view to draw to
         Precondition: view is a GView
-        """
-        for bolt in self._bolts:
+        
+        Parameter alpha: how far the frame is from the previous tick 
+        to the current one
+        Precondition: alpha is a number in 0..1
+        """
+        pool=self._sim.getBolts()
+        xs=pool.getXs()
+        ys=pool.getYs()-pool.getVelocities()*(1.0-alpha)
+        for slot in range(pool.getSize()):
+            if slot==len(self._bolts):
+                self._bolts.append(Bolt(float(xs[slot]),float(ys[slot])))
+            bolt=self._bolts[slot]
+            bolt.x=float(xs[slot])
+            bolt.y=float(ys[slot])
             bolt.draw(view)
         
         
     #OTHER HELPER METHODS I ADDED
     
-    def _moveAlienWaveRight(self):
-        """
-        Helper method called in moveAliens to move entire wave
-        of aliens right by ALIEN_H_WALK
-        """
-        self._steps+=1
-        for row in range(ALIEN_ROWS):
-            for col in range(ALIENS_IN_ROW):
-                if isinstance(self._aliens[row][col], Alien):
-                    self._aliens[row][col].setLastXPos(self._aliens[row][col].x)
-                    self._aliens[row][col].moveXPos(ALIEN_H_WALK)
-                    self._time=0
-    
-                    
-    def _moveAlienWaveLeft(self):
-        """
-        Helper method called in moveAliens to move entire wave
-        of aliens left by ALIEN_H_WALK
-        """
-        self._steps+=1
-        for row in range(ALIEN_ROWS):
-            for col in range(ALIENS_IN_ROW):
-                if isinstance(self._aliens[row][col], Alien):
-                    self._aliens[row][col].setLastXPos(self._aliens[row][col].x)
-                    self._aliens[row][col].moveXPos(-ALIEN_H_WALK)
-                    self._time=0
-
-        
-    def _moveAlienBolts(self, sound):
-        """
-        Helper method to fire alien bolts from alien waves
-        with random frequency from random alien in wave
-        Plays sound if sound is enabled
-        
-        Parameter sound: whether user has enabled sound or not
-        Precondition: sound is a bool
-        """
-        
-        numAlienSteps=random.randint(1,BOLT_RATE)
-        if self._steps>numAlienSteps:
-            self._steps=0
-            colToFire=random.randint(0,ALIENS_IN_ROW-1)
-    
-            while self._isEmptyCol(colToFire):
-                colToFire=random.randint(0,ALIENS_IN_ROW-1)
-            
-            rowToFire=self._findAlienColSmallestRow(colToFire)
-            boltXPos=self._aliens[rowToFire][colToFire].getXPos()
-            boltYPos=self._aliens[rowToFire][colToFire].getYPos()
-            alienbolt=Bolt(boltXPos,boltYPos,False)
-            self._bolts.append(alienbolt)
-            if sound:
-                self._pew2.play()
-        
-        
-    def _isEmptyCol(self, x):
-        """
-        Returns True if _aliens has no more alien
-        objects in specified column x in _aliens
-        
-        Determines whether column x of _aliens filled
-        with None values
-        
-        Parameter x: _aliens column index to check
-        Precondition: x is a valid int between 0 and
-        ALIENS_IN_ROW - 1 
-        """
-        for row in range(ALIEN_ROWS):
-            if self._aliens[row][x] is not None:
-                return False
-            
-        return True
-        
-    
-    def _numPlayerBolts(self):
-        """
-        Returns: number of bolts fired by the player that
-        are currently on the screen
-        
-        Called by moveBolts as a helper to determine whether the
-        player can fire another bolt
-        """
-        count=0
-        for bolt in self._bolts:
-            if bolt.isPlayerBolt():
-                count+=1
-    
-        return count
-    
-    
-    def _findAlienBiggestX(self):
-        """
-        Returns: x coordinate of alien to the most right
-        
-        Called in moveAliens so that we can know when to start
-        moving the alien wave to the left after the alien to the
-        most right hits the window's right boundary
-        """
-        biggestXPos=0
-        count=0
-        
-        for col in range(ALIENS_IN_ROW,0,-1):
-            for row in range(ALIEN_ROWS):
-                if count==0:
-                    if isinstance(self._aliens[row][col-1], Alien):
-                        biggestXPos=self._aliens[row][col-1].getXPos()
-                        count+=1
-                            
-        return biggestXPos
-    
-        
-    def _findAlienSmallestX(self): 
-        """
-        Returns: x coordinate of alien to the most left
-        
-        Called in moveAliens so that we can know when to start
-        moving the alien wave to the right after the alien to the
-        most left hits the window's left boundary
-        """
-        smallestXPos=0
-        count=0
-        
-        for col in range(ALIENS_IN_ROW):
-            for row in range(ALIEN_ROWS):
-                if count==0:
-                    if isinstance(self._aliens[row][col], Alien):
-                        smallestXPos=self._aliens[row][col].getXPos()
-                        count+=1
-                        
-        return smallestXPos
-    
-    
-    def _findAlienSmallestY(self): 
-        """
-        Returns: y coordinate of alien on the most bottom
-        
-        Useful for determining when the aliens have crossed the
-        defense line.
-        """
-        smallestYPos=0
-        count=0
-        for row in range(ALIEN_ROWS,0,-1):
-            if len(self._aliens[row-1])>0:
-                for col in range(ALIENS_IN_ROW):
-                    if count==0:
-                        if isinstance(self._aliens[row-1][col], Alien):
-                            smallestYPos=self._aliens[row-1][col].getYPos()
-                            count+=1
-        
-        return smallestYPos - (SHIP_BOTTOM+SHIP_HEIGHT)
-    
-    
-    def _findAlienColSmallestRow(self,col): 
-        """
-        Returns: row index value of alien on the most bottom
-        in column col
-        
-        Useful for determining where the bullet fired from
-        specificed alien col will start at
-        
-        Parameter col: the column of _aliens to search
-        Precondition: col is a valid int between 0 and
-        ALIENS_IN_ROW-1 (it is guaranteed by another helper
-        within wave class that col will have at least one alien)
-        """
-        alien=None
-        max_row=0
-        
-        for row in range(ALIEN_ROWS):
-            if self._aliens[row][col] is not None:
-                alien=self._aliens[row][col]
-                max_row=row
-        
-        return max_row
-        
-    
-    def _isMovingLeft(self): 
-        """
-        Returns True if Alien is currently moving
-        left, False otherwise
-        
-        Evaluates motion of Alien
-        
-        Parameter prevXPos: the alien's previous
-        x position
-        Precondition: prexXPos is an int that fits within
-        the bounds of the game window
-        """
-        #find alien that is not None
-        count=0
-        alien=None
-        for row in range(ALIEN_ROWS):
-            for col in range(ALIENS_IN_ROW):
-                if isinstance(self._aliens[row][col], Alien):
-                    if count==0:
-                        alien=self._aliens[row][col]
-                        break
-        
-        if alien.getLastXPos()>alien.getXPos(): 
-            return True
-        
-        else:
-            return False
-    
-    
-    def _isMovingRight(self): 
-        """
-        Returns True if Alien is currently moving
-        left, False otherwise
-        
-        Evaluates motion of Alien
-        
-        Parameter prevXPos: the alien's previous
-        x position
-        Precondition: prexXPos is an int that fits within
-        the bounds of the game window
-        """
-        #find alien that is not None
-        count=0
-        alien=None
-        for row in range(ALIEN_ROWS):
-            for col in range(ALIENS_IN_ROW):
-                if isinstance(self._aliens[row][col], Alien):
-                    if count==0:
-                        alien=self._aliens[row][col]
-                        break
-        
-        if alien.getLastXPos()<alien.getXPos(): 
-            return True
-        
-        else:
-            return False
-    
-        
-    def _moveAlienWaveDown(self):
-        """
-        Moves the whole alien wave down by
-        ALIEN_V_WALK units, modifies each alien's
-        y attribute
-        
-        Called as a helper by moveAliens update function
-        each time the alien reaches left bound, before
-        they start to move right again
-        """
-        for row in range(ALIEN_ROWS):
-            for col in range(ALIENS_IN_ROW):
-                if isinstance(self._aliens[row][col], Alien):
-                    self._aliens[row][col].moveYPos(-ALIEN_V_WALK)
-        
-        self._steps+=1
-        self._time=0
-    
-    
-    def _noMoreLives(self):
-        """
-        Returns True if all the player's lives have been used,
-        False otherwise
-        
-        Checks to see of _lives is 0
-        """
-        return self._lives==0
-    
-    
-    def _determineScore(self, image):
-        """
-        Returns corresponding score of alien
-        
-        Each value of ALIEN_IMAGES corresponds with a score
-        in ALIEN_SCORES by index
-        
-        Parameter image: image of alien we are trying
-        to determine score of
-        Preconditon: image is a valid string image name
-        found in folder contents
-        """
-        x=ALIEN_IMAGES.index(image)
-        return ALIEN_SCORES[x]
-    
-    
     def _makeAlienWave(self):
         """
-        Returns: wave of alien objects
-        
-        Creates 2D list of aliens according to specified
-        constants in consts.py and returns the new list
-        """
-        aliens=[]
-        import math
-        num_images=len(ALIEN_IMAGES)
-        y=GAME_HEIGHT-ALIEN_CEILING
-        poscounter=0 #accumulator
-        mod2counter=0 #accumulator
-        
-        for row in range(ALIEN_ROWS):
-            alienrow=[]
-            x=ALIEN_H_SEP
-          
-            for col in range (ALIENS_IN_ROW):
-                image=ALIEN_IMAGES[mod2counter%num_images]
-                alienrow.append(Alien(x,y,ALIEN_WIDTH,ALIEN_HEIGHT,
-                                      image, self._determineScore(image)))
-                x+=ALIEN_H_SEP
-            poscounter+=1
-          
-            if poscounter%2==0: 
-                mod2counter+=1
-            aliens.append(alienrow)   
-            y-=ALIEN_V_SEP
-        
+        Returns: a batch with a quad for each slot in the formation of the 
+        simulation, in row-major order, at its starting position
+        
+        The quads show the regions of ALIEN_IMAGES in the texture atlas, which
+        Invaders loads when it starts, so the whole formation is a single mesh.
+        Only the live aliens are shown.
+        """
+        formation=self._sim.getFormation()
+        offset=formation.getOffset()
+        aliens=GBatch(x=0,y=0,width=formation.getAlienWidth(),
+                      height=formation.getAlienHeight(),regions=ALIEN_IMAGES)
+        aliens.set_quads((formation.getXs()-offset[0]).ravel(),
+                         (formation.getYs()-offset[1]).ravel(),
+                         formation.getImages().ravel())
+        aliens.set_visible(formation.getAlive().ravel())
         return aliens